@@ -11,11 +11,42 @@ from src.video_loader import VideoLoader
 from src.motion_loader import MotionLoader
 from src.motion_matcher import MotionMatcher
 from src.interpolator import Interpolator
-from src.visualizer import Visualizer
+from src.visualizer import Visualizer, TextSprite
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("Calibration")
 
+# Forward jumps up to this many frames are stepped with grab() instead of re-seeking
+MAX_GRAB_STEP = 30
+
+def read_frame(cap, target_idx, current_idx):
+    """
+    Decodes the frame at target_idx, reusing the decoder position where possible.
+    
+    Seeking with CAP_PROP_POS_FRAMES resets the decoder to the nearest keyframe and
+    redecodes up to the target, so small forward steps grab() past the intermediate
+    frames without decoding them and only retrieve() the final one.
+    
+    Args:
+        cap: cv2.VideoCapture positioned just after current_idx.
+        target_idx (int): Frame index to decode.
+        current_idx (int): Index of the last decoded frame, or -1 if none.
+        
+    Returns:
+        tuple: (ret, frame)
+    """
+    delta = target_idx - current_idx
+    if current_idx < 0 or delta <= 0 or delta > MAX_GRAB_STEP:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, target_idx)
+        return cap.read()
+    
+    for _ in range(delta - 1):
+        if not cap.grab():
+            return False, None
+    if not cap.grab():
+        return False, None
+    return cap.retrieve()
+
 def calibrate_projection():
     """
     Interactive calibration tool for manual projection adjustment.
@@ -39,8 +70,8 @@ def calibrate_projection():
     # Load Data
     logger.info("Loading Video...")
     v_loader = VideoLoader(video_path)
-    timestamps_ms = v_loader.extract_frame_timestamps()
-    v_timestamps_sec = [t / 1000.0 for t in timestamps_ms]
+    timestamps_ms = v_loader.extract_frame_timestamps_fast()
+    v_timestamps_sec = np.asarray(timestamps_ms, dtype=np.float64) * 1e-3
     
     logger.info("Loading Motion...")
     m_loader = MotionLoader(json_dir)
@@ -65,7 +96,8 @@ def calibrate_projection():
     step_fov = 1.0   # 1 degree per keypress
     
     # Frame selection (middle frame for calibration)
-    frame_idx = len(matches) // 2
+    n_frames = len(matches['aligned_ts'])
+    frame_idx = n_frames // 2
     
     logger.info(f"\nCalibration Controls:")
     logger.info("  W/S: Z offset ±{:.3f}m".format(step_pos))
@@ -82,68 +114,84 @@ def calibrate_projection():
     paused = True
     GAP_THRESHOLD = 0.2
     
+    # Bracketing motion samples for every frame, looked up once
+    motion = m_loader.as_arrays()
+    motion_ts = motion['timestamps']
+    aligned = matches['aligned_ts']
+    prev_idx, next_idx = m_loader.get_surrounding_indices(aligned)
+    valid_mask = (prev_idx >= 0) & (next_idx >= 0)
+    gaps = np.where(valid_mask, motion_ts[next_idx] - motion_ts[prev_idx], np.inf)
+    valid_mask &= gaps <= GAP_THRESHOLD
+    
+    # Static help line is rasterized once; only the value lines are drawn per redraw
+    help_text = TextSprite("[SPACE] Save | [R] Reset | [ESC] Exit", (10, 30 + 4 * 25), color=(255, 255, 0))
+    
+    def sample(part, idx):
+        positions, rotations = motion[part]
+        return {'position': positions[idx], 'rotation': rotations[idx]}
+    
+    # Last decoded frame; only re-decoded when frame_idx changes
+    raw_frame = None
+    current_idx = -1
+    
+    # Display buffer, reused across redraws
+    frame = None
+    
+    # Everything the rendered image depends on; redraw only when it changes
+    def display_state():
+        return (frame_idx, tuple(visualizer.offset_pos), tuple(visualizer.offset_rot_euler), visualizer.fov_deg)
+    shown_state = None
+    
     while True:
-        # Get frame
-        v_loader.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-        ret, frame = v_loader.cap.read()
-        if not ret:
-            break
-        
-        # Get match data
-        match = matches[frame_idx]
-        prev_data, next_data = m_loader.get_surrounding_poses(match['aligned_ts'])
-        
-        # Interpolate and draw if valid
-        if prev_data and next_data:
-            t1, d1 = prev_data
-            t2, d2 = next_data
+        dirty = display_state() != shown_state
+        if dirty:
+            # Get frame
+            if frame_idx != current_idx:
+                ret, raw_frame = read_frame(v_loader.cap, frame_idx, current_idx)
+                if not ret:
+                    break
+                current_idx = frame_idx
+            
+            # Draw overlays on a copy so the cached frame stays clean
+            if frame is None or frame.shape != raw_frame.shape:
+                frame = np.empty_like(raw_frame)
+            np.copyto(frame, raw_frame)
+            
+            # Interpolate and draw if valid
+            if valid_mask[frame_idx]:
+                i1 = prev_idx[frame_idx]
+                i2 = next_idx[frame_idx]
+                w = matches['weight'][frame_idx]
             
-            if (t2 - t1) <= GAP_THRESHOLD:
-                w = match['weight']
-                
                 # Interpolate Hand
-                hand_pose = interpolator.interpolate_pose(d1['pose'], d2['pose'], w)
-                
+                hand_pose = interpolator.interpolate_pose(sample('pose', i1), sample('pose', i2), w)
+            
                 # Camera interpolation
-                le_pose = None
-                if d1['left_eye'] and d2['left_eye']:
-                    le_pose = interpolator.interpolate_pose(d1['left_eye'], d2['left_eye'], w)
-                    
-                re_pose = None
-                if d1['right_eye'] and d2['right_eye']:
-                    re_pose = interpolator.interpolate_pose(d1['right_eye'], d2['right_eye'], w)
-                    
-                cam_pose = None
-                if le_pose and re_pose:
-                    pos = (np.array(le_pose['position']) + np.array(re_pose['position'])) / 2.0
-                    cam_pose = {'position': pos.tolist(), 'rotation': le_pose['rotation']}
-                elif le_pose:
-                    cam_pose = le_pose
-                elif re_pose:
-                    cam_pose = re_pose
-                    
+                le_pose = interpolator.interpolate_pose(sample('left_eye', i1), sample('left_eye', i2), w)
+                re_pose = interpolator.interpolate_pose(sample('right_eye', i1), sample('right_eye', i2), w)
+                pos = [(a + b) * 0.5 for a, b in zip(le_pose['position'], re_pose['position'])]
+                cam_pose = {'position': pos, 'rotation': le_pose['rotation']}
+                
                 # Draw with calibration applied
-                if cam_pose:
-                    visualizer.draw_gizmo(frame, hand_pose, cam_pose, apply_calibration=True)
+                visualizer.draw_gizmo(frame, hand_pose, cam_pose, apply_calibration=True)
         
-        # Display calibration info
-        info_y = 30
-        cv2.putText(frame, f"Frame: {frame_idx}/{len(matches)}", (10, info_y), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-        info_y += 25
-        cv2.putText(frame, f"Offset XYZ: [{visualizer.offset_pos[0]:.3f}, {visualizer.offset_pos[1]:.3f}, {visualizer.offset_pos[2]:.3f}]", 
-                    (10, info_y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-        info_y += 25
-        cv2.putText(frame, f"Offset RPY: [{visualizer.offset_rot_euler[0]:.1f}, {visualizer.offset_rot_euler[1]:.1f}, {visualizer.offset_rot_euler[2]:.1f}]", 
-                    (10, info_y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-        info_y += 25
-        cv2.putText(frame, f"FOV: {visualizer.fov_deg:.1f}", (10, info_y), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-        info_y += 25
-        cv2.putText(frame, "[SPACE] Save | [R] Reset | [ESC] Exit", (10, info_y), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+            # Display calibration info
+            info_y = 30
+            cv2.putText(frame, f"Frame: {frame_idx}/{n_frames}", (10, info_y), 
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+            info_y += 25
+            cv2.putText(frame, f"Offset XYZ: [{visualizer.offset_pos[0]:.3f}, {visualizer.offset_pos[1]:.3f}, {visualizer.offset_pos[2]:.3f}]", 
+                        (10, info_y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+            info_y += 25
+            cv2.putText(frame, f"Offset RPY: [{visualizer.offset_rot_euler[0]:.1f}, {visualizer.offset_rot_euler[1]:.1f}, {visualizer.offset_rot_euler[2]:.1f}]", 
+                        (10, info_y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+            info_y += 25
+            cv2.putText(frame, f"FOV: {visualizer.fov_deg:.1f}", (10, info_y), 
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+            help_text.draw(frame)
         
-        cv2.imshow("Calibration", frame)
+            cv2.imshow("Calibration", frame)
+            shown_state = display_state()
         
         # Handle keyboard input
         key = cv2.waitKey(30) & 0xFF
@@ -185,7 +233,7 @@ def calibrate_projection():
             visualizer.set_calibration(offset_pos=[0, 0, 0], offset_rot_euler=[0, 0, 0], fov_deg=100)
             logger.info("Reset to defaults")
         elif key == ord('.'):
-            frame_idx = min(frame_idx + 10, len(matches) - 1)
+            frame_idx = min(frame_idx + 10, n_frames - 1)
         elif key == ord(','):
             frame_idx = max(frame_idx - 10, 0)
     
@@ -3,6 +3,8 @@ import os
 import cv2
 import numpy as np
 import logging
+import queue
+import threading
 from tqdm import tqdm
 
 # Add project root to path
@@ -13,16 +15,111 @@ from src.motion_loader import MotionLoader
 from src.motion_matcher import MotionMatcher
 from src.interpolator import Interpolator
 from src.visualizer import Visualizer
+from src.video_writer import open_video_writer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("Comparison")
 
-def compare_raw_synced():
+# Frames buffered between the decode, annotate and encode stages
+QUEUE_SIZE = 8
+
+def render_frames(cap, n_frames, frame_shape, out, annotate):
+    """
+    Decodes, annotates and encodes frames in three overlapping stages.
+    
+    Decoding and encoding run in their own threads (OpenCV and PyAV release the GIL
+    while decoding/encoding); frame buffers are recycled through a pool instead of
+    being allocated per frame. The first error from any stage is re-raised once all
+    threads have stopped, and the writer is always released.
+    
+    Args:
+        cap: Opened cv2.VideoCapture-like object (grab/retrieve).
+        n_frames (int): Number of frames to process.
+        frame_shape (tuple): (height, width, 3) of the decoded frames.
+        out: Writer exposing write(frame) and release().
+        annotate (callable): annotate(frame_idx, frame), draws on the frame in place.
+    """
+    free_q = queue.Queue()
+    for _ in range(2 * QUEUE_SIZE + 2):
+        free_q.put(np.empty(frame_shape, dtype=np.uint8))
+    raw_q = queue.Queue(maxsize=QUEUE_SIZE)
+    enc_q = queue.Queue(maxsize=QUEUE_SIZE)
+    stop = threading.Event()
+    errors = []
+    
+    def decode():
+        try:
+            for frame_idx in range(n_frames):
+                if stop.is_set():
+                    break
+                buf = free_q.get()
+                if not cap.grab():
+                    break
+                ret, frame = cap.retrieve(buf)
+                if not ret:
+                    break
+                raw_q.put((frame_idx, frame))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            raw_q.put(None)
+    
+    def encode():
+        while True:
+            frame = enc_q.get()
+            if frame is None:
+                break
+            # Keep draining after an error so the annotate loop never blocks
+            if not errors:
+                try:
+                    out.write(frame)
+                except Exception as e:
+                    errors.append(e)
+            free_q.put(frame)
+    
+    decoder = threading.Thread(target=decode, name="decode", daemon=True)
+    encoder = threading.Thread(target=encode, name="encode", daemon=True)
+    pbar = tqdm(total=n_frames)
+    decoder.start()
+    encoder.start()
+    
+    decoder_done = False
+    try:
+        for frame_idx, frame in iter(raw_q.get, None):
+            if errors:
+                break
+            annotate(frame_idx, frame)
+            enc_q.put(frame)
+            pbar.update(1)
+        else:
+            # Loop ended on the decoder's sentinel
+            decoder_done = True
+    finally:
+        stop.set()
+        enc_q.put(None)
+        encoder.join()
+        if not decoder_done:
+            # Drain until the sentinel so a decoder blocked on a full queue or an
+            # empty pool can see stop and exit
+            for _, frame in iter(raw_q.get, None):
+                free_q.put(frame)
+        decoder.join()
+        pbar.close()
+        out.release()
+    
+    if errors:
+        raise errors[0]
+
+def compare_raw_synced(panel_refresh_every=5):
     """
     Generate comparison visualization showing raw vs synced hand poses.
     
     Raw (Purple): Nearest pose - no interpolation
     Synced (Yellow): Interpolated pose - smooth animation
+    
+    Args:
+        panel_refresh_every (int): Re-render the info panel text every N annotated frames.
+                                   Hand points are still drawn on every frame.
     """
     # PATHS
     video_path = r"d:\OOJU\Projects\VideoSync\data\raw\test_002\MR_View.mp4"
@@ -32,9 +129,9 @@ def compare_raw_synced():
     
     # Load Data
     logger.info("Loading Video...")
-    v_loader = VideoLoader(video_path)
-    timestamps_ms = v_loader.extract_frame_timestamps()
-    v_timestamps_sec = [t / 1000.0 for t in timestamps_ms]
+    v_loader = VideoLoader(video_path, hwaccel=True)
+    timestamps_ms = v_loader.extract_frame_timestamps_fast()
+    v_timestamps_sec = np.asarray(timestamps_ms, dtype=np.float64) * 1e-3
     
     logger.info("Loading Motion...")
     m_loader = MotionLoader(json_dir)
@@ -53,93 +150,109 @@ def compare_raw_synced():
         config_path=config_path if os.path.exists(config_path) else None
     )
     
-    # Video Writer
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    out = cv2.VideoWriter(output_path, fourcc, v_loader.fps, 
-                          (int(v_loader.width), int(v_loader.height)))
+    # Look up the bracketing motion samples for every frame in one pass
+    GAP_THRESHOLD = 0.2
+    logger.info("Interpolating poses...")
+    
+    motion = m_loader.as_arrays()
+    motion_ts = motion['timestamps']
+    aligned = matches['aligned_ts']
+    all_weights = matches['weight']
+    n_frames = len(aligned)
+    prev_idx, next_idx = m_loader.get_surrounding_indices(aligned)
+    
+    # Only draw if within recording (no gaps)
+    valid_mask = (prev_idx >= 0) & (next_idx >= 0)
+    gaps = np.where(valid_mask, motion_ts[next_idx] - motion_ts[prev_idx], np.inf)
+    valid_mask &= gaps <= GAP_THRESHOLD
+    
+    rows = np.flatnonzero(valid_mask)
+    prev_idx = prev_idx[rows]
+    next_idx = next_idx[rows]
+    weights = all_weights[rows]
+    
+    # Map frame index -> row in the precomputed arrays (-1 = nothing to draw)
+    row_of_frame = np.full(n_frames, -1, dtype=np.int64)
+    row_of_frame[rows] = np.arange(len(rows))
+    
+    # RAW pose is the nearest sample: prev if weight < 0.5, else next
+    use_prev = weights < 0.5
+    raw_idx = np.where(use_prev, prev_idx, next_idx)
+    raw_ts = motion_ts[raw_idx]
+    
+    # Hand: RAW (nearest) and SYNCED (interpolated)
+    hand_pos, hand_rot = motion['pose']
+    raw_pos = hand_pos[raw_idx]
+    synced_pos, _ = interpolator.interpolate_pose_batch(
+        hand_pos[prev_idx], hand_pos[next_idx], hand_rot[prev_idx], hand_rot[next_idx], weights)
+    
+    # Camera: midpoint of the interpolated eyes, left eye rotation
+    le_pos, le_rot = motion['left_eye']
+    re_pos, re_rot = motion['right_eye']
+    le_interp_pos, le_interp_rot = interpolator.interpolate_pose_batch(
+        le_pos[prev_idx], le_pos[next_idx], le_rot[prev_idx], le_rot[next_idx], weights)
+    re_interp_pos, _ = interpolator.interpolate_pose_batch(
+        re_pos[prev_idx], re_pos[next_idx], re_rot[prev_idx], re_rot[next_idx], weights)
+    cam_pos = (le_interp_pos + re_interp_pos) / 2.0
+    cam_rot = le_interp_rot
+    
+    # Screen positions of both markers for every row, projected in one pass each
+    raw_px, raw_visible = visualizer.project_hand_points(raw_pos, cam_pos, cam_rot)
+    synced_px, synced_visible = visualizer.project_hand_points(synced_pos, cam_pos, cam_rot)
+    
+    # Metrics
+    synced_ts = aligned[rows]
+    temporal_offsets = np.abs(raw_ts - synced_ts)
+    position_diffs = np.linalg.norm(raw_pos - synced_pos, axis=1)
+    
+    # Video Writer (hardware H.264 when available)
+    out = open_video_writer(output_path, v_loader.fps, 
+                            int(v_loader.width), int(v_loader.height))
     
     # Process Frames
     v_loader.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
     
     logger.info("Rendering comparison frames...")
     
-    frame_idx = 0
-    pbar = tqdm(total=len(matches))
-    GAP_THRESHOLD = 0.2
+    # Frames since the panel text was last rendered; starting at the limit forces a render
+    panel_age = panel_refresh_every
     
-    while True:
-        ret, frame = v_loader.cap.read()
-        if not ret or frame_idx >= len(matches):
-            break
+    # Per-frame lookups are plain list indexing into the precomputed rows
+    rows_of_frame = row_of_frame.tolist()
+    
+    def annotate(frame_idx, frame):
+        nonlocal panel_age
+        row = rows_of_frame[frame_idx]
+        
+        if row < 0:
+            # Nothing to annotate (outside the recording or in a gap): pass the frame through.
+            # Don't show stale panel values after a gap.
+            panel_age = panel_refresh_every
+            return
         
-        match = matches[frame_idx]
-        prev_data, next_data = m_loader.get_surrounding_poses(match['aligned_ts'])
+        # Everything motion-side was precomputed; only drawing is left per frame
+        # Purple = Raw
+        if raw_visible[row]:
+            visualizer.draw_projected_hand_point(frame, raw_px[row], 
+                                                 color=(128, 0, 128), label="RAW", radius=10)
         
-        # Only draw if within recording (no gaps)
-        if prev_data and next_data:
-            t1, d1 = prev_data
-            t2, d2 = next_data
-            
-            if (t2 - t1) <= GAP_THRESHOLD:
-                w = match['weight']
-                
-                # Get RAW pose (nearest)
-                # If weight < 0.5, use prev, else use next
-                raw_pose = d1['pose'] if w < 0.5 else d2['pose']
-                raw_ts = t1 if w < 0.5 else t2
-                
-                # Get SYNCED pose (interpolated)
-                synced_pose = interpolator.interpolate_pose(d1['pose'], d2['pose'], w)
-                synced_ts = match['aligned_ts']
-                
-                # Get camera pose
-                le_pose = None
-                if d1['left_eye'] and d2['left_eye']:
-                    le_pose = interpolator.interpolate_pose(d1['left_eye'], d2['left_eye'], w)
-                    
-                re_pose = None
-                if d1['right_eye'] and d2['right_eye']:
-                    re_pose = interpolator.interpolate_pose(d1['right_eye'], d2['right_eye'], w)
-                    
-                cam_pose = None
-                if le_pose and re_pose:
-                    pos = (np.array(le_pose['position']) + np.array(re_pose['position'])) / 2.0
-                    cam_pose = {'position': pos.tolist(), 'rotation': le_pose['rotation']}
-                elif le_pose:
-                    cam_pose = le_pose
-                elif re_pose:
-                    cam_pose = re_pose
-                
-                # Draw both poses
-                if cam_pose:
-                    # Purple = Raw
-                    visualizer.draw_hand_point(frame, raw_pose, cam_pose, 
-                                              color=(128, 0, 128), label="RAW", 
-                                              apply_calibration=True, radius=10)
-                    
-                    # Yellow = Synced
-                    visualizer.draw_hand_point(frame, synced_pose, cam_pose, 
-                                              color=(0, 255, 255), label="SYNCED", 
-                                              apply_calibration=True, radius=10)
-                    
-                    # Calculate metrics
-                    temporal_offset = abs(raw_ts - synced_ts)
-                    position_diff = np.linalg.norm(
-                        np.array(raw_pose['position']) - np.array(synced_pose['position'])
-                    )
-                    
-                    # Draw info panel
-                    visualizer.draw_info_panel(
-                        frame, frame_idx, len(matches),
-                        synced_ts, raw_ts, synced_ts, temporal_offset, position_diff
-                    )
+        # Yellow = Synced
+        if synced_visible[row]:
+            visualizer.draw_projected_hand_point(frame, synced_px[row], 
+                                                 color=(0, 255, 255), label="SYNCED", radius=10)
         
-        out.write(frame)
-        pbar.update(1)
-        frame_idx += 1
+        # Draw info panel
+        refresh = panel_age >= panel_refresh_every
+        visualizer.draw_info_panel(
+            frame, frame_idx, n_frames,
+            synced_ts[row], raw_ts[row], synced_ts[row], temporal_offsets[row], position_diffs[row],
+            refresh=refresh
+        )
+        panel_age = 1 if refresh else panel_age + 1
+    
+    frame_shape = (int(v_loader.height), int(v_loader.width), 3)
+    render_frames(v_loader.cap, n_frames, frame_shape, out, annotate)
     
-    pbar.close()
-    out.release()
     v_loader.close()
     logger.info(f"Comparison video saved to {output_path}")
 
@@ -1,33 +1,72 @@
-import cv2
 import os
 import sys
+import json
+import shutil
+import subprocess
+from fractions import Fraction
+from concurrent.futures import ThreadPoolExecutor
 
-def analyze_video(file_path):
-    print(f"Analyzing: {file_path}")
-    if not os.path.exists(file_path):
-        print(f"Error: File not found - {file_path}")
-        return None
+def probe_video(file_path):
+    """
+    Reads container/stream metadata with ffprobe, without initializing a decoder.
+    
+    Returns:
+        tuple: (width, height, fps, frame_count, codec, duration_sec)
+    """
+    output = subprocess.check_output([
+        'ffprobe', '-v', 'quiet', '-print_format', 'json',
+        '-show_streams', '-show_format', '-select_streams', 'v:0', file_path
+    ])
+    info = json.loads(output)
+    stream = info['streams'][0]
+    fmt = info.get('format', {})
+    
+    fps_str = stream.get('avg_frame_rate') or stream.get('r_frame_rate') or '0/1'
+    fps = float(Fraction(fps_str)) if not fps_str.endswith('/0') else 0.0
+    duration_sec = float(fmt.get('duration') or stream.get('duration') or 0.0)
+    frame_count = int(stream.get('nb_frames') or round(duration_sec * fps))
+    codec = stream.get('codec_tag_string') or stream.get('codec_name', 'N/A')
+    return int(stream['width']), int(stream['height']), fps, frame_count, codec, duration_sec
 
+def probe_video_opencv(file_path):
+    """Fallback for machines without ffprobe: reads the same fields through OpenCV."""
+    import cv2
+    
     cap = cv2.VideoCapture(file_path)
     if not cap.isOpened():
-        print(f"Error: Could not open video - {file_path}")
-        return None
-
-    # Get Metadata
+        raise IOError(f"Could not open video - {file_path}")
+    
     width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
     fps = cap.get(cv2.CAP_PROP_FPS)
     frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     duration_sec = frame_count / fps if fps > 0 else 0
     
-    file_size_bytes = os.path.getsize(file_path)
-    bitrate_mbps = (file_size_bytes * 8) / (duration_sec * 1024 * 1024) if duration_sec > 0 else 0
-    
     # Check Codec (FourCC)
     fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
-    codec = "".join([chr((fourcc >> 8 * i) & 0xFF) for i in range(4)])
-
+    codec = (fourcc & 0xFFFFFFFF).to_bytes(4, 'little').decode('ascii', 'replace')
+    
     cap.release()
+    return width, height, fps, frame_count, codec, duration_sec
+
+def analyze_video(file_path):
+    print(f"Analyzing: {file_path}")
+    if not os.path.exists(file_path):
+        print(f"Error: File not found - {file_path}")
+        return None
+
+    # Get Metadata
+    try:
+        if shutil.which('ffprobe'):
+            width, height, fps, frame_count, codec, duration_sec = probe_video(file_path)
+        else:
+            width, height, fps, frame_count, codec, duration_sec = probe_video_opencv(file_path)
+    except (subprocess.CalledProcessError, IOError, KeyError, IndexError, ValueError) as e:
+        print(f"Error: Could not read video metadata - {file_path} ({e})")
+        return None
+    
+    file_size_bytes = os.path.getsize(file_path)
+    bitrate_mbps = (file_size_bytes * 8) / (duration_sec * 1024 * 1024) if duration_sec > 0 else 0
 
     return {
         "File": os.path.basename(file_path),
@@ -43,13 +82,10 @@ def main():
     base_dir = r"d:\OOJU\Projects\VideoSync\Resources\RecordComparison"
     files = ["MQDH_Wired.mp4", "PhoneApp_Wireless.mp4"]
     
-    results = []
-    
-    for f in files:
-        path = os.path.join(base_dir, f)
-        data = analyze_video(path)
-        if data:
-            results.append(data)
+    # ffprobe runs are subprocess/IO-bound, so probe all files concurrently
+    paths = [os.path.join(base_dir, f) for f in files]
+    with ThreadPoolExecutor(max_workers=min(8, len(paths)) or 1) as executor:
+        results = [data for data in executor.map(analyze_video, paths) if data]
     
     # Print Comparison Matrix
     print("\n--- Comparison Matrix ---")
@@ -60,18 +96,21 @@ def main():
     print(header_str)
     print("-" * len(header_str))
     
-    markdown_table = f"| {' | '.join(headers)} |\n| {' | '.join(['---']*len(headers))} |\n"
+    table_rows = [
+        f"| {' | '.join(headers)} |",
+        f"| {' | '.join(['---']*len(headers))} |",
+    ]
 
     for r in results:
         row = [str(r.get(h, "N/A")) for h in headers]
         print(" | ".join(row))
-        markdown_table += f"| {' | '.join(row)} |\n"
+        table_rows.append(f"| {' | '.join(row)} |")
 
-    # Save report
+    # Save report in a single write
     report_path = os.path.join(os.path.dirname(__file__), "..", "video_comparison_report.md")
+    report = "# Video Capture Method Comparison\n\n" + "\n".join(table_rows) + "\n"
     with open(report_path, "w") as f:
-        f.write("# Video Capture Method Comparison\n\n")
-        f.write(markdown_table)
+        f.write(report)
     
     print(f"\nReport saved to: {report_path}")
 
@@ -6,10 +6,21 @@ import numpy as np
 import logging
 import argparse
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from tqdm import tqdm
 import subprocess
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -18,10 +29,24 @@ from src.motion_loader import MotionLoader
 from src.motion_matcher import MotionMatcher
 from src.interpolator import Interpolator
 from src.visualizer import Visualizer
+from src.video_writer import open_video_writer
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger("Pipeline")
 
+@lru_cache(maxsize=16)
+def _load_json(path, mtime):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def load_json(path):
+    """
+    Parses a JSON file once per modification: repeated loads of an unchanged file
+    return the cached dict (treat it as read-only), an edited file is re-read.
+    """
+    path = os.path.abspath(path)
+    return _load_json(path, os.path.getmtime(path))
+
 def validate_calibration(config_path, skip_check=False, force_recalibrate=False):
     """
     Stage 0: Calibration Validation
@@ -46,8 +71,7 @@ def validate_calibration(config_path, skip_check=False, force_recalibrate=False)
         return False
     
     # Load and display calibration
-    with open(config_path, 'r') as f:
-        calib = json.load(f)
+    calib = load_json(config_path)
     
     logger.info("\n" + "="*50)
     logger.info("CALIBRATION CHECK")
@@ -90,8 +114,7 @@ def run_pipeline(config_path, skip_calib_check=False, force_recalibrate=False):
     
     # Load configuration
     logger.info(f"Loading configuration from {config_path}")
-    with open(config_path, 'r') as f:
-        config = json.load(f)
+    config = load_json(config_path)
     
     video_path = config['video_path']
     motion_dir = config['motion_dir']
@@ -109,8 +132,10 @@ def run_pipeline(config_path, skip_calib_check=False, force_recalibrate=False):
     
     # Stage 1: Data Loading
     logger.info("Stage 1: Loading Data...")
-    v_loader = VideoLoader(video_path)
-    m_loader = MotionLoader(motion_dir)
+    v_loader = VideoLoader(video_path, hwaccel=True)
+    # float32 poses halve motion memory; timestamps stay float64 either way
+    m_loader = MotionLoader(motion_dir, cache_dir=options.get('motion_cache_dir'),
+                            pose_dtype=options.get('pose_dtype', 'float64'))
     
     logger.info(f"  Video: {video_path}")
     logger.info(f"  Frames: {v_loader.total_frames}, FPS: {v_loader.fps}")
@@ -118,68 +143,65 @@ def run_pipeline(config_path, skip_calib_check=False, force_recalibrate=False):
     
     # Stage 2: Timestamp Processing
     logger.info("\nStage 2: Timestamp Processing...")
-    timestamps_ms = v_loader.extract_frame_timestamps()
-    v_timestamps_sec = [t / 1000.0 for t in timestamps_ms]
+    timestamps_ms = v_loader.extract_frame_timestamps_fast()
+    v_timestamps_sec = np.asarray(timestamps_ms, dtype=np.float64) / 1000.0
     
     matcher = MotionMatcher(m_loader)
     matches = matcher.match_timestamps(v_timestamps_sec, offset_ms=timestamp_offset)
-    logger.info(f"  Matched {len(matches)} video frames to motion data")
+    n_frames = len(matches['aligned_ts'])
+    logger.info(f"  Matched {n_frames} video frames to motion data")
     
     # Stage 3: Pose Interpolation
     logger.info("\nStage 3: Pose Interpolation...")
     interpolator = Interpolator()
     gap_threshold = options['gap_threshold']
     
-    synced_frames = []
-    gaps_detected = 0
+    # Bracketing motion samples for every frame, looked up in one pass
+    motion = m_loader.as_arrays()
+    weights_all = matches['weight']
+    prev_idx, next_idx, prev_ts, next_ts, bracket_w = m_loader.get_surrounding_batch(matches['aligned_ts'])
     
-    for frame_idx, match in enumerate(tqdm(matches, desc="  Interpolating poses")):
-        frame_data = {
-            'frame_idx': frame_idx,
-            'video_timestamp': match['aligned_ts'],
-            'hand_pose': None,
-            'camera_pose': None,
-            'interpolation_weight': match['weight'],
-            'in_gap': False
-        }
-        
-        prev_data, next_data = m_loader.get_surrounding_poses(match['aligned_ts'])
-        
-        if prev_data and next_data:
-            t1, d1 = prev_data
-            t2, d2 = next_data
-            
-            # Check for gap
-            if (t2 - t1) > gap_threshold:
-                frame_data['in_gap'] = True
-                gaps_detected += 1
-            else:
-                w = match['weight']
-                
-                # Interpolate hand pose
-                hand_pose = interpolator.interpolate_pose(d1['pose'], d2['pose'], w)
-                frame_data['hand_pose'] = hand_pose
-                frame_data['source_timestamps'] = [t1, t2]
-                
-                # Interpolate camera pose
-                le_pose = None
-                if d1['left_eye'] and d2['left_eye']:
-                    le_pose = interpolator.interpolate_pose(d1['left_eye'], d2['left_eye'], w)
-                    
-                re_pose = None
-                if d1['right_eye'] and d2['right_eye']:
-                    re_pose = interpolator.interpolate_pose(d1['right_eye'], d2['right_eye'], w)
-                    
-                if le_pose and re_pose:
-                    pos = (np.array(le_pose['position']) + np.array(re_pose['position'])) / 2.0
-                    camera_pose = {'position': pos.tolist(), 'rotation': le_pose['rotation']}
-                    frame_data['camera_pose'] = camera_pose
-                elif le_pose:
-                    frame_data['camera_pose'] = le_pose
-                elif re_pose:
-                    frame_data['camera_pose'] = re_pose
-        
-        synced_frames.append(frame_data)
+    bracketed = (prev_idx >= 0) & (next_idx >= 0)
+    in_gap = bracketed & ((next_ts - prev_ts) > gap_threshold)
+    gaps_detected = int(np.count_nonzero(in_gap))
+    
+    # Interpolate all valid frames at once
+    rows = np.flatnonzero(bracketed & ~in_gap)
+    i1 = prev_idx[rows]
+    i2 = next_idx[rows]
+    w = bracket_w[rows]
+    
+    def interpolate(part):
+        positions, rotations = motion[part]
+        return interpolator.interpolate_pose_batch(
+            positions[i1], positions[i2], rotations[i1], rotations[i2], w)
+    
+    hand_pos, hand_rot = interpolate('pose')
+    le_pos, le_rot = interpolate('left_eye')
+    re_pos, _ = interpolate('right_eye')
+    
+    # Camera: midpoint of the eyes, left eye rotation
+    cam_pos = (le_pos + re_pos) / 2.0
+    
+    # Columnar per-frame results (NaN where there is no pose); dicts are only built for export
+    def per_frame(values, width):
+        column = np.full((n_frames, width), np.nan)
+        column[rows] = values
+        return column
+    
+    has_pose = np.zeros(n_frames, dtype=bool)
+    has_pose[rows] = True
+    synced = {
+        'video_timestamp': matches['aligned_ts'],
+        'interpolation_weight': weights_all,
+        'in_gap': in_gap,
+        'has_pose': has_pose,
+        'hand_pos': per_frame(hand_pos, 3),
+        'hand_rot': per_frame(hand_rot, 4),
+        'camera_pos': per_frame(cam_pos, 3),
+        'camera_rot': per_frame(le_rot, 4),
+        'source_timestamps': per_frame(np.stack([prev_ts[rows], next_ts[rows]], axis=1), 2)
+    }
     
     logger.info(f"  Interpolation complete. Gaps detected: {gaps_detected}")
     
@@ -196,27 +218,47 @@ def run_pipeline(config_path, skip_calib_check=False, force_recalibrate=False):
             config_path=calibration_path
         )
         
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(output_video_path, fourcc, v_loader.fps, 
-                              (int(v_loader.width), int(v_loader.height)))
+        # H.264 via PyAV or an ffmpeg pipe when available, mp4v otherwise
+        out = open_video_writer(output_video_path, v_loader.fps, 
+                                int(v_loader.width), int(v_loader.height))
+        
+        cap = v_loader.cap
+        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        frame = None
         
-        v_loader.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        has_pose_list = synced['has_pose'].tolist()
         
-        for frame_idx in tqdm(range(len(synced_frames)), desc=f"  Rendering {viz_type}"):
-            ret, frame = v_loader.cap.read()
+        if viz_type == 'gizmo':
+            # Project every gizmo up front; the render loop only rasterizes
+            pose_rows = np.flatnonzero(synced['has_pose'])
+            origins = np.zeros((n_frames, 2), dtype=np.int64)
+            origin_visible = np.zeros(n_frames, dtype=bool)
+            axis_ends = np.zeros((n_frames, 3, 2), dtype=np.int64)
+            axis_visible = np.zeros((n_frames, 3), dtype=bool)
+            (origins[pose_rows], origin_visible[pose_rows],
+             axis_ends[pose_rows], axis_visible[pose_rows]) = visualizer.project_gizmos(
+                synced['hand_pos'][pose_rows], synced['hand_rot'][pose_rows],
+                synced['camera_pos'][pose_rows], synced['camera_rot'][pose_rows])
+        
+        for frame_idx in tqdm(range(n_frames), desc=f"  Rendering {viz_type}"):
+            # Every frame is written, so every frame is retrieved; reuse one decode buffer
+            if not cap.grab():
+                break
+            ret, frame = cap.retrieve(frame)
             if not ret:
                 break
             
-            frame_data = synced_frames[frame_idx]
-            
-            if not frame_data['in_gap'] and frame_data['hand_pose'] and frame_data['camera_pose']:
+            if has_pose_list[frame_idx]:
                 if viz_type == 'gizmo':
-                    visualizer.draw_gizmo(frame, frame_data['hand_pose'], 
-                                         frame_data['camera_pose'], apply_calibration=True)
+                    if origin_visible[frame_idx]:
+                        visualizer.draw_projected_gizmo(frame, origins[frame_idx], 
+                                                        axis_ends[frame_idx], axis_visible[frame_idx])
                 elif viz_type == 'comparison':
+                    hand_pose = {'position': synced['hand_pos'][frame_idx], 'rotation': synced['hand_rot'][frame_idx]}
+                    camera_pose = {'position': synced['camera_pos'][frame_idx], 'rotation': synced['camera_rot'][frame_idx]}
                     # For comparison, we'd need raw pose too - simplified here
-                    visualizer.draw_hand_point(frame, frame_data['hand_pose'], 
-                                              frame_data['camera_pose'], 
+                    visualizer.draw_hand_point(frame, hand_pose, 
+                                              camera_pose, 
                                               color=(0, 255, 255), label="SYNCED")
             
             out.write(frame)
@@ -229,7 +271,7 @@ def run_pipeline(config_path, skip_calib_check=False, force_recalibrate=False):
     
     # Export synced JSON
     if options['export_synced_json']:
-        synced_json_path = os.path.join(output_dir, 'synced_poses.json')
+        synced_json_path = os.path.join(output_dir, synced_output_name(options))
         
         # Get motion source files
         motion_files = [f for f in os.listdir(motion_dir) 
@@ -240,25 +282,34 @@ def run_pipeline(config_path, skip_calib_check=False, force_recalibrate=False):
             'metadata': {
                 'video_path': video_path,
                 'motion_sources': motion_files,
-                'total_frames': len(synced_frames),
+                'total_frames': n_frames,
                 'fps': v_loader.fps,
                 'timestamp_offset': timestamp_offset,
                 'gap_threshold': gap_threshold,
                 'gaps_detected': gaps_detected,
                 'processing_date': datetime.now().isoformat()
             },
-            'frames': synced_frames
+            'frames': synced_to_records(synced)
         }
         
-        with open(synced_json_path, 'w') as f:
-            json.dump(synced_data, f, indent=2)
+        if synced_json_path.endswith('.msgpack'):
+            # Binary container for downstream stages; same structure as the JSON
+            with open(synced_json_path, 'wb') as f:
+                f.write(msgpack.packb(synced_data, use_bin_type=True))
+        elif orjson is not None:
+            # Same indented layout, serialized in C; numpy values are handled natively
+            with open(synced_json_path, 'wb') as f:
+                f.write(orjson.dumps(synced_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(synced_json_path, 'w') as f:
+                json.dump(synced_data, f, indent=2)
         
         logger.info(f"  Synced data saved: {synced_json_path}")
     
     # Generate processing report
     if options['generate_report']:
         report_path = os.path.join(output_dir, 'processing_report.md')
-        generate_report(report_path, config, synced_frames, gaps_detected)
+        generate_report(report_path, config, synced, gaps_detected)
         logger.info(f"  Report saved: {report_path}")
     
     logger.info("\n" + "="*50)
@@ -269,11 +320,54 @@ def run_pipeline(config_path, skip_calib_check=False, force_recalibrate=False):
     
     v_loader.close()
 
-def generate_report(report_path, config, synced_frames, gaps_detected):
+def synced_output_name(options):
+    """
+    File name of the synced pose export for options['intermediate_format'].
+    
+    'msgpack' writes synced_poses.msgpack when msgpack is installed; anything
+    else (and the default) writes synced_poses.json.
+    """
+    if options.get('intermediate_format', 'json') == 'msgpack':
+        if msgpack is not None:
+            return 'synced_poses.msgpack'
+        logger.warning("msgpack is not installed, exporting synced poses as JSON")
+    return 'synced_poses.json'
+
+def synced_to_records(synced):
+    """
+    Expands the columnar Stage 3 results into the per-frame records of synced_poses.json.
+    
+    Returns:
+        list: One dict per frame; frames without a pose have hand_pose/camera_pose None.
+    """
+    columns = {key: value.tolist() for key, value in synced.items()}
+    records = []
+    for frame_idx in range(len(columns['video_timestamp'])):
+        frame_data = {
+            'frame_idx': frame_idx,
+            'video_timestamp': columns['video_timestamp'][frame_idx],
+            'hand_pose': None,
+            'camera_pose': None,
+            'interpolation_weight': columns['interpolation_weight'][frame_idx],
+            'in_gap': columns['in_gap'][frame_idx]
+        }
+        if columns['has_pose'][frame_idx]:
+            # The loader stores gripper as 0.0 for every sample
+            frame_data['hand_pose'] = {'position': columns['hand_pos'][frame_idx],
+                                       'rotation': columns['hand_rot'][frame_idx],
+                                       'gripper': 0.0}
+            frame_data['source_timestamps'] = columns['source_timestamps'][frame_idx]
+            frame_data['camera_pose'] = {'position': columns['camera_pos'][frame_idx],
+                                         'rotation': columns['camera_rot'][frame_idx]}
+        records.append(frame_data)
+    return records
+
+def generate_report(report_path, config, synced, gaps_detected):
     """Generate processing report markdown."""
     
-    frames_with_pose = sum(1 for f in synced_frames if f['hand_pose'] is not None)
-    frames_in_gap = sum(1 for f in synced_frames if f['in_gap'])
+    total_frames = len(synced['video_timestamp'])
+    frames_with_pose = int(np.count_nonzero(synced['has_pose']))
+    frames_in_gap = int(np.count_nonzero(synced['in_gap']))
     
     report = f"""# VideoSync Processing Report
 
@@ -284,12 +378,12 @@ def generate_report(report_path, config, synced_frames, gaps_detected):
 ## Input Data
 - **Video**: `{config['video_path']}`
 - **Motion Directory**: `{config['motion_dir']}`
-- **Total Frames**: {len(synced_frames)}
+- **Total Frames**: {total_frames}
 - **Timestamp Offset**: {config['timestamp_offset']}
 
 ## Processing Statistics
-- **Frames with Synchronized Pose**: {frames_with_pose} ({frames_with_pose/len(synced_frames)*100:.1f}%)
-- **Frames in Gaps**: {frames_in_gap} ({frames_in_gap/len(synced_frames)*100:.1f}%)
+- **Frames with Synchronized Pose**: {frames_with_pose} ({frames_with_pose/total_frames*100:.1f}%)
+- **Frames in Gaps**: {frames_in_gap} ({frames_in_gap/total_frames*100:.1f}%)
 - **Gap Threshold**: {config['options']['gap_threshold']}s
 
 ## Configuration
@@ -298,7 +392,7 @@ def generate_report(report_path, config, synced_frames, gaps_detected):
 - **Export Synced JSON**: {config['options']['export_synced_json']}
 
 ## Output Files
-- Synced poses: `synced_poses.json`
+- Synced poses: `{synced_output_name(config['options'])}`
 - Visualization: `viz_{config['options']['visualization_type']}.mp4` (if enabled)
 - Report: `processing_report.md`
 
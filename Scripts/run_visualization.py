@@ -13,6 +13,7 @@ from src.motion_loader import MotionLoader
 from src.motion_matcher import MotionMatcher
 from src.interpolator import Interpolator
 from src.visualizer import Visualizer
+from src.video_writer import open_video_writer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("Pipe")
@@ -25,10 +26,10 @@ def run_visualization():
     
     # 1. Load Data
     logger.info("Loading Video...")
-    v_loader = VideoLoader(video_path)
-    timestamps_ms = v_loader.extract_frame_timestamps()
+    v_loader = VideoLoader(video_path, hwaccel=True)
+    timestamps_ms = v_loader.extract_frame_timestamps_fast()
     # Convert to seconds
-    v_timestamps_sec = [t / 1000.0 for t in timestamps_ms]
+    v_timestamps_sec = np.asarray(timestamps_ms, dtype=np.float64) / 1000.0
     
     logger.info("Loading Motion...")
     m_loader = MotionLoader(json_dir)
@@ -49,110 +50,78 @@ def run_visualization():
     interpolator = Interpolator()
     visualizer = Visualizer(width=int(v_loader.width), height=int(v_loader.height))
     
-    # 4. Video Writer
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    out = cv2.VideoWriter(output_path, fourcc, v_loader.fps, (int(v_loader.width), int(v_loader.height)))
+    # 4. Video Writer (H.264 via PyAV or an ffmpeg pipe when available)
+    out = open_video_writer(output_path, v_loader.fps, int(v_loader.width), int(v_loader.height))
     
     # 5. Loop Frames
     v_loader.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
     
     logger.info("Rendering frames...")
     
-    frame_idx = 0
-    pbar = tqdm(total=len(matches))
+    # GAP CHECK: If the interval is too large, we are likely between sessions.
+    # Standard Quest hand tracking is 60Hz (~16ms).
+    # Tolerance: 100-200ms.
+    GAP_THRESHOLD = 0.2
     
-    while True:
-        ret, frame = v_loader.cap.read()
-        if not ret:
+    # Bracketing motion samples for every frame, looked up once
+    motion = m_loader.as_arrays()
+    motion_ts = motion['timestamps']
+    aligned = matches['aligned_ts']
+    n_frames = len(aligned)
+    prev_idx, next_idx = m_loader.get_surrounding_indices(aligned)
+    
+    valid_mask = (prev_idx >= 0) & (next_idx >= 0)
+    gaps = np.where(valid_mask, motion_ts[next_idx] - motion_ts[prev_idx], np.inf)
+    valid_mask &= gaps <= GAP_THRESHOLD
+    
+    rows = np.flatnonzero(valid_mask)
+    i1 = prev_idx[rows]
+    i2 = next_idx[rows]
+    weights = matches['weight'][rows]
+    
+    # Map frame index -> row in the interpolated arrays (-1 = nothing to draw)
+    row_of_frame = np.full(n_frames, -1, dtype=np.int64)
+    row_of_frame[rows] = np.arange(len(rows))
+    
+    def interpolate(part):
+        positions, rotations = motion[part]
+        return interpolator.interpolate_pose_batch(
+            positions[i1], positions[i2], rotations[i1], rotations[i2], weights)
+    
+    # Hand Pose
+    hand_pos, hand_rot = interpolate('pose')
+    
+    # Camera: synthetic "Head" pose = centroid of the left/right eyes.
+    # Usually left/right eyes have same rotation (head rotation), so use the left eye's.
+    le_pos, le_rot = interpolate('left_eye')
+    re_pos, _ = interpolate('right_eye')
+    cam_pos = (le_pos + re_pos) / 2.0
+    
+    # Project every gizmo up front; the render loop only rasterizes
+    origins, origin_visible, axis_ends, axis_visible = visualizer.project_gizmos(hand_pos, hand_rot, cam_pos, le_rot)
+    
+    cap = v_loader.cap
+    frame = None
+    pbar = tqdm(total=n_frames)
+    
+    for frame_idx, row in enumerate(row_of_frame.tolist()):
+        # Every frame is written, so every frame is retrieved; reuse one decode buffer
+        if not cap.grab():
             break
-            
-        if frame_idx >= len(matches):
+        ret, frame = cap.retrieve(frame)
+        if not ret:
             break
-            
-        match = matches[frame_idx]
-        w = match['weight']
         
-        # Only draw if we have valid interpolation (weight not 0/1 pinned to ends, or strictly inside range)
-        # Actually MotionMatcher returns 0/1 if out of bounds.
-        # We should check if we are significantly inside a valid range?
-        # Let's verify via MotionLoader.get_surrounding_poses
-        
-        # We need generic interpolation!
-        # MotionLoader update: get_surrounding returns "pose", "left_eye", "right_eye" dicts? Not exactly.
-        # MotionLoader.get_surrounding_poses returns ((t1, data1), (t2, data2))
-        # where data1 is self.poses[i] (legacy) OR updated structure?
-        
-        # CHECK MotionLoader changes:
-        # I updated `get_surrounding_poses` to return:
-        # curr = (ts, {'pose':..., 'left_eye':..., 'right_eye':...})
-        
-        # So we can fetch directly using timestamps from match result?
-        # NO, 'match' result has prev_motion_ts/next_motion_ts
-        # But we don't have the INDICES.
-        # We should probably use `MotionLoader.get_surrounding_poses(match['aligned_ts'])` directly here?
-        # Re-using Matcher result is good for analysis but accessing data might be repeating work.
-        # Let's just use `m_loader.get_surrounding_poses(match['aligned_ts'])`.
-        
-        prev_data, next_data = m_loader.get_surrounding_poses(match['aligned_ts'])
-        
-        # GAP CHECK: If the interval is too large, we are likely between sessions.
-        # Standard Quest hand tracking is 60Hz (~16ms).
-        # Tolerance: 100-200ms.
-        GAP_THRESHOLD = 0.2
-        
-        if prev_data and next_data:
-            t1, d1 = prev_data
-            t2, d2 = next_data
-            
-            if (t2 - t1) > GAP_THRESHOLD:
-                # Gap detected, skip drawing
-                out.write(frame)
-                pbar.update(1)
-                frame_idx += 1
-                continue
-            
-            # Interpolate Hand
-            
-            # Hand Pose
-            hand_pose = interpolator.interpolate_pose(d1['pose'], d2['pose'], w)
-            
-            # Camera interpolation (Eyes)
-            # Create synthetic "Head" pose = Average of Left and Right Eyes?
-            # Or just use Left Eye for now? Quest captures usually view from distinct eyes.
-            # Let's try Centroid of Left/Right.
-            
-            # Interpolate Left Eye
-            le_pose = None
-            if d1['left_eye'] and d2['left_eye']:
-                 le_pose = interpolator.interpolate_pose(d1['left_eye'], d2['left_eye'], w)
-                 
-            # Interpolate Right Eye
-            re_pose = None
-            if d1['right_eye'] and d2['right_eye']:
-                 re_pose = interpolator.interpolate_pose(d1['right_eye'], d2['right_eye'], w)
-                 
-            cam_pose = None
-            if le_pose and re_pose:
-                # Average Position
-                pos = (np.array(le_pose['position']) + np.array(re_pose['position'])) / 2.0
-                # Rotation? Use Left Eye Rotation? Or Slerp(Left, Right, 0.5)?
-                # Usually left/right eyes have same rotation (head rotation).
-                cam_pose = {'position': pos.tolist(), 'rotation': le_pose['rotation']}
-            elif le_pose:
-                cam_pose = le_pose
-            elif re_pose:
-                cam_pose = re_pose
-                
+        if row >= 0:
             # Draw
-            if cam_pose:
-                visualizer.draw_gizmo(frame, hand_pose, cam_pose)
-                
-                # Debug Text
-                cv2.putText(frame, f"TS: {match['aligned_ts']:.3f}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+            if origin_visible[row]:
+                visualizer.draw_projected_gizmo(frame, origins[row], axis_ends[row], axis_visible[row])
+            
+            # Debug Text
+            cv2.putText(frame, f"TS: {aligned[frame_idx]:.3f}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
         
         out.write(frame)
         pbar.update(1)
-        frame_idx += 1
         
     pbar.close()
     out.release()
@@ -26,7 +26,7 @@ def visualize_matching():
     logger.info("Loading Video...")
     v_loader = VideoLoader(video_path)
     # v_timestamps are relative ms from 0
-    v_timestamps = v_loader.extract_frame_timestamps()
+    v_timestamps = v_loader.extract_frame_timestamps_fast()
     v_loader.close()
     
     logger.info("Loading Motion...")
@@ -39,7 +39,7 @@ def visualize_matching():
     video_mtime = os.path.getmtime(video_path)
     
     # Calculate duration
-    if v_timestamps:
+    if len(v_timestamps):
         v_duration_ms = v_timestamps[-1] - v_timestamps[0]
         v_duration_sec = v_duration_ms / 1000.0
     else:
@@ -50,19 +50,19 @@ def visualize_matching():
     logger.info(f"Video Duration (sec): {v_duration_sec}")
     logger.info(f"Estimated Video Start: {estimated_start_ts}")
     # Fix potential crash if m_loader.timestamps is empty
-    if m_loader.timestamps:
+    if len(m_loader.timestamps):
         logger.info(f"Motion Range: {m_loader.timestamps[0]} to {m_loader.timestamps[-1]}")
     else:
         logger.warning("No motion timestamps found.")
 
     # Convert video timestamps to absolute Unix Seconds for matching
     # aligned_ts = (v_ts_ms / 1000.0) + estimated_start_ts
-    v_timestamps_sec = [t / 1000.0 for t in v_timestamps]
+    v_timestamps_sec = np.asarray(v_timestamps, dtype=np.float64) / 1000.0
     
     # Match using absolute timestamps (offset=estimated_start_ts)
     matches = matcher.match_timestamps(v_timestamps_sec, offset_ms=estimated_start_ts)
     
-    weights = [m['weight'] for m in matches]
+    weights = matches['weight']
     
     # Prepare plot
     plt.figure(figsize=(12, 6))
@@ -77,9 +77,9 @@ def visualize_matching():
     # Subplot 2: Temporal Alignment
     plt.subplot(2, 1, 2)
     # Plot normalized/centered timestamps to see drift
-    v_ts_np = np.array([m['aligned_ts'] for m in matches])
-    prev_ts_np = np.array([m['prev_motion_ts'] for m in matches])
-    next_ts_np = np.array([m['next_motion_ts'] for m in matches])
+    v_ts_np = matches['aligned_ts']
+    prev_ts_np = matches['prev_motion_ts']
+    next_ts_np = matches['next_motion_ts']
     
     # Difference to Previous Motion
     diff = v_ts_np - prev_ts_np
@@ -1,6 +1,11 @@
 import json
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 class DataLoader:
@@ -10,12 +15,16 @@ class DataLoader:
     def load_motion_data(self, file_path):
         logger.info(f"Loading motion data from {file_path}")
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r') as f:
+                    data = json.load(f)
             return data
         except FileNotFoundError:
             logger.error(f"File not found: {file_path}")
             return None
-        except json.JSONDecodeError:
+        except json.JSONDecodeError: # orjson.JSONDecodeError is a subclass
             logger.error(f"Error decoding JSON from: {file_path}")
             return None
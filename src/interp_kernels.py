@@ -0,0 +1,104 @@
+import math
+import logging
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# Above this |dot| the two quaternions are nearly parallel and Slerp degenerates to Lerp
+SLERP_LINEAR_THRESHOLD = 0.9995
+
+# Quaternions whose squared norm is this close to 1 are treated as unit and not renormalized
+UNIT_NORM_TOLERANCE = 1e-6
+
+# Eberly, "A Fast and Accurate Algorithm for Computing SLERP": the Slerp coefficient
+# sin(t*theta)/sin(theta) as a degree-8 polynomial in (cos(theta) - 1), no acos/sin needed.
+# The last term is scaled by (1 + mu) to absorb the truncation error (max error ~1e-5).
+SLERP_POLY_MU = 1.90110745351730037
+_terms = np.arange(1, 9, dtype=np.float64)
+SLERP_POLY_U = 1.0 / (_terms * (2.0 * _terms + 1.0))
+SLERP_POLY_V = _terms / (2.0 * _terms + 1.0)
+SLERP_POLY_U[-1] *= SLERP_POLY_MU
+SLERP_POLY_V[-1] *= SLERP_POLY_MU
+
+HAVE_NUMBA = njit is not None
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _slerp_coeff(t, xm1):
+        # Horner evaluation of Eberly's polynomial, innermost term first
+        c = 1.0
+        t2 = t * t
+        for k in range(7, -1, -1):
+            c = 1.0 + (SLERP_POLY_U[k] * t2 - SLERP_POLY_V[k]) * xm1 * c
+        return t * c
+
+    @njit(cache=True, fastmath=True)
+    def _inv_norm(sq_norm):
+        # 1/|q|, skipping the sqrt for quaternions that are already unit
+        if abs(sq_norm - 1.0) > UNIT_NORM_TOLERANCE:
+            return 1.0 / math.sqrt(sq_norm)
+        return 1.0
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _slerp_kernel(q0, q1, w, out):
+        for i in prange(q0.shape[0]):
+            # Normalize inputs like scipy's Rotation.from_quat does
+            inv0 = _inv_norm(q0[i, 0] * q0[i, 0] + q0[i, 1] * q0[i, 1] + q0[i, 2] * q0[i, 2] + q0[i, 3] * q0[i, 3])
+            inv1 = _inv_norm(q1[i, 0] * q1[i, 0] + q1[i, 1] * q1[i, 1] + q1[i, 2] * q1[i, 2] + q1[i, 3] * q1[i, 3])
+
+            d = (q0[i, 0] * q1[i, 0] + q0[i, 1] * q1[i, 1] + q0[i, 2] * q1[i, 2] + q0[i, 3] * q1[i, 3]) * (inv0 * inv1)
+
+            # Take the shortest path
+            s = 1.0 if d >= 0.0 else -1.0
+            d = min(d * s, 1.0)
+
+            t = min(max(w[i], 0.0), 1.0)
+            if d > SLERP_LINEAR_THRESHOLD:
+                # Nearly parallel: Lerp
+                a = 1.0 - t
+                b = t
+            else:
+                a = _slerp_coeff(1.0 - t, d - 1.0)
+                b = _slerp_coeff(t, d - 1.0)
+            a *= inv0
+            b *= s * inv1
+
+            x = a * q0[i, 0] + b * q1[i, 0]
+            y = a * q0[i, 1] + b * q1[i, 1]
+            z = a * q0[i, 2] + b * q1[i, 2]
+            ww = a * q0[i, 3] + b * q1[i, 3]
+            inv = _inv_norm(x * x + y * y + z * z + ww * ww)
+            out[i, 0] = x * inv
+            out[i, 1] = y * inv
+            out[i, 2] = z * inv
+            out[i, 3] = ww * inv
+
+def slerp_batch_jit(q0, q1, weights):
+    """
+    Numba version of interpolator.slerp_batch.
+
+    Args:
+        q0 (np.ndarray): (N, 4) start rotations [x, y, z, w].
+        q1 (np.ndarray): (N, 4) end rotations [x, y, z, w].
+        weights (np.ndarray): (N,) interpolation weights, clamped to [0, 1].
+
+    Returns:
+        np.ndarray: (N, 4) unit quaternions [x, y, z, w].
+    """
+    q0 = np.ascontiguousarray(q0, dtype=np.float64)
+    q1 = np.ascontiguousarray(q1, dtype=np.float64)
+    w = np.ascontiguousarray(weights, dtype=np.float64)
+    out = np.empty_like(q0)
+    _slerp_kernel(q0, q1, w, out)
+    return out
+
+if HAVE_NUMBA:
+    # Compile (or load from cache) at import so the first real call is not slowed down
+    _identity = np.array([[0.0, 0.0, 0.0, 1.0]])
+    slerp_batch_jit(_identity, _identity, np.zeros(1))
+    logger.debug("Numba SLERP kernel ready")
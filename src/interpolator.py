@@ -1,14 +1,151 @@
+import math
 import numpy as np
-from scipy.spatial.transform import Rotation as R
-from scipy.spatial.transform import Slerp
 import logging
+from .interp_kernels import (HAVE_NUMBA, SLERP_LINEAR_THRESHOLD, SLERP_POLY_U, SLERP_POLY_V,
+                            UNIT_NORM_TOLERANCE, slerp_batch_jit)
 
 logger = logging.getLogger(__name__)
 
+def _slerp(q1, q2, t):
+    """
+    Spherical linear interpolation between two quaternions [x, y, z, w].
+    Scalar math on Python floats: for one pair, numpy dispatch costs more than the arithmetic.
+    
+    Args:
+        q1 (array-like): (4,) start rotation.
+        q2 (array-like): (4,) end rotation.
+        t (float): Interpolation weight in [0, 1].
+        
+    Returns:
+        np.ndarray: (4,) unit quaternion.
+    """
+    x1, y1, z1, w1 = map(float, q1)
+    x2, y2, z2, w2 = map(float, q2)
+    
+    # Normalize inputs like scipy's Rotation.from_quat does (MotionLoader rotations already are)
+    sq_norm = x1 * x1 + y1 * y1 + z1 * z1 + w1 * w1
+    if abs(sq_norm - 1.0) > UNIT_NORM_TOLERANCE:
+        n = math.sqrt(sq_norm)
+        x1, y1, z1, w1 = x1 / n, y1 / n, z1 / n, w1 / n
+    sq_norm = x2 * x2 + y2 * y2 + z2 * z2 + w2 * w2
+    if abs(sq_norm - 1.0) > UNIT_NORM_TOLERANCE:
+        n = math.sqrt(sq_norm)
+        x2, y2, z2, w2 = x2 / n, y2 / n, z2 / n, w2 / n
+    
+    # Take the shortest path
+    d = x1 * x2 + y1 * y2 + z1 * z2 + w1 * w2
+    if d < 0.0:
+        x2, y2, z2, w2 = -x2, -y2, -z2, -w2
+        d = -d
+    
+    if d > SLERP_LINEAR_THRESHOLD:
+        # Nearly parallel: normalized Lerp
+        x = x1 + t * (x2 - x1)
+        y = y1 + t * (y2 - y1)
+        z = z1 + t * (z2 - z1)
+        w = w1 + t * (w2 - w1)
+        n = math.sqrt(x * x + y * y + z * z + w * w)
+        return np.array([x / n, y / n, z / n, w / n])
+    
+    theta_0 = math.acos(d)
+    sin_theta_0 = math.sin(theta_0)
+    s0 = math.sin((1.0 - t) * theta_0) / sin_theta_0
+    s1 = math.sin(t * theta_0) / sin_theta_0
+    return np.array([s0 * x1 + s1 * x2, s0 * y1 + s1 * y2, s0 * z1 + s1 * z2, s0 * w1 + s1 * w2])
+
+def quat_to_matrix(q):
+    """
+    Converts unit quaternions [x, y, z, w] to rotation matrices in closed form.
+    
+    Rotating many points by one rotation is then a single matmul, e.g.
+    points @ quat_to_matrix(q).T, instead of a quaternion product per point.
+    
+    Args:
+        q (np.ndarray): (4,) or (N, 4) unit quaternions.
+        
+    Returns:
+        np.ndarray: (3, 3) or (N, 3, 3) rotation matrices.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    x, y, z, w = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+    m = np.stack([
+        1.0 - 2.0 * (yy + zz), 2.0 * (xy - wz), 2.0 * (xz + wy),
+        2.0 * (xy + wz), 1.0 - 2.0 * (xx + zz), 2.0 * (yz - wx),
+        2.0 * (xz - wy), 2.0 * (yz + wx), 1.0 - 2.0 * (xx + yy)
+    ], axis=-1)
+    return m.reshape(q.shape[:-1] + (3, 3))
+
+def _normalize_rows(q):
+    """Scales (N, 4) quaternions to unit norm, leaving rows within UNIT_NORM_TOLERANCE untouched."""
+    sq_norm = np.einsum('ij,ij->i', q, q)
+    scale = np.where(np.abs(sq_norm - 1.0) > UNIT_NORM_TOLERANCE, 1.0 / np.sqrt(sq_norm), 1.0)
+    return q * scale[:, None]
+
+def slerp_batch(q0, q1, weights):
+    """
+    Spherical linear interpolation between rows of two quaternion arrays.
+    
+    Uses Eberly's polynomial approximation of the Slerp coefficients (no acos/sin),
+    accurate to ~1e-5 before the final normalization.
+    
+    Args:
+        q0 (np.ndarray): (N, 4) start rotations [x, y, z, w].
+        q1 (np.ndarray): (N, 4) end rotations [x, y, z, w].
+        weights (np.ndarray): (N,) interpolation weights, clamped to [0, 1].
+        
+    Returns:
+        np.ndarray: (N, 4) unit quaternions [x, y, z, w].
+    """
+    q0 = np.asarray(q0, dtype=np.float64)
+    q1 = np.asarray(q1, dtype=np.float64)
+    w = np.clip(np.asarray(weights, dtype=np.float64), 0.0, 1.0)[:, None]
+    
+    # Normalize inputs like scipy's Rotation.from_quat does
+    q0 = _normalize_rows(q0)
+    q1 = _normalize_rows(q1)
+    
+    # Take the shortest path
+    dot = np.sum(q0 * q1, axis=1, keepdims=True)
+    q1 = np.where(dot < 0.0, -q1, q1)
+    dot = np.minimum(np.abs(dot), 1.0)
+    
+    linear = dot > SLERP_LINEAR_THRESHOLD
+    xm1 = dot - 1.0
+    
+    def coeff(t):
+        # Eberly's polynomial for sin(t*theta)/sin(theta), evaluated with Horner's rule
+        c = np.ones_like(t)
+        t2 = t * t
+        for k in range(len(SLERP_POLY_U) - 1, -1, -1):
+            c = 1.0 + (SLERP_POLY_U[k] * t2 - SLERP_POLY_V[k]) * xm1 * c
+        return t * c
+    
+    s0 = np.where(linear, 1.0 - w, coeff(1.0 - w))
+    s1 = np.where(linear, w, coeff(w))
+    
+    return _normalize_rows(s0 * q0 + s1 * q1)
+
 class Interpolator:
     def __init__(self):
         pass
 
+    def _interpolate(self, prev_pose, next_pose, weight):
+        """Lerp/Slerp core shared by interpolate_pose and interpolate_pose_into."""
+        # Clamp weight
+        weight = max(0.0, min(1.0, weight))
+        
+        # 1. Position and gripper Interpolation (Lerp), as one array
+        start = np.array([*prev_pose['position'], prev_pose.get('gripper', 0.0)], dtype=np.float64)
+        end = np.array([*next_pose['position'], next_pose.get('gripper', 0.0)], dtype=np.float64)
+        lerped = start + (end - start) * weight
+        
+        # 2. Rotation Interpolation (Slerp), quaternions are [x, y, z, w]
+        r_interp = _slerp(prev_pose['rotation'], next_pose['rotation'], weight)
+        return lerped, r_interp
+
     def interpolate_pose(self, prev_pose, next_pose, weight):
         """
         Interpolates between two poses.
@@ -21,33 +158,103 @@ class Interpolator:
         Returns:
             dict: Interpolated pose.
         """
-        # Clamp weight
+        lerped, r_interp = self._interpolate(prev_pose, next_pose, weight)
+        return {
+            'position': lerped[:3].tolist(),
+            'rotation': r_interp.tolist(),
+            'gripper': float(lerped[3])
+        }
+
+    def interpolate_pose_into(self, prev_pose, next_pose, weight, pos_out, rot_out, grip_out, i):
+        """
+        interpolate_pose writing row i of preallocated arrays instead of returning a dict.
+        
+        Args:
+            prev_pose (dict): Start pose, as for interpolate_pose.
+            next_pose (dict): End pose, as for interpolate_pose.
+            weight (float): Interpolation weight (0.0 to 1.0).
+            pos_out (np.ndarray): (N, 3) positions to write.
+            rot_out (np.ndarray): (N, 4) rotations [x, y, z, w] to write.
+            grip_out (np.ndarray): (N,) gripper values to write.
+            i (int): Row to write.
+        """
+        lerped, r_interp = self._interpolate(prev_pose, next_pose, weight)
+        pos_out[i] = lerped[:3]
+        rot_out[i] = r_interp
+        grip_out[i] = lerped[3]
+
+    def interpolate_pose_as_matrix(self, prev_pose, next_pose, weight):
+        """
+        interpolate_pose for callers that rotate points: returns the rotation as a matrix.
+        
+        Args:
+            prev_pose (dict): Start pose {'position': [x,y,z], 'rotation': [x,y,z,w]}
+            next_pose (dict): End pose {'position': [x,y,z], 'rotation': [x,y,z,w]}
+            weight (float): Interpolation weight (0.0 to 1.0).
+            
+        Returns:
+            tuple: (position (3,), rotation matrix (3, 3))
+        """
         weight = max(0.0, min(1.0, weight))
+        p1 = np.asarray(prev_pose['position'], dtype=np.float64)
+        p2 = np.asarray(next_pose['position'], dtype=np.float64)
+        q = _slerp(prev_pose['rotation'], next_pose['rotation'], weight)
+        return p1 + (p2 - p1) * weight, quat_to_matrix(q)
+
+    def interpolate_pose_batch(self, prev_pos, next_pos, prev_rot, next_rot, weights):
+        """
+        Interpolates N pose pairs in one vectorized pass.
+        
+        Args:
+            prev_pos (np.ndarray): (N, 3) start positions.
+            next_pos (np.ndarray): (N, 3) end positions.
+            prev_rot (np.ndarray): (N, 4) start rotations [x, y, z, w].
+            next_rot (np.ndarray): (N, 4) end rotations [x, y, z, w].
+            weights (np.ndarray): (N,) interpolation weights (0.0 to 1.0).
+            
+        Returns:
+            tuple: (positions (N, 3), rotations (N, 4))
+        """
+        w = np.clip(np.asarray(weights, dtype=np.float64), 0.0, 1.0)
+        p1 = np.asarray(prev_pos, dtype=np.float64)
+        p2 = np.asarray(next_pos, dtype=np.float64)
         
-        # 1. Position Interpolation (Lerp)
-        p1 = np.array(prev_pose['position'])
-        p2 = np.array(next_pose['position'])
-        p_interp = p1 + (p2 - p1) * weight
+        positions = p1 + (p2 - p1) * w[:, None]
+        if HAVE_NUMBA:
+            rotations = slerp_batch_jit(prev_rot, next_rot, w)
+        else:
+            rotations = slerp_batch(prev_rot, next_rot, w)
+        return positions, rotations
+
+    def interpolate_poses(self, target_timestamps, timestamps, positions, rotations):
+        """
+        Samples a trajectory at N query times in one vectorized pass.
         
-        # 2. Rotation Interpolation (Slerp)
-        # scipy expects [x, y, z, w]
-        # Create Rotation object containing both keyframes
-        key_rots = R.from_quat([prev_pose['rotation'], next_pose['rotation']])
-        key_times = [0, 1]
+        Each query is interpolated between the samples that bracket it; queries
+        outside the trajectory are clamped to its first/last sample.
         
-        # Initialize Slerp
-        slerp = Slerp(key_times, key_rots)
+        Args:
+            target_timestamps (np.ndarray): (N,) query times.
+            timestamps (np.ndarray): (M,) sorted sample times, M >= 1.
+            positions (np.ndarray): (M, 3) sample positions.
+            rotations (np.ndarray): (M, 4) sample rotations [x, y, z, w].
+            
+        Returns:
+            tuple: (positions (N, 3), rotations (N, 4))
+        """
+        target = np.asarray(target_timestamps, dtype=np.float64)
+        ts = np.asarray(timestamps, dtype=np.float64)
+        positions = np.asarray(positions, dtype=np.float64)
+        rotations = np.asarray(rotations, dtype=np.float64)
         
-        # Interpolate
-        r_interp = slerp([weight])
+        if len(ts) == 1:
+            return np.repeat(positions, len(target), axis=0), np.repeat(rotations, len(target), axis=0)
         
-        # 3. Gripper Interpolation (Lerp)
-        g1 = prev_pose.get('gripper', 0.0)
-        g2 = next_pose.get('gripper', 0.0)
-        g_interp = g1 + (g2 - g1) * weight
+        idx = np.clip(np.searchsorted(ts, target), 1, len(ts) - 1)
+        t1 = ts[idx - 1]
+        interval = ts[idx] - t1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weights = np.where(interval > 0, (target - t1) / interval, 0.0)
         
-        return {
-            'position': p_interp.tolist(),
-            'rotation': r_interp.as_quat()[0].tolist(),
-            'gripper': float(g_interp)
-        }
+        return self.interpolate_pose_batch(positions[idx - 1], positions[idx],
+                                           rotations[idx - 1], rotations[idx], weights)
@@ -0,0 +1,142 @@
+import logging
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+HAVE_NUMBA = njit is not None
+
+# Brackets narrower than this are treated as a single sample (weight 0.0)
+MIN_BRACKET = 1e-9
+
+if HAVE_NUMBA:
+    # Explicit signatures compile eagerly at import (or load from cache) and skip type
+    # inference and dispatch on every call; the wrappers guarantee contiguous float64/int64.
+    # No fastmath: the NaN check below relies on x != x.
+    @njit('i8(f8[::1], f8, i8)', cache=True)
+    def _hunt(a, x, j):
+        # Hunt-and-locate (Numerical Recipes 3.1): start from the previous answer j,
+        # double the step until x is bracketed, then bisect inside the bracket.
+        # Dense sorted query streams cost O(1) amortized instead of O(log n) each.
+        n = a.shape[0]
+        if x != x:
+            # NaN sorts last, like np.searchsorted
+            return n
+
+        if j < n and a[j] < x:
+            # Answer is above j: hunt up
+            left = j + 1
+            step = 1
+            right = j + step
+            while right < n and a[right] < x:
+                left = right + 1
+                step *= 2
+                right = j + step
+            if right > n:
+                right = n
+        else:
+            # Answer is at or below j: hunt down
+            right = j
+            step = 1
+            left = j - step
+            while left >= 0 and a[left] >= x:
+                right = left
+                step *= 2
+                left = j - step
+            left = max(left + 1, 0)
+
+        # Branchless bisection over [left, right): the trip count depends only on the
+        # bracket length and the comparison only feeds arithmetic, so the loop exit is
+        # never a data-dependent (and ~50% mispredicted) branch
+        length = right - left
+        while length > 0:
+            half = length >> 1
+            left += (length - half) * (a[left + half] < x)
+            length = half
+        return left
+
+    @njit('void(f8[::1], f8[::1], i8[::1])', cache=True)
+    def _hunt_kernel(a, queries, out):
+        j = 0
+        for i in range(queries.shape[0]):
+            j = _hunt(a, queries[i], j)
+            out[i] = j
+
+    @njit('void(f8[::1], f8[::1], i8[::1], i8[::1], f8[::1])', cache=True)
+    def _match_kernel(motion_ts, aligned, prev_idx, next_idx, weight):
+        n = motion_ts.shape[0]
+        j = 0
+        for i in range(aligned.shape[0]):
+            j = _hunt(motion_ts, aligned[i], j)
+            if j == 0:
+                # Before start or at start: clamp to start
+                prev_idx[i] = 0
+                next_idx[i] = min(1, n - 1)
+                weight[i] = 0.0
+                continue
+            if j >= n:
+                # After end: clamp to end
+                prev_idx[i] = n - 1
+                next_idx[i] = n - 1
+                weight[i] = 1.0
+                continue
+
+            prev_idx[i] = j - 1
+            next_idx[i] = j
+            denominator = motion_ts[j] - motion_ts[j - 1]
+            if denominator > MIN_BRACKET:
+                w = (aligned[i] - motion_ts[j - 1]) / denominator
+                weight[i] = min(max(w, 0.0), 1.0)
+            else:
+                weight[i] = 0.0
+
+def hunt_searchsorted(a, queries):
+    """
+    np.searchsorted(a, queries, side='left') for query streams that are mostly increasing.
+
+    Each lookup starts from the previous answer, so consecutive video frames that land in
+    neighbouring motion samples cost a few comparisons instead of a full binary search.
+    Unsorted queries are still answered correctly, just without the speedup.
+    Falls back to np.searchsorted when numba is not installed.
+
+    Args:
+        a (np.ndarray): (M,) sorted float64 array.
+        queries (np.ndarray): (N,) values to locate.
+
+    Returns:
+        np.ndarray: (N,) int64 insertion indices in [0, M].
+    """
+    a = np.ascontiguousarray(a, dtype=np.float64)
+    queries = np.ascontiguousarray(queries, dtype=np.float64)
+    if not HAVE_NUMBA:
+        return np.searchsorted(a, queries, side='left')
+    out = np.empty(queries.shape[0], dtype=np.int64)
+    _hunt_kernel(a, queries, out)
+    return out
+
+def match_brackets_jit(motion_ts, aligned):
+    """
+    Numba version of the bracket/weight computation in MotionMatcher.match_timestamps.
+
+    Args:
+        motion_ts (np.ndarray): (M,) sorted motion timestamps, M >= 1.
+        aligned (np.ndarray): (N,) video timestamps in the motion time domain.
+
+    Returns:
+        tuple: (prev_idx (N,), next_idx (N,), weight (N,)). Frames before the first
+               sample clamp to it with weight 0.0, frames after the last with weight 1.0.
+    """
+    motion_ts = np.ascontiguousarray(motion_ts, dtype=np.float64)
+    aligned = np.ascontiguousarray(aligned, dtype=np.float64)
+    prev_idx = np.empty(aligned.shape[0], dtype=np.int64)
+    next_idx = np.empty(aligned.shape[0], dtype=np.int64)
+    weight = np.empty(aligned.shape[0], dtype=np.float64)
+    _match_kernel(motion_ts, aligned, prev_idx, next_idx, weight)
+    return prev_idx, next_idx, weight
+
+if HAVE_NUMBA:
+    logger.debug("Numba matching kernels ready")
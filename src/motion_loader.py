@@ -1,24 +1,107 @@
 import json
 import logging
 import os
-import bisect
+import hashlib
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+def _parse_json(file_path):
+    """Reads and parses one JSON file, with orjson when it is installed."""
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+def _try_parse_json(file_path):
+    """_parse_json for worker threads: returns (data, error) instead of raising."""
+    try:
+        return _parse_json(file_path), None
+    except Exception as e:
+        return None, e
+
+def _unpack_rows(raw_rows, count):
+    """
+    Splits [x, y, z, qx, qy, qz, qw] rows into preallocated position/rotation arrays.
+    
+    Returns:
+        tuple: (positions (count, 3), rotations (count, 4))
+    """
+    try:
+        rows = np.asarray(raw_rows[:count], dtype=np.float64).reshape(count, -1)
+    except ValueError:
+        # Ragged rows; handled one by one below
+        rows = None
+    if rows is not None and rows.shape[1] >= 7:
+        # Common case: one conversion, then column slices
+        return rows[:, 0:3].copy(), rows[:, 3:7].copy()
+    
+    positions = np.empty((count, 3), dtype=np.float64)
+    rotations = np.empty((count, 4), dtype=np.float64)
+    for i in range(count):
+        p = raw_rows[i]
+        positions[i] = p[0:3] if len(p)>=3 else (0.0, 0.0, 0.0)
+        rotations[i] = p[3:7] if len(p)>=7 else (0.0, 0.0, 0.0, 1.0)
+    return positions, rotations
+
+def _normalize_quaternions(rotations):
+    """Scales (N, 4) quaternions to unit norm in place; all-zero rows are left as they are."""
+    norms = np.sqrt(np.einsum('ij,ij->i', rotations, rotations))
+    norms[norms == 0] = 1.0
+    rotations /= norms[:, None]
+    return rotations
+
+def _motion_files(dir_path):
+    """Motion JSON files of a directory in load order, skipping metadata/validation files."""
+    return sorted([os.path.join(dir_path, f) for f in os.listdir(dir_path) 
+                   if f.endswith('.json') and not f.endswith('metadata.json') and not f.endswith('validation.json')])
+
+# Bump when the cached array contents change meaning, to invalidate old entries
+CACHE_VERSION = 2
+
+def _cache_key(file_path):
+    """Hashes a file's path, size and modification time; any edit to the file changes the key."""
+    st = os.stat(file_path)
+    h = hashlib.blake2b(digest_size=8)
+    h.update(f"{CACHE_VERSION}|{os.path.abspath(file_path)}|{st.st_size}|{st.st_mtime_ns}".encode())
+    return h.hexdigest()
+
+def _source_key(file_path):
+    """Hashes only a file's path, so all cache entries of one input share a name prefix."""
+    return hashlib.blake2b(os.path.abspath(file_path).encode(), digest_size=4).hexdigest()
+
 class MotionLoader:
-    def __init__(self, json_path):
+    # Per-sample arrays, kept aligned with each other (Structure of Arrays)
+    ARRAY_FIELDS = ('timestamps', 'positions', 'rotations',
+                    'left_eye_positions', 'left_eye_rotations',
+                    'right_eye_positions', 'right_eye_rotations')
+    
+    def __init__(self, json_path, cache_dir=None, pose_dtype=np.float64):
         """
         Initializes the MotionLoader with a path to a JSON motion log or directory of logs.
         
+        Samples are stored as contiguous arrays: timestamps (N,), positions (N, 3) and
+        unit rotations (N, 4) [x, y, z, w] for the hand, and the same pair for each eye.
+        
         Args:
             json_path (str): Path to the JSON file or directory.
+            cache_dir (str): Optional directory for parsed arrays. Each unchanged input file is
+                             then loaded from <name>_<source>_<key>.npz instead of being parsed
+                             again; saving a new entry removes the stale ones of that file.
+            pose_dtype: dtype of the position/rotation arrays. np.float32 halves their memory;
+                        timestamps always stay float64.
         """
         self.json_path = json_path
-        self.timestamps = []
-        self.poses = []
-        self.left_eye_poses = []
-        self.right_eye_poses = []
+        self.cache_dir = cache_dir
+        self.pose_dtype = np.dtype(pose_dtype)
+        self._set_arrays(np.empty(0), *(np.empty((0, width), dtype=self.pose_dtype) for width in (3, 4, 3, 4, 3, 4)))
         
         if os.path.isdir(json_path):
             self.load_directory(json_path)
@@ -28,141 +111,226 @@ class MotionLoader:
             logger.error(f"Motion path not found: {json_path}")
             raise FileNotFoundError(f"Motion path not found: {json_path}")
 
+    def _with_pose_dtype(self, arrays):
+        """Casts the position/rotation arrays of one file (ARRAY_FIELDS order) to pose_dtype."""
+        return [arrays[0]] + [a.astype(self.pose_dtype, copy=False) for a in arrays[1:]]
+
+    def _cache_prefix(self, file_path):
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        return f"{name}_{_source_key(file_path)}_"
+
+    def _cache_path(self, file_path):
+        return os.path.join(self.cache_dir, f"{self._cache_prefix(file_path)}{_cache_key(file_path)}.npz")
+
+    def _load_cache(self, file_path):
+        """Returns the cached arrays of one input file, or None on a miss or without a cache_dir."""
+        if not self.cache_dir:
+            return None
+        cache_path = self._cache_path(file_path)
+        if not os.path.isfile(cache_path):
+            return None
+        try:
+            with np.load(cache_path) as cached:
+                arrays = [cached[name] for name in self.ARRAY_FIELDS]
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable motion cache {cache_path}: {e}")
+            return None
+        logger.info(f"Loaded {len(arrays[0])} poses for {file_path} from cache")
+        return arrays
+
+    def _save_cache(self, file_path, arrays):
+        """Writes one file's arrays to the cache (via a temp file, so readers never see a partial one)."""
+        cache_path = self._cache_path(file_path)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, **dict(zip(self.ARRAY_FIELDS, arrays)))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write motion cache {cache_path}: {e}")
+            return
+        self._remove_stale_cache(file_path, os.path.basename(cache_path))
+
+    def _remove_stale_cache(self, file_path, current):
+        """Deletes the older entries of one input file, which its new key can never hit again."""
+        prefix = self._cache_prefix(file_path)
+        for entry in os.listdir(self.cache_dir):
+            if entry.startswith(prefix) and entry.endswith('.npz') and entry != current:
+                try:
+                    os.remove(os.path.join(self.cache_dir, entry))
+                except OSError as e:
+                    logger.warning(f"Could not remove stale motion cache {entry}: {e}")
+
+    def _set_arrays(self, *arrays):
+        for name, array in zip(self.ARRAY_FIELDS, arrays):
+            setattr(self, name, array)
+        # Start of the last interval hit by a scalar lookup, see _cached_interval
+        self._last_idx = 0
+
+    def _cached_interval(self, timestamp):
+        """
+        Fast path for sequential scalar queries: returns i if ts[i] < timestamp < ts[i+1]
+        for the interval found by the previous lookup or the one after it, else None.
+        """
+        ts = self.timestamps
+        for i in (self._last_idx, self._last_idx + 1):
+            if i + 1 < len(ts) and ts[i] < timestamp < ts[i + 1]:
+                self._last_idx = i
+                return i
+        return None
+
+    def _get_arrays(self):
+        return [getattr(self, name) for name in self.ARRAY_FIELDS]
+
+    def _sort_by_time(self):
+        """Reorders all sample arrays by timestamp (stable, like sorted())."""
+        order = np.argsort(self.timestamps, kind='stable')
+        self._set_arrays(*(array[order] for array in self._get_arrays()))
+
     def load_directory(self, dir_path):
         """
         Loads all matching JSON files from a directory.
         """
         logger.info(f"Loading motion data from directory: {dir_path}")
-        files = sorted([os.path.join(dir_path, f) for f in os.listdir(dir_path) 
-                        if f.endswith('.json') and not f.endswith('metadata.json') and not f.endswith('validation.json')])
+        files = _motion_files(dir_path)
         
         if not files:
             logger.warning(f"No valid JSON motion files found in {dir_path}")
             return
 
-        for f in files:
+        # Only files without a cache entry are parsed
+        cached = [self._load_cache(f) for f in files]
+        to_parse = [f for f, arrays in zip(files, cached) if arrays is None]
+        
+        # File reads overlap across threads; parsed data is merged in file order
+        parsed = {}
+        if to_parse:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_parse))) as executor:
+                parsed = dict(zip(to_parse, executor.map(_try_parse_json, to_parse)))
+        
+        per_file = []
+        for f, arrays in zip(files, cached):
+            if arrays is not None:
+                per_file.append(self._with_pose_dtype(arrays))
+                continue
+            # Drop each file's decoded lists as soon as its arrays exist
+            data, error = parsed.pop(f)
+            if error is not None:
+                logger.error(f"Failed to load {f}: {error}")
+                continue
             try:
-                self.load_data(f, merge=True)
+                current = self._read_trajectory(f, data)
             except Exception as e:
                 logger.error(f"Failed to load {f}: {e}")
+                continue
+            if current is not None:
+                per_file.append(current)
         
-        # Sort combined data
-        if self.timestamps:
-             # Zip, sort, unzip
-             # Combine all lists that need sorting
-            combined = sorted(zip(self.timestamps, self.poses, self.left_eye_poses, self.right_eye_poses), key=lambda x: x[0])
-            
-            # Unzip
-            self.timestamps, self.poses, self.left_eye_poses, self.right_eye_poses = zip(*combined)
-            
-            # Convert back to lists
-            self.timestamps = list(self.timestamps)
-            self.poses = list(self.poses)
-            self.left_eye_poses = list(self.left_eye_poses)
-            self.right_eye_poses = list(self.right_eye_poses)
+        # One concatenation per field, then one stable argsort over the combined data
+        if per_file:
+            columns = zip(self._get_arrays(), *per_file)
+            self._set_arrays(*(np.concatenate(column) for column in columns))
+            self._sort_by_time()
             
-        logger.info(f"Total poses loaded: {len(self.poses)}")
+        logger.info(f"Total poses loaded: {len(self.timestamps)}")
 
-    def load_data(self, file_path, merge=False):
+    def load_data(self, file_path, merge=False, data=None):
         """
         Loads the JSON data and parses it.
         Args:
             file_path: Path to file.
-            merge: If true, extends existing lists instead of replacing.
+            merge: If true, extends existing arrays instead of replacing.
+            data: Already parsed contents of file_path, if available.
         """
-        logger.info(f"Loading motion data from {file_path}")
-        try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                
-            if 'trajectories' not in data or not data['trajectories']:
-                logger.warning(f"No trajectories found in JSON: {file_path}")
-                return
-
-            # Assume first trajectory is the main one for now
-            trajectory = data['trajectories'][0]
-            
-            if 'timestamps' not in trajectory or 'poses' not in trajectory:
-                logger.warning(f"Missing timestamps or poses in trajectory: {file_path}")
-                return
-            
-            # raw_timestamps are floats
-            current_timestamps = trajectory['timestamps']
-            raw_poses = trajectory['poses']
-            
-            if len(current_timestamps) != len(raw_poses):
-                logger.warning(f"Timestamp count ({len(current_timestamps)}) does not match pose count ({len(raw_poses)}). Truncating.")
-                min_len = min(len(current_timestamps), len(raw_poses))
-                current_timestamps = current_timestamps[:min_len]
-                raw_poses = raw_poses[:min_len]
-                
-            # Convert poses to structured format
-            current_poses = []
-            for p in raw_poses:
-                pose_dict = {
-                    "position": p[0:3] if len(p)>=3 else [0,0,0],
-                    "rotation": p[3:7] if len(p)>=7 else [0,0,0,1],
-                    "gripper": 0.0
-                }
-                current_poses.append(pose_dict)
-            
-            # Process Eye Poses if available
-            raw_left = trajectory.get('left_eye_poses', [])
-            raw_right = trajectory.get('right_eye_poses', [])
-            
-            current_left = []
-            for p in raw_left:
-                 current_left.append({
-                    "position": p[0:3] if len(p)>=3 else [0,0,0],
-                    "rotation": p[3:7] if len(p)>=7 else [0,0,0,1]
-                 })
-                 
-            current_right = []
-            for p in raw_right:
-                 current_right.append({
-                     "position": p[0:3] if len(p)>=3 else [0,0,0],
-                     "rotation": p[3:7] if len(p)>=7 else [0,0,0,1]
-                 })
-
-            # Pad eye poses if they are shorter than timestamps (though they should match)
-            # Actually, standardizing on minimal length is safer
-            min_len = min(len(current_timestamps), len(current_poses), len(current_left), len(current_right))
-            if len(current_left) != len(current_timestamps):
-                 # logger.warning(f"Eye pose count mismatch. Truncating to {min_len}")
-                 pass
+        current = self._read_trajectory(file_path, data)
+        if current is None:
+            return
             
-            current_timestamps = current_timestamps[:min_len]
-            current_poses = current_poses[:min_len]
-            current_left = current_left[:min_len]
-            current_right = current_right[:min_len]
+        if merge:
+            self._set_arrays(*(np.concatenate([old, new]) for old, new in zip(self._get_arrays(), current)))
+        else:
+            self._set_arrays(*current)
             
-            if merge:
-                self.timestamps.extend(current_timestamps)
-                self.poses.extend(current_poses)
-                self.left_eye_poses.extend(current_left)
-                self.right_eye_poses.extend(current_right)
-            else:
-                self.timestamps = current_timestamps
-                self.poses = current_poses
-                self.left_eye_poses = current_left
-                self.right_eye_poses = current_right
+            # Check monotonicity only if not merging (merging sorts at the end)
+            if not np.all(np.diff(self.timestamps) >= 0):
+                logger.warning("Timestamps are not strictly sorted. Sorting now.")
+                self._sort_by_time()
                 
-                # Check monotonicity only if not merging (merging sorts at the end)
-                if not all(self.timestamps[i] <= self.timestamps[i+1] for i in range(len(self.timestamps)-1)):
-                    logger.warning("Timestamps are not strictly sorted. Sorting now.")
-                    combined = sorted(zip(self.timestamps, self.poses, self.left_eye_poses, self.right_eye_poses), key=lambda x: x[0])
-                    self.timestamps, self.poses, self.left_eye_poses, self.right_eye_poses = zip(*combined)
-                    self.timestamps = list(self.timestamps)
-                    self.poses = list(self.poses)
-                    self.left_eye_poses = list(self.left_eye_poses)
-                    self.right_eye_poses = list(self.right_eye_poses)
-                    
-            if not merge:
-                logger.info(f"Loaded {len(self.poses)} poses.")
+            logger.info(f"Loaded {len(self.timestamps)} poses.")
 
+    def _read_trajectory(self, file_path, data=None):
+        """
+        Parses the first trajectory of a motion JSON into arrays, in ARRAY_FIELDS order.
+        Uses and fills the per-file cache when a cache_dir is set.
+        
+        Returns:
+            list: Arrays for one file, or None if it has no usable trajectory.
+        """
+        if data is None:
+            # (load_directory checks the cache itself before parsing)
+            cached = self._load_cache(file_path)
+            if cached is not None:
+                return self._with_pose_dtype(cached)
+        
+        logger.info(f"Loading motion data from {file_path}")
+        try:
+            if data is None:
+                data = _parse_json(file_path)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to decode JSON {file_path}: {e}")
             raise
+            
+        if 'trajectories' not in data or not data['trajectories']:
+            logger.warning(f"No trajectories found in JSON: {file_path}")
+            return None
+
+        # Assume first trajectory is the main one for now
+        trajectory = data['trajectories'][0]
+        
+        if 'timestamps' not in trajectory or 'poses' not in trajectory:
+            logger.warning(f"Missing timestamps or poses in trajectory: {file_path}")
+            return None
+        
+        # raw_timestamps are floats
+        current_timestamps = trajectory['timestamps']
+        raw_poses = trajectory['poses']
+        
+        if len(current_timestamps) != len(raw_poses):
+            logger.warning(f"Timestamp count ({len(current_timestamps)}) does not match pose count ({len(raw_poses)}). Truncating.")
+            
+        # Eye poses should match the timestamps; standardizing on minimal length is safer
+        raw_left = trajectory.get('left_eye_poses', [])
+        raw_right = trajectory.get('right_eye_poses', [])
+        min_len = min(len(current_timestamps), len(raw_poses), len(raw_left), len(raw_right))
+        
+        # Convert rows straight into the array layout; rotations are stored as unit quaternions
+        current = [np.asarray(current_timestamps[:min_len], dtype=np.float64).reshape(-1)]
+        for raw_rows in (raw_poses, raw_left, raw_right):
+            positions, rotations = _unpack_rows(raw_rows, min_len)
+            current.extend((positions, _normalize_quaternions(rotations)))
+        
+        if self.cache_dir:
+            self._save_cache(file_path, current)
+        return self._with_pose_dtype(current)
+
+    def _sample(self, idx):
+        """Builds the legacy dict view {'pose', 'left_eye', 'right_eye'} of one sample."""
+        return {
+            "pose": {
+                "position": self.positions[idx].tolist(),
+                "rotation": self.rotations[idx].tolist(),
+                "gripper": 0.0
+            },
+            "left_eye": {
+                "position": self.left_eye_positions[idx].tolist(),
+                "rotation": self.left_eye_rotations[idx].tolist()
+            },
+            "right_eye": {
+                "position": self.right_eye_positions[idx].tolist(),
+                "rotation": self.right_eye_rotations[idx].tolist()
+            }
+        }
 
     def get_time_range(self):
         """
@@ -171,9 +339,9 @@ class MotionLoader:
         Returns:
             tuple: (min_timestamp, max_timestamp) or (None, None) if empty.
         """
-        if not self.timestamps:
+        if not len(self.timestamps):
             return None, None
-        return self.timestamps[0], self.timestamps[-1]
+        return float(self.timestamps[0]), float(self.timestamps[-1])
 
     def get_pose_at_timestamp(self, timestamp, tolerance=0.0):
         """
@@ -186,39 +354,55 @@ class MotionLoader:
         Returns:
             dict: Pose object or None.
         """
-        if not self.timestamps:
+        n = len(self.timestamps)
+        if not n:
             return None
             
-        idx = bisect.bisect_left(self.timestamps, timestamp)
+        i = self._cached_interval(timestamp)
+        if i is not None:
+            lo, hi = i, i + 1
+        else:
+            idx = int(np.searchsorted(self.timestamps, timestamp))
+            lo = max(idx - 1, 0)
+            hi = min(idx, n - 1)
+            self._last_idx = lo
         
-        # idx is where timestamp could be inserted. 
-        # Check idx and idx-1 for closest match
+        # Closest of the two candidates; the later sample wins ties
+        diff_lo = abs(self.timestamps[lo] - timestamp)
+        diff_hi = abs(self.timestamps[hi] - timestamp)
+        best, diff = (lo, diff_lo) if diff_lo < diff_hi else (hi, diff_hi)
+        if tolerance > 0 and diff > tolerance:
+            return None
+        return self._sample(best)
+
+    def get_nearest_indices(self, timestamps, tolerance=0.0):
+        """
+        Vectorized get_pose_at_timestamp: index of the closest sample for many timestamps.
         
-        candidates = []
-        if idx < len(self.timestamps):
-            candidates.append(idx)
-        if idx > 0:
-            candidates.append(idx - 1)
+        Args:
+            timestamps (array-like): Timestamps to query.
+            tolerance (float): Max difference allowed; 0.0 accepts the closest sample at any distance.
             
-        best_idx = -1
-        min_diff = float('inf')
-        
-        for i in candidates:
-            diff = abs(self.timestamps[i] - timestamp)
-            if diff < min_diff:
-                min_diff = diff
-                best_idx = i
-                
-        if best_idx != -1:
-            if tolerance > 0 and min_diff > tolerance:
-                return None
-            return {
-                "pose": self.poses[best_idx],
-                "left_eye": self.left_eye_poses[best_idx] if best_idx < len(self.left_eye_poses) else None,
-                "right_eye": self.right_eye_poses[best_idx] if best_idx < len(self.right_eye_poses) else None
-            }
+        Returns:
+            np.ndarray: int indices, -1 where there is no sample within tolerance.
+        """
+        query = np.asarray(timestamps, dtype=np.float64)
+        n = len(self.timestamps)
+        if not n:
+            return np.full(query.shape, -1, dtype=np.int64)
             
-        return None
+        # Candidates are the first sample >= t and the one before it; ties go to the later one
+        idx = np.searchsorted(self.timestamps, query, side='left')
+        after = np.minimum(idx, n - 1)
+        before = np.maximum(idx - 1, 0)
+        diff_after = np.where(idx < n, np.abs(self.timestamps[after] - query), np.inf)
+        diff_before = np.where(idx > 0, np.abs(self.timestamps[before] - query), np.inf)
+        
+        use_before = diff_before < diff_after
+        best = np.where(use_before, before, after)
+        if tolerance > 0:
+            best = np.where(np.minimum(diff_before, diff_after) <= tolerance, best, -1)
+        return best
 
     def get_surrounding_poses(self, timestamp):
         """
@@ -230,46 +414,90 @@ class MotionLoader:
         Returns:
             tuple: ( (prev_time, prev_pose), (next_time, next_pose) )
                    Returns None for a side if out of bounds.
+                   On an exact match both sides are that sample.
         """
-        if not self.timestamps:
-            return None, None
-            
-        idx = bisect.bisect_left(self.timestamps, timestamp)
+        i = self._cached_interval(timestamp)
+        if i is not None:
+            prev_idx, next_idx = i, i + 1
+        else:
+            prev_idx, next_idx = self.get_surrounding_indices([timestamp])
+            prev_idx = int(prev_idx[0])
+            next_idx = int(next_idx[0])
+            self._last_idx = max(prev_idx, 0)
         
         prev_data = None
         next_data = None
+        if prev_idx >= 0:
+            prev_data = (float(self.timestamps[prev_idx]), self._sample(prev_idx))
+        if next_idx >= 0:
+            next_data = (float(self.timestamps[next_idx]), self._sample(next_idx))
+            
+        return prev_data, next_data
+
+    def get_surrounding_indices(self, timestamps):
+        """
+        Vectorized get_surrounding_poses: bracketing sample indices for many timestamps.
         
-        # idx points to the first element >= timestamp
-        
-        # If timestamp is exactly at idx
-        if idx < len(self.timestamps) and self.timestamps[idx] == timestamp:
-            # Exact match. Both prev and next could be this? Or strictly surrounding?
-            # Usually for interpolation, if t == t_i, we just return that.
-            # But strictly speaking, "surrounding" implies t_i <= t <= t_{i+1}
-            # Let's return the interval [t_{idx}, t_{idx+1}] if exists, or [t_{idx-1}, t_{idx}]?
-            # Standard: return lower and upper bound.
-            # Standard: return lower and upper bound.
-            curr = (self.timestamps[idx], {
-                "pose": self.poses[idx],
-                "left_eye": self.left_eye_poses[idx],
-                "right_eye": self.right_eye_poses[idx]
-            })
-            return curr, curr
-
-        # If we are here, timestamp < self.timestamps[idx] (if idx valid)
+        Args:
+            timestamps (array-like): Timestamps to query.
+            
+        Returns:
+            tuple: (prev_idx, next_idx) int arrays. Both point at the same sample on an
+                   exact match; a side that is out of bounds is -1.
+        """
+        query = np.asarray(timestamps, dtype=np.float64)
+        if not len(self.timestamps):
+            missing = np.full(query.shape, -1, dtype=np.int64)
+            return missing, missing.copy()
+            
+        motion_ts = self.timestamps
+        n = len(motion_ts)
+        idx = np.searchsorted(motion_ts, query, side='left')
         
-        if idx < len(self.timestamps):
-            next_data = (self.timestamps[idx], {
-                "pose": self.poses[idx],
-                "left_eye": self.left_eye_poses[idx],
-                "right_eye": self.right_eye_poses[idx]
-            })
+        exact = (idx < n) & (motion_ts[np.minimum(idx, n - 1)] == query)
+        prev_idx = np.where(exact, idx, idx - 1)
+        next_idx = np.where(idx < n, idx, -1)
+        return prev_idx, next_idx
+
+    def get_surrounding_batch(self, timestamps):
+        """
+        get_surrounding_indices plus the bracketing timestamps and interpolation weights.
         
-        if idx > 0:
-            prev_data = (self.timestamps[idx-1], {
-                "pose": self.poses[idx-1],
-                "left_eye": self.left_eye_poses[idx-1],
-                "right_eye": self.right_eye_poses[idx-1]
-            })
+        Args:
+            timestamps (array-like): Timestamps to query.
             
-        return prev_data, next_data
+        Returns:
+            tuple: (prev_idx, next_idx, prev_ts, next_ts, weight) arrays. prev_ts/next_ts are
+                   NaN where a side is out of bounds; weight is 0.0 there and on exact matches.
+        """
+        query = np.asarray(timestamps, dtype=np.float64)
+        prev_idx, next_idx = self.get_surrounding_indices(query)
+        
+        prev_ts = np.full(query.shape, np.nan)
+        next_ts = np.full(query.shape, np.nan)
+        has_prev = prev_idx >= 0
+        has_next = next_idx >= 0
+        prev_ts[has_prev] = self.timestamps[prev_idx[has_prev]]
+        next_ts[has_next] = self.timestamps[next_idx[has_next]]
+        
+        interval = next_ts - prev_ts
+        valid = has_prev & has_next & (interval > 0)
+        weight = np.zeros(query.shape)
+        weight[valid] = (query[valid] - prev_ts[valid]) / interval[valid]
+        return prev_idx, next_idx, prev_ts, next_ts, weight
+
+    def as_arrays(self):
+        """
+        Returns the loaded sample arrays grouped by body part for vectorized consumers.
+        The arrays are the loader's own storage, not copies.
+        
+        Returns:
+            dict: 'timestamps' (N,) and, for each of 'pose', 'left_eye', 'right_eye',
+                  a tuple (positions (N, 3), rotations (N, 4)).
+        """
+        return {
+            'timestamps': self.timestamps,
+            'pose': (self.positions, self.rotations),
+            'left_eye': (self.left_eye_positions, self.left_eye_rotations),
+            'right_eye': (self.right_eye_positions, self.right_eye_rotations)
+        }
@@ -0,0 +1,185 @@
+import math
+import logging
+import numpy as np
+
+from .interp_kernels import UNIT_NORM_TOLERANCE
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+HAVE_NUMBA = njit is not None
+
+if HAVE_NUMBA:
+    # No fastmath: the results must match the NumPy projection bit for bit, since
+    # they are rounded to pixels and a last-ulp difference can move a line end
+    @njit(cache=True, parallel=True)
+    def _gizmo_kernel(pos, rot_m, cam_pos, cam_rot, axis_length, fx, fy, cx, cy,
+                      width, height, uv_out, visible_out):
+        for i in prange(pos.shape[0]):
+            # Inverse camera rotation, normalized like Rotation.from_quat
+            qx, qy, qz, qw = cam_rot[i, 0], cam_rot[i, 1], cam_rot[i, 2], cam_rot[i, 3]
+            sq_norm = qx * qx + qy * qy + qz * qz + qw * qw
+            scale = 1.0 / math.sqrt(sq_norm) if abs(sq_norm - 1.0) > UNIT_NORM_TOLERANCE else 1.0
+            sign = -scale
+            qx, qy, qz, qw = qx * sign, qy * sign, qz * sign, qw * scale
+
+            # Origin, then the X, Y, Z axis ends (columns of the pose rotation matrix)
+            for k in range(4):
+                px, py, pz = pos[i, 0], pos[i, 1], pos[i, 2]
+                if k > 0:
+                    px = px + rot_m[i, 0, k - 1] * axis_length
+                    py = py + rot_m[i, 1, k - 1] * axis_length
+                    pz = pz + rot_m[i, 2, k - 1] * axis_length
+                vx = px - cam_pos[i, 0]
+                vy = py - cam_pos[i, 1]
+                vz = pz - cam_pos[i, 2]
+
+                # v + w*t + u x t with t = 2 u x v
+                tx = 2.0 * (qy * vz - qz * vy)
+                ty = 2.0 * (qz * vx - qx * vz)
+                tz = 2.0 * (qx * vy - qy * vx)
+                x = vx + qw * tx + (qy * tz - qz * ty)
+                y = vy + qw * ty + (qz * tx - qx * tz)
+                z = vz + qw * tz + (qx * ty - qy * tx)
+
+                if z <= 0.1:
+                    # Behind the camera: culled and zeroed
+                    uv_out[i, k, 0] = 0
+                    uv_out[i, k, 1] = 0
+                    visible_out[i, k] = False
+                    continue
+
+                # Flip Y for OpenCV convention (Screen Y is down), folded into -fy
+                u = int(np.rint((x * fx + cx * z) / z))
+                v = int(np.rint((y * -fy + cy * z) / z))
+                uv_out[i, k, 0] = u
+                uv_out[i, k, 1] = v
+                visible_out[i, k] = 0 <= u < width and 0 <= v < height
+
+    @njit(cache=True)
+    def _rotate_kernel(q, vs, out):
+        # Rotation normalized like Rotation.from_quat, then v + w*t + u x t with t = 2 u x v
+        qx, qy, qz, qw = q[0], q[1], q[2], q[3]
+        # Summed in the pairwise order np.einsum uses, so the gate and scale match _quat_rotate
+        sq_norm = (qx * qx + qz * qz) + (qy * qy + qw * qw)
+        scale = 1.0 / math.sqrt(sq_norm) if abs(sq_norm - 1.0) > UNIT_NORM_TOLERANCE else 1.0
+        qx, qy, qz, qw = qx * scale, qy * scale, qz * scale, qw * scale
+        for i in range(vs.shape[0]):
+            vx, vy, vz = vs[i, 0], vs[i, 1], vs[i, 2]
+            tx = 2.0 * (qy * vz - qz * vy)
+            ty = 2.0 * (qz * vx - qx * vz)
+            tz = 2.0 * (qx * vy - qy * vx)
+            out[i, 0] = vx + qw * tx + (qy * tz - qz * ty)
+            out[i, 1] = vy + qw * ty + (qz * tx - qx * tz)
+            out[i, 2] = vz + qw * tz + (qx * ty - qy * tx)
+
+    @njit(cache=True)
+    def _camera_points_kernel(pts, R_cw, t, fx, fy, cx, cy, width, height, check_bounds,
+                              uv_out, visible_out):
+        for i in range(pts.shape[0]):
+            vx = pts[i, 0] - t[0]
+            vy = pts[i, 1] - t[1]
+            vz = pts[i, 2] - t[2]
+            
+            # Row vector times R_cw, summed in the same order as the NumPy path
+            x = vx * R_cw[0, 0] + vy * R_cw[1, 0] + vz * R_cw[2, 0]
+            y = vx * R_cw[0, 1] + vy * R_cw[1, 1] + vz * R_cw[2, 1]
+            z = vx * R_cw[0, 2] + vy * R_cw[1, 2] + vz * R_cw[2, 2]
+            
+            if z <= 0.1:
+                # Behind the camera: culled and zeroed
+                uv_out[i, 0] = 0
+                uv_out[i, 1] = 0
+                visible_out[i] = False
+                continue
+            
+            # Flip Y for OpenCV convention (Screen Y is down), folded into -fy
+            u = int(np.rint((x * fx + cx * z) / z))
+            v = int(np.rint((y * -fy + cy * z) / z))
+            uv_out[i, 0] = u
+            uv_out[i, 1] = v
+            visible_out[i] = not check_bounds or (0 <= u < width and 0 <= v < height)
+
+def project_camera_points_jit(points, R_cw, t, fx, fy, cx, cy, width, height, check_bounds=True):
+    """
+    Numba version of Visualizer.project_points_from_camera: the camera transform,
+    cull, projection and bounds check fused in one loop, for the few points drawn
+    per frame where NumPy's per-call overhead dominates.
+    
+    Args:
+        points (np.ndarray): (N, 3) points in World Space.
+        R_cw (np.ndarray): (3, 3) matrix, camera-frame points are (p - t) @ R_cw.
+        t (np.ndarray): (3,) camera position.
+        fx, fy, cx, cy (float): Camera intrinsics.
+        width, height (int): Frame size for the bounds check.
+        check_bounds (bool): If True, points outside the frame are marked invisible.
+        
+    Returns:
+        tuple: ((N, 2) int64 pixel coordinates, (N,) bool visibility mask).
+    """
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    uv = np.empty((points.shape[0], 2), dtype=np.int64)
+    visible = np.empty(points.shape[0], dtype=np.bool_)
+    _camera_points_kernel(points, np.ascontiguousarray(R_cw, dtype=np.float64),
+                          np.ascontiguousarray(t, dtype=np.float64),
+                          float(fx), float(fy), float(cx), float(cy),
+                          int(width), int(height), bool(check_bounds), uv, visible)
+    return uv, visible
+
+def rotate_vectors_jit(q, vectors):
+    """
+    Numba version of visualizer._quat_rotate for one quaternion and a few vectors,
+    e.g. the three gizmo axes, where NumPy's per-call overhead dominates.
+    
+    Args:
+        q (array-like): (4,) rotation [x, y, z, w]; normalized like from_quat.
+        vectors (np.ndarray): (N, 3) vectors.
+        
+    Returns:
+        np.ndarray: (N, 3) rotated vectors.
+    """
+    vectors = np.ascontiguousarray(vectors, dtype=np.float64)
+    out = np.empty_like(vectors)
+    _rotate_kernel(np.ascontiguousarray(q, dtype=np.float64), vectors, out)
+    return out
+
+def project_gizmos_jit(positions, rot_matrices, cam_positions, cam_rotations, axis_length,
+                       fx, fy, cx, cy, width, height):
+    """
+    Numba version of the projection in Visualizer.project_gizmos: origin and axis ends
+    of every pose are rotated, projected and bounds-checked in one fused pass.
+
+    Args:
+        positions (np.ndarray): (N, 3) pose positions, calibration already applied.
+        rot_matrices (np.ndarray): (N, 3, 3) pose rotation matrices.
+        cam_positions (np.ndarray): (N, 3) camera positions.
+        cam_rotations (np.ndarray): (N, 4) camera rotations [x, y, z, w].
+        axis_length (float): Length of axes in meters.
+        fx, fy, cx, cy (float): Camera intrinsics.
+        width, height (int): Frame size for the bounds check.
+
+    Returns:
+        tuple: ((N, 4, 2) int64 pixel coordinates, (N, 4) bool visibility), origin first.
+    """
+    n = len(positions)
+    uv = np.empty((n, 4, 2), dtype=np.int64)
+    visible = np.empty((n, 4), dtype=np.bool_)
+    _gizmo_kernel(np.ascontiguousarray(positions, dtype=np.float64),
+                  np.ascontiguousarray(rot_matrices, dtype=np.float64),
+                  np.ascontiguousarray(cam_positions, dtype=np.float64),
+                  np.ascontiguousarray(cam_rotations, dtype=np.float64),
+                  float(axis_length), float(fx), float(fy), float(cx), float(cy),
+                  int(width), int(height), uv, visible)
+    return uv, visible
+
+if HAVE_NUMBA:
+    # Compile (or load from cache) at import so the first real call is not slowed down
+    project_gizmos_jit(np.zeros((1, 3)), np.eye(3)[None], np.zeros((1, 3)), np.array([[0.0, 0.0, 0.0, 1.0]]),
+                       0.1, 1.0, 1.0, 0.0, 0.0, 1, 1)
+    rotate_vectors_jit(np.array([0.0, 0.0, 0.0, 1.0]), np.eye(3))
+    project_camera_points_jit(np.zeros((1, 3)), np.eye(3), np.zeros(3), 1.0, 1.0, 0.0, 0.0, 1, 1)
+    logger.debug("Numba gizmo projection kernels ready")
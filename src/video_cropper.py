@@ -2,19 +2,65 @@ import cv2
 import os
 import logging
 import json
+import shutil
+import subprocess
 from pathlib import Path
 
+from .video_loader import open_capture
+from .video_writer import open_video_writer
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Setup logger
 logger = logging.getLogger(__name__)
 
+def _timestamp_bounds(json_path):
+    """
+    Reads the first and last entry of trajectories[0].timestamps from a motion JSON.
+    
+    With ijson the file is streamed and nothing but those two numbers is built, instead
+    of materializing every pose as Python objects; parsing stops after the first trajectory.
+    
+    Returns:
+        tuple: (has_trajectory, first_ts, last_ts), the timestamps None if there are none.
+    """
+    if ijson is None:
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+        if 'trajectories' not in data or not data['trajectories']:
+            return False, None, None
+        timestamps = data['trajectories'][0].get('timestamps')
+        if not timestamps:
+            return True, None, None
+        return True, timestamps[0], timestamps[-1]
+    
+    has_trajectory = False
+    first_ts = last_ts = None
+    with open(json_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == 'trajectories.item':
+                if event == 'end_map':
+                    break
+                has_trajectory = True
+            elif prefix == 'trajectories.item.timestamps.item':
+                if first_ts is None:
+                    first_ts = value
+                last_ts = value
+    return has_trajectory, first_ts, last_ts
+
 class VideoCropper:
-    def __init__(self, video_path, output_dir):
+    def __init__(self, video_path, output_dir, hwaccel=True):
         """
         Initializes the VideoCropper.
         
         Args:
             video_path (str): Path to the source video file.
             output_dir (str): Directory where cropped videos will be saved.
+            hwaccel (bool): Decode with any available hardware decoder when clips have to
+                            be re-encoded (falls back to software decoding).
         """
         self.video_path = video_path
         self.output_dir = output_dir
@@ -26,7 +72,7 @@ class VideoCropper:
             os.makedirs(output_dir)
             
         # Get Video Metadata
-        self.cap = cv2.VideoCapture(video_path)
+        self.cap = open_capture(video_path, hwaccel)
         if not self.cap.isOpened():
             raise IOError(f"Could not open video file: {video_path}")
             
@@ -66,25 +112,46 @@ class VideoCropper:
             logger.warning(f"No valid JSON files found in {motion_dir}")
             return
 
-        for json_path in files:
-            self.process_single_file(json_path)
+        clips = [clip for clip in (self._clip_for_file(json_path) for json_path in files) if clip is not None]
+        
+        # Stream-copied clips need no decoding; the rest share one decode pass
+        pending = []
+        for start_ms, end_ms, output_path in clips:
+            logger.info(f"Writing clip: {output_path} (Time {start_ms:.1f}ms - {end_ms:.1f}ms)")
+            if not self._copy_clip_by_time(start_ms, end_ms, output_path):
+                pending.append((start_ms, end_ms, output_path))
+        if pending:
+            try:
+                self._reencode_clips(pending)
+            except Exception as e:
+                logger.error(f"Error re-encoding clips: {e}")
 
     def process_single_file(self, json_path):
+        clip = self._clip_for_file(json_path)
+        if clip is None:
+            return
+        try:
+            self._write_clip_by_time(*clip)
+        except Exception as e:
+            logger.error(f"Error processing {json_path}: {e}")
+
+    def _clip_for_file(self, json_path):
+        """
+        Computes the clip covering one motion file.
+        
+        Returns:
+            tuple: (start_ms, end_ms, output_path) relative to the video start, or None if skipped.
+        """
         try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
+            has_trajectory, motion_start_ts, motion_end_ts = _timestamp_bounds(json_path)
                 
-            if 'trajectories' not in data or not data['trajectories']:
+            if not has_trajectory:
                 logger.warning(f"Skipping {os.path.basename(json_path)}: No trajectories.")
                 return
                 
-            traj = data['trajectories'][0]
-            if not traj.get('timestamps'):
+            if motion_start_ts is None:
                 logger.warning(f"Skipping {os.path.basename(json_path)}: No timestamps.")
                 return
-
-            motion_start_ts = traj['timestamps'][0]
-            motion_end_ts = traj['timestamps'][-1]
             
             # Calculate offset from video start
             start_offset = motion_start_ts - self.video_start_ts
@@ -111,43 +178,128 @@ class VideoCropper:
             output_path = os.path.join(self.output_dir, f"{json_name}.mp4")
             
             # Use timestamp-based cropping to handle VFR
-            self._write_clip_by_time(start_offset * 1000.0, end_offset * 1000.0, output_path)
+            return start_offset * 1000.0, end_offset * 1000.0, output_path
             
         except Exception as e:
             logger.error(f"Error processing {json_path}: {e}")
+            return None
 
     def _write_clip_by_time(self, start_ms, end_ms, output_path):
         logger.info(f"Writing clip: {output_path} (Time {start_ms:.1f}ms - {end_ms:.1f}ms)")
         
+        if self._copy_clip_by_time(start_ms, end_ms, output_path):
+            return
+        self._reencode_clips([(start_ms, end_ms, output_path)])
+
+    def _copy_clip_by_time(self, start_ms, end_ms, output_path):
+        """
+        Cuts the clip with an ffmpeg stream copy: no decode, no re-encode, no quality loss.
+        
+        Input seeking starts the copy at the keyframe before start_ms; the MP4 edit list
+        written by ffmpeg hides the pre-roll frames, so playback still starts at start_ms.
+        Only the video stream is kept, like the re-encoding path.
+        
+        Returns:
+            bool: True if ffmpeg wrote the clip, False if ffmpeg is missing or failed.
+        """
+        ffmpeg_path = shutil.which('ffmpeg')
+        if not ffmpeg_path:
+            return False
+        
+        cmd = [
+            ffmpeg_path, '-hide_banner', '-loglevel', 'error', '-y',
+            '-ss', f'{start_ms / 1000.0:.3f}', '-i', self.video_path,
+            '-t', f'{(end_ms - start_ms) / 1000.0:.3f}',
+            '-map', '0:v:0', '-c', 'copy',
+            output_path
+        ]
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        except OSError as e:
+            logger.warning(f"ffmpeg stream copy failed ({e}), re-encoding instead")
+            return False
+        if result.returncode != 0:
+            logger.warning(f"ffmpeg stream copy failed ({result.stderr.decode(errors='replace').strip()}), re-encoding instead")
+            return False
+        
+        logger.info("Clip saved (stream copy).")
+        return True
+
+    def _reencode_clips(self, clips):
+        """
+        Decodes the source once and re-encodes the frames of every clip, with a hardware
+        H.264 encoder when one is available (see open_video_writer).
+        
+        Frames are read in a single forward sweep from the earliest clip start and sent to
+        every clip whose [start_ms, end_ms] covers them, instead of seeking once per clip.
+        A clip's writer is opened when the sweep reaches its start and released as soon as
+        the sweep passes its end, so only the clips covering the current frame hold an encoder.
+        
+        Args:
+            clips (list): (start_ms, end_ms, output_path) tuples.
+        """
         width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         
-        # mp4v for compatibility
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(output_path, fourcc, self.fps, (width, height))
-        
-        # Seek to slightly before start to ensure we don't miss the first frame
-        # (Seeking might land on IFRAME)
-        seek_to = max(0, start_ms - 2000) 
-        self.cap.set(cv2.CAP_PROP_POS_MSEC, seek_to)
-        
-        # Scan forward
-        frames_written = 0
-        while True:
-            ret, frame = self.cap.read()
-            if not ret:
-                break
-                
-            current_ms = self.cap.get(cv2.CAP_PROP_POS_MSEC)
+        clips = sorted(clips)
+        writers = [None] * len(clips)
+        frames_written = [0] * len(clips)
+        done = [False] * len(clips)
+        
+        def finish(i):
+            # A clip that never got a frame still gets its (empty) file, like before
+            if writers[i] is None:
+                writers[i] = open_video_writer(clips[i][2], self.fps, width, height)
+            writers[i].release()
+            writers[i] = None
+            done[i] = True
+            logger.info(f"Clip saved: {clips[i][2]}. Written {frames_written[i]} frames.")
+        
+        try:
+            # Seek to slightly before start to ensure we don't miss the first frame
+            # (Seeking might land on IFRAME)
+            seek_to = max(0, clips[0][0] - 2000) 
+            self.cap.set(cv2.CAP_PROP_POS_MSEC, seek_to)
+            last_end_ms = max(end_ms for _, end_ms, _ in clips)
             
-            # Check range
-            if current_ms < start_ms:
-                continue
-            if current_ms > end_ms:
-                break
+            # Scan forward
+            first_open = 0
+            while first_open < len(clips):
+                ret, frame = self.cap.read()
+                if not ret:
+                    break
+                    
+                current_ms = self.cap.get(cv2.CAP_PROP_POS_MSEC)
+                if current_ms > last_end_ms:
+                    break
                 
-            out.write(frame)
-            frames_written += 1
+                # Clips are sorted by start, so the ones covering this frame start at or after first_open
+                for i in range(first_open, len(clips)):
+                    start_ms, end_ms, output_path = clips[i]
+                    if start_ms > current_ms:
+                        break
+                    if done[i]:
+                        continue
+                    if current_ms <= end_ms:
+                        if writers[i] is None:
+                            writers[i] = open_video_writer(output_path, self.fps, width, height)
+                        writers[i].write(frame)
+                        frames_written[i] += 1
+                    else:
+                        finish(i)
+                while first_open < len(clips) and done[first_open]:
+                    first_open += 1
             
-        out.release()
-        logger.info(f"Clip saved. Written {frames_written} frames.")
+            # End of the video or of the last clip: close whatever is still open
+            for i in range(len(clips)):
+                if not done[i]:
+                    finish(i)
+        finally:
+            # Only reached with open writers on an error: release them (and any ffmpeg pipes)
+            for i, out in enumerate(writers):
+                if out is not None:
+                    try:
+                        out.release()
+                    except Exception as e:
+                        logger.debug(f"Releasing {clips[i][2]} failed: {e}")
+                    logger.warning(f"Clip incomplete: {clips[i][2]} ({frames_written[i]} frames written)")
@@ -3,22 +3,54 @@ import logging
 import os
 import numpy as np
 
+try:
+    import av
+except ImportError:
+    av = None
+
 logger = logging.getLogger(__name__)
 
+def open_capture(video_path, hwaccel=False):
+    """
+    Opens a cv2.VideoCapture, optionally with FFmpeg hardware decoding.
+    
+    Args:
+        video_path (str): Path to the video file.
+        hwaccel (bool): Let the FFmpeg backend use any available hardware decoder
+                        (NVDEC/QSV/VAAPI). Falls back to software decoding if the
+                        hardware path cannot open the file.
+        
+    Returns:
+        cv2.VideoCapture: The capture; check isOpened().
+    """
+    if hwaccel:
+        # Acceleration has to be requested at open time; setting it afterwards has no effect
+        # (an explicit CAP_PROP_HW_DEVICE is rejected together with VIDEO_ACCELERATION_ANY)
+        cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [
+            cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY
+        ])
+        if cap.isOpened():
+            return cap
+        logger.warning(f"Hardware-accelerated open failed, using software decoding: {video_path}")
+    return cv2.VideoCapture(video_path)
+
 class VideoLoader:
-    def __init__(self, video_path):
+    def __init__(self, video_path, hwaccel=False):
         """
         Initializes the VideoLoader with a path to a video file.
         
         Args:
             video_path (str): Path to the video file.
+            hwaccel (bool): Open with the FFmpeg backend and let it use any available
+                            hardware decoder (NVDEC/QSV/VAAPI). Falls back to software
+                            decoding if the hardware path cannot open the file.
         """
         self.video_path = video_path
         if not os.path.exists(video_path):
             logger.error(f"Video file not found: {video_path}")
             raise FileNotFoundError(f"Video file not found: {video_path}")
             
-        self.cap = cv2.VideoCapture(video_path)
+        self.cap = open_capture(video_path, hwaccel)
         if not self.cap.isOpened():
             logger.error(f"Could not open video file: {video_path}")
             raise IOError(f"Could not open video file: {video_path}")
@@ -61,11 +93,12 @@ class VideoLoader:
         Extracts precise timestamps for each frame in the video.
         
         Returns:
-            list: List of timestamps in milliseconds.
+            np.ndarray: (N,) float64 timestamps in milliseconds.
         """
-        timestamps = []
-        frame_idx = 0
         total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        # The container frame count is only an estimate; grow if it is short
+        timestamps = np.empty(max(total_frames, 0) + 16, dtype=np.float64)
+        frame_idx = 0
         
         # Reset to beginning
         self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
@@ -76,14 +109,46 @@ class VideoLoader:
             ret = self.cap.grab()
             if not ret:
                 break
-                
-            timestamp = self.cap.get(cv2.CAP_PROP_POS_MSEC)
-            timestamps.append(timestamp)
-            frame_idx += 1
             
+            if frame_idx == len(timestamps):
+                timestamps = np.concatenate([timestamps, np.empty(len(timestamps), dtype=np.float64)])
+            timestamps[frame_idx] = self.cap.get(cv2.CAP_PROP_POS_MSEC)
+            frame_idx += 1
+        
+        timestamps = timestamps[:frame_idx].copy()
         logger.info(f"Extracted timestamps for {len(timestamps)} frames.")
         return timestamps
 
+    def extract_frame_timestamps_fast(self):
+        """
+        Same timestamps as extract_frame_timestamps, read from the container without decoding.
+        
+        Presentation timestamps are taken from the demuxed packets with PyAV, which is
+        orders of magnitude faster than grabbing every frame. Packets arrive in decode
+        order, so the timestamps are sorted back into presentation order. Falls back to
+        extract_frame_timestamps when PyAV is not installed or cannot read the file.
+        
+        Returns:
+            np.ndarray: (N,) float64 timestamps in milliseconds, relative to the stream start.
+        """
+        if av is not None:
+            try:
+                with av.open(self.video_path) as container:
+                    stream = container.streams.video[0]
+                    # Flush packets at the end of the stream carry no frame and no pts
+                    pts = [packet.pts for packet in container.demux(stream)
+                           if packet.pts is not None and packet.size > 0]
+                    pts = np.sort(np.asarray(pts, dtype=np.int64))
+                    # Relative to the stream start, like CAP_PROP_POS_MSEC
+                    start = stream.start_time or 0
+                    timestamps = (pts - start) * float(stream.time_base) * 1000.0
+                logger.info(f"Extracted timestamps for {len(timestamps)} frames.")
+                return timestamps
+            except Exception as e:
+                logger.warning(f"PyAV timestamp scan failed ({e}), decoding frames instead")
+        
+        return self.extract_frame_timestamps()
+
     def get_frame_at_timestamp(self, timestamp_ms, tolerance_ms=20):
         """
         Retrieves the frame closest to the specified timestamp.
@@ -0,0 +1,169 @@
+import cv2
+import logging
+import shutil
+import subprocess
+import numpy as np
+from fractions import Fraction
+from functools import lru_cache
+
+try:
+    import av
+except ImportError:
+    av = None
+
+logger = logging.getLogger(__name__)
+
+# H.264 encoders in order of preference: hardware first, software last
+H264_ENCODERS = ['h264_nvenc', 'h264_videotoolbox', 'h264_qsv', 'libx264']
+
+# Encoders for the ffmpeg pipe, in order of preference, with their low-latency settings
+FFMPEG_H264_ENCODERS = [
+    ('h264_nvenc', ['-preset', 'p4', '-tune', 'll']),
+    ('libx264', ['-preset', 'veryfast']),
+]
+
+def _to_rate(fps):
+    """Converts a float FPS (e.g. 29.97) into the Fraction PyAV expects."""
+    return Fraction(fps).limit_denominator(1001) if fps > 0 else Fraction(30)
+
+@lru_cache(maxsize=None)
+def _probe_encoder(codec, width, height, rate):
+    """
+    Checks that an encoder both exists in the FFmpeg build and can be opened here.
+    Hardware encoders are usually compiled in but fail to open without the device.
+    Cached per process: failed hardware opens are slow and do not start working later.
+    """
+    try:
+        ctx = av.CodecContext.create(codec, 'w')
+        ctx.width = width
+        ctx.height = height
+        ctx.pix_fmt = 'yuv420p'
+        ctx.time_base = 1 / rate
+        ctx.framerate = rate
+        ctx.open()
+        return True
+    except Exception as e:
+        logger.debug(f"Encoder {codec} unavailable: {e}")
+        return False
+
+@lru_cache(maxsize=None)
+def _probe_ffmpeg_encoder(ffmpeg_path, codec):
+    """
+    Checks that ffmpeg can actually encode with a codec by encoding one small frame.
+    Listing in `ffmpeg -encoders` is not enough: NVENC is listed on machines without a GPU.
+    Cached per process, so the cost is paid once per codec.
+    """
+    cmd = [
+        ffmpeg_path, '-hide_banner', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', 'color=black:size=256x256', '-frames:v', '1',
+        '-c:v', codec, '-f', 'null', '-'
+    ]
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=10)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.debug(f"ffmpeg encoder {codec} unavailable: {e}")
+        return False
+    if result.returncode != 0:
+        logger.debug(f"ffmpeg encoder {codec} unavailable: {result.stderr.decode(errors='replace').strip()}")
+        return False
+    return True
+
+class PyAVWriter:
+    def __init__(self, output_path, fps, width, height, codecs=H264_ENCODERS):
+        """
+        Writes BGR frames to an H.264 file through PyAV, preferring hardware encoders.
+
+        Args:
+            output_path (str): Path of the output video.
+            fps (float): Output frame rate.
+            width (int): Frame width in pixels.
+            height (int): Frame height in pixels.
+            codecs (list): Encoder names to try, in order.
+        """
+        rate = _to_rate(fps)
+        codec = next((c for c in codecs if _probe_encoder(c, width, height, rate)), None)
+        if codec is None:
+            raise RuntimeError(f"None of the encoders {codecs} are available")
+
+        self.container = av.open(output_path, mode='w')
+        self.stream = self.container.add_stream(codec, rate=rate)
+        self.stream.width = width
+        self.stream.height = height
+        self.stream.pix_fmt = 'yuv420p'
+        self.codec = codec
+        logger.info(f"Encoding {output_path} with {codec}")
+
+    def write(self, frame):
+        """Encodes one BGR frame (np.ndarray of shape (H, W, 3), uint8)."""
+        video_frame = av.VideoFrame.from_ndarray(frame, format='bgr24').reformat(format='yuv420p')
+        for packet in self.stream.encode(video_frame):
+            self.container.mux(packet)
+
+    def release(self):
+        """Flushes the encoder and closes the file."""
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+
+class FFmpegPipeWriter:
+    def __init__(self, output_path, fps, width, height, ffmpeg_path='ffmpeg', encoders=FFMPEG_H264_ENCODERS):
+        """
+        Streams raw BGR frames to an ffmpeg subprocess encoding H.264.
+        Encoding runs in ffmpeg's own threads (or on the GPU with NVENC), outside the Python process.
+
+        Args:
+            output_path (str): Path of the output video.
+            fps (float): Output frame rate.
+            width (int): Frame width in pixels.
+            height (int): Frame height in pixels.
+            ffmpeg_path (str): ffmpeg executable.
+            encoders (list): (codec, extra ffmpeg args) pairs to try, in order. The last one
+                             is used without probing.
+        """
+        codec, codec_args = next(
+            (enc for enc in encoders[:-1] if _probe_ffmpeg_encoder(ffmpeg_path, enc[0])),
+            encoders[-1])
+        cmd = [
+            ffmpeg_path, '-loglevel', 'error', '-y',
+            '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-s', f'{width}x{height}',
+            '-r', str(_to_rate(fps)), '-i', '-',
+            '-c:v', codec, *codec_args, '-pix_fmt', 'yuv420p',
+            output_path
+        ]
+        self.proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+        self.output_path = output_path
+        self.codec = codec
+        logger.info(f"Encoding {output_path} with ffmpeg ({codec})")
+
+    def write(self, frame):
+        """Sends one BGR frame (np.ndarray of shape (H, W, 3), uint8) to ffmpeg."""
+        self.proc.stdin.write(np.ascontiguousarray(frame, dtype=np.uint8).data)
+
+    def release(self):
+        """Closes the pipe and waits for ffmpeg to finish the file."""
+        self.proc.stdin.close()
+        if self.proc.wait() != 0:
+            logger.error(f"ffmpeg exited with code {self.proc.returncode} while writing {self.output_path}")
+
+def open_video_writer(output_path, fps, width, height):
+    """
+    Opens the fastest available writer for annotated output videos.
+
+    Uses PyAV with a hardware H.264 encoder when PyAV is installed, then an
+    ffmpeg subprocess (NVENC, else libx264) if ffmpeg is on PATH, otherwise cv2.VideoWriter with mp4v.
+
+    Returns:
+        Object exposing write(frame) and release().
+    """
+    if av is not None:
+        try:
+            return PyAVWriter(output_path, fps, width, height)
+        except Exception as e:
+            logger.warning(f"PyAV writer unavailable ({e}), trying the next writer")
+
+    ffmpeg_path = shutil.which('ffmpeg')
+    if ffmpeg_path:
+        return FFmpegPipeWriter(output_path, fps, width, height, ffmpeg_path=ffmpeg_path)
+
+    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+    return cv2.VideoWriter(output_path, fourcc, fps, (width, height))
@@ -4,9 +4,165 @@ from scipy.spatial.transform import Rotation as R
 import logging
 import json
 import os
+import math
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .interp_kernels import UNIT_NORM_TOLERANCE
+from .projection_kernels import HAVE_NUMBA, project_camera_points_jit, project_gizmos_jit, rotate_vectors_jit
 
 logger = logging.getLogger(__name__)
 
+def _quat_rotate(q, v, inverse=False):
+    """
+    Rotates vectors by quaternions in closed form: v + w*t + u x t with t = 2 u x v.
+    Same result as R.from_quat(q).apply(v) (or .inv().apply(v)) without the scipy dispatch.
+    
+    Args:
+        q (np.ndarray): (4,) or (N, 4) quaternions [x, y, z, w]; normalized like from_quat.
+        v (np.ndarray): (3,) or (N, 3) vectors.
+        inverse (bool): Rotate by the inverse (conjugate) rotation.
+        
+    Returns:
+        np.ndarray: Rotated vectors, broadcast over q and v.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    v = np.asarray(v, dtype=np.float64)
+    sq_norm = np.einsum('...i,...i->...', q, q)
+    scale = np.where(np.abs(sq_norm - 1.0) > UNIT_NORM_TOLERANCE, 1.0 / np.sqrt(sq_norm), 1.0)
+    sign = -scale if inverse else scale
+    x, y, z, w = q[..., 0] * sign, q[..., 1] * sign, q[..., 2] * sign, q[..., 3] * scale
+    vx, vy, vz = v[..., 0], v[..., 1], v[..., 2]
+    tx = 2.0 * (y * vz - z * vy)
+    ty = 2.0 * (z * vx - x * vz)
+    tz = 2.0 * (x * vy - y * vx)
+    return np.stack([
+        vx + w * tx + (y * tz - z * ty),
+        vy + w * ty + (z * tx - x * tz),
+        vz + w * tz + (x * ty - y * tx)
+    ], axis=-1)
+
+def _quat_rotate_point(q, v, inverse=False):
+    """_quat_rotate for a single quaternion and vector, on Python floats."""
+    x, y, z, w = map(float, q)
+    sq_norm = x * x + y * y + z * z + w * w
+    scale = 1.0 / math.sqrt(sq_norm) if abs(sq_norm - 1.0) > UNIT_NORM_TOLERANCE else 1.0
+    sign = -scale if inverse else scale
+    x, y, z, w = x * sign, y * sign, z * sign, w * scale
+    vx, vy, vz = map(float, v)
+    tx = 2.0 * (y * vz - z * vy)
+    ty = 2.0 * (z * vx - x * vz)
+    tz = 2.0 * (x * vy - y * vx)
+    return (vx + w * tx + (y * tz - z * ty),
+            vy + w * ty + (z * tx - x * tz),
+            vz + w * tz + (x * ty - y * tx))
+
+def _quat_multiply(p, q):
+    """
+    Hamilton product p * q of two quaternions [x, y, z, w], on Python floats.
+    Both q and the product are normalized with the same operations as Rotation.from_quat,
+    so the result matches (R.from_quat(p) * R.from_quat(q)).as_quat() bit for bit when p is unit.
+    """
+    px, py, pz, pw = p
+    qx, qy, qz, qw = map(float, q)
+    norm = math.sqrt(qx * qx + qy * qy + qz * qz + qw * qw)
+    qx, qy, qz, qw = qx / norm, qy / norm, qz / norm, qw / norm
+    x = pw * qx + qw * px + (py * qz - pz * qy)
+    y = pw * qy + qw * py + (pz * qx - px * qz)
+    z = pw * qz + qw * pz + (px * qy - py * qx)
+    w = pw * qw - px * qx - py * qy - pz * qz
+    norm = math.sqrt(x * x + y * y + z * z + w * w)
+    return [x / norm, y / norm, z / norm, w / norm]
+
+def _euler_xyz_deg_to_quat(roll, pitch, yaw):
+    """
+    Quaternion [x, y, z, w] of extrinsic 'xyz' Euler angles in degrees, in closed form.
+    Same operation order as R.from_euler('xyz', ..., degrees=True), so the result is identical.
+    """
+    r, p, y = math.radians(roll) / 2.0, math.radians(pitch) / 2.0, math.radians(yaw) / 2.0
+    sr, cr = math.sin(r), math.cos(r)
+    sp, cp = math.sin(p), math.cos(p)
+    sy, cy = math.sin(y), math.cos(y)
+    return (cy * (cp * sr) - sy * (sp * cr),
+            cy * (sp * cr) + sy * (cp * sr),
+            sy * (cp * cr) - cy * (sp * sr),
+            cy * (cp * cr) + sy * (sp * sr))
+
+def _quat_to_matrix(q):
+    """(3, 3) rotation matrix of a unit quaternion [x, y, z, w], written out like Rotation.as_matrix."""
+    x, y, z, w = q
+    x2, y2, z2, w2 = x * x, y * y, z * z, w * w
+    xy, zw, xz, yw, yz, xw = x * y, z * w, x * z, y * w, y * z, x * w
+    return np.array([
+        [x2 - y2 - z2 + w2, 2 * (xy - zw), 2 * (xz + yw)],
+        [2 * (xy + zw), -x2 + y2 - z2 + w2, 2 * (yz - xw)],
+        [2 * (xz - yw), 2 * (yz + xw), -x2 - y2 + z2 + w2]
+    ])
+
+@lru_cache(maxsize=1024)
+def _axis_offsets(qx, qy, qz, qw, axis_length):
+    """
+    World-space offsets of the X, Y, Z gizmo axis ends for one rotation, as rows of a (3, 3) array.
+    Cached on the exact quaternion, so held poses skip the rotation math on later frames.
+    """
+    if HAVE_NUMBA:
+        offsets = rotate_vectors_jit((qx, qy, qz, qw), np.eye(3) * axis_length)
+    else:
+        offsets = _quat_rotate((qx, qy, qz, qw), np.eye(3) * axis_length)
+    offsets.flags.writeable = False
+    return offsets
+
+@lru_cache(maxsize=256)
+def _text_size(text, font, font_scale, thickness):
+    """cv2.getTextSize (width, height) for a label, cached since labels repeat every frame."""
+    return cv2.getTextSize(text, font, font_scale, thickness)[0]
+
+class TextSprite:
+    def __init__(self, text, org, font=cv2.FONT_HERSHEY_SIMPLEX, font_scale=0.6, color=(0, 255, 0), thickness=2):
+        """
+        Rasterizes a fixed string once so it can be blitted instead of re-drawn with cv2.putText.
+        
+        Args:
+            text: String to render
+            org: Bottom-left corner of the text in the target image, as passed to cv2.putText
+            font, font_scale, color, thickness: cv2.putText parameters
+        """
+        (text_w, text_h), baseline = cv2.getTextSize(text, font, font_scale, thickness)
+        # getTextSize does not cover every glyph (e.g. parentheses), so render with a wide margin
+        pad = text_h + thickness
+        
+        # Render coverage in white so anti-aliased edges blend like cv2.putText does
+        coverage = np.zeros((text_h + baseline + 2 * pad, text_w + 2 * pad), dtype=np.uint8)
+        cv2.putText(coverage, text, (pad, pad + text_h), font, font_scale, 255, thickness)
+        
+        # Crop to the pixels the text actually touches
+        bx, by, bw, bh = cv2.boundingRect(coverage)
+        coverage = coverage[by:by + bh, bx:bx + bw]
+        self.alpha = (coverage.astype(np.float32) / 255.0)[:, :, None]
+        self.color_layer = self.alpha * np.array(color, dtype=np.float32)
+        
+        # Top-left corner of the sprite in the target image
+        self.x0 = org[0] - pad + bx
+        self.y0 = org[1] - text_h - pad + by
+    
+    def draw(self, img):
+        """Blends the pre-rendered text onto img in place, clipped to the image bounds."""
+        h, w = self.alpha.shape[:2]
+        x0, y0 = max(self.x0, 0), max(self.y0, 0)
+        x1, y1 = min(self.x0 + w, img.shape[1]), min(self.y0 + h, img.shape[0])
+        if x1 <= x0 or y1 <= y0:
+            return
+        sy = slice(y0 - self.y0, y1 - self.y0)
+        sx = slice(x0 - self.x0, x1 - self.x0)
+        roi = img[y0:y1, x0:x1]
+        alpha = self.alpha[sy, sx]
+        blended = roi * (1.0 - alpha) + self.color_layer[sy, sx]
+        np.copyto(roi, np.rint(blended), casting='unsafe')
+
 class Visualizer:
     def __init__(self, width=1920, height=1080, fov_deg=100, config_path=None):
         """
@@ -22,28 +178,80 @@ class Visualizer:
         self.height = height
         self.fov_deg = fov_deg
         
+        # Intrinsic matrix, updated in place by _update_intrinsics
+        self.K = np.eye(3)
+        
         # Manual calibration offsets
         self.offset_pos = np.array([0.0, 0.0, 0.0])  # XYZ position offset
         self.offset_rot_euler = np.array([0.0, 0.0, 0.0])  # Roll, Pitch, Yaw in degrees
         
+        # Cached offset rotation (as a quaternion and a matrix), rebuilt only when offset_rot_euler changes
+        self._offset_quat = None
+        self._offset_R = None
+        self._offset_rot_key = None
+        
+        # World -> camera transform of the current frame, set by set_camera
+        self._R_cw = None
+        self._t = None
+        self._camera_key = None
+        
+        # Rasterized info panel text, reused by draw_info_panel(refresh=False), and its legend
+        self._panel_sprites = None
+        self._panel_texts = []
+        self._legend_sprites = None
+        self._panel_height = None
+        self._panel_black = None
+        
         # Load from config if provided
         if config_path and os.path.exists(config_path):
             self.load_calibration(config_path)
         
-        # Compute intrinsic matrix
+        # Compute intrinsic matrix and offset rotation
         self._update_intrinsics()
+        self._update_offset_rotation()
         
-        self.dist_coeffs = np.zeros(5)  # Assume no distortion
         logger.info(f"Visualizer initialized: FOV={self.fov_deg}, Offset Pos={self.offset_pos}, Offset Rot={self.offset_rot_euler}")
     
     def _update_intrinsics(self):
-        """Recompute K matrix from current FOV."""
+        """Recompute K matrix from current FOV, in place."""
+        # np.tan rather than math.tan: they differ in the last bit for some angles,
+        # which would move projected pixels
         f = (self.width / 2) / np.tan(np.radians(self.fov_deg / 2))
-        self.K = np.array([
-            [f, 0, self.width / 2],
-            [0, f, self.height / 2],
-            [0, 0, 1]
-        ])
+        self.K[0, 0] = self.K[1, 1] = f
+        self.K[0, 2] = self.width / 2
+        self.K[1, 2] = self.height / 2
+        # Scalars for the projection hot paths, which skip the K matmul
+        self._fx = self._fy = f
+        self._cx = self.width / 2
+        self._cy = self.height / 2
+    
+    def _update_offset_rotation(self):
+        """Rebuild the cached offset rotation if offset_rot_euler changed."""
+        key = tuple(float(a) for a in self.offset_rot_euler)
+        if key != self._offset_rot_key:
+            self._offset_quat = _euler_xyz_deg_to_quat(*key)
+            self._offset_R = _quat_to_matrix(self._offset_quat)
+            self._offset_rot_key = key
+    
+    def set_camera(self, camera_pose):
+        """
+        Sets the camera used by project_points_from_camera.
+        
+        The world -> camera rotation matrix is rebuilt only when the camera pose changes,
+        so all points drawn for one frame share a single conversion.
+        
+        Args:
+            camera_pose (dict): {'position': [x,y,z], 'rotation': [x,y,z,w]} of the Camera.
+        """
+        key = tuple(float(a) for a in camera_pose['position']) + tuple(float(a) for a in camera_pose['rotation'])
+        if key != self._camera_key:
+            # Row vectors times R is R^T @ v, the inverse rotation for an orthonormal matrix.
+            # Normalized and expanded like R.from_quat(...).as_matrix(), without the Rotation object
+            x, y, z, w = map(float, camera_pose['rotation'])
+            norm = math.sqrt(x * x + y * y + z * z + w * w)
+            self._R_cw = _quat_to_matrix((x / norm, y / norm, z / norm, w / norm))
+            self._t = np.asarray(camera_pose['position'], dtype=np.float64)
+            self._camera_key = key
     
     def set_calibration(self, offset_pos=None, offset_rot_euler=None, fov_deg=None):
         """Update calibration parameters."""
@@ -51,7 +259,8 @@ class Visualizer:
             self.offset_pos = np.array(offset_pos)
         if offset_rot_euler is not None:
             self.offset_rot_euler = np.array(offset_rot_euler)
-        if fov_deg is not None:
+            self._update_offset_rotation()
+        if fov_deg is not None and fov_deg != self.fov_deg:
             self.fov_deg = fov_deg
             self._update_intrinsics()
         logger.debug(f"Calibration updated: Pos={self.offset_pos}, Rot={self.offset_rot_euler}, FOV={self.fov_deg}")
@@ -59,12 +268,17 @@ class Visualizer:
     def load_calibration(self, config_path):
         """Load calibration from JSON file."""
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            if orjson is not None:
+                with open(config_path, 'rb') as f:
+                    config = orjson.loads(f.read())
+            else:
+                with open(config_path, 'r') as f:
+                    config = json.load(f)
             self.offset_pos = np.array(config.get('offset_pos', [0.0, 0.0, 0.0]))
             self.offset_rot_euler = np.array(config.get('offset_rot_euler', [0.0, 0.0, 0.0]))
             self.fov_deg = config.get('fov', self.fov_deg)
             self._update_intrinsics()
+            self._update_offset_rotation()
             logger.info(f"Loaded calibration from {config_path}")
         except Exception as e:
             logger.error(f"Failed to load calibration: {e}")
@@ -90,19 +304,30 @@ class Visualizer:
         Returns:
             Adjusted pose dict
         """
-        # Apply position offset
-        pos_adjusted = np.array(pose_world['position']) + self.offset_pos
-        
-        # Apply rotation offset
-        rot_world = R.from_quat(pose_world['rotation'])
-        rot_offset = R.from_euler('xyz', self.offset_rot_euler, degrees=True)
-        rot_adjusted = rot_offset * rot_world
+        # Apply position offset (plain floats: no array round trip for a single pose)
+        px, py, pz = pose_world['position']
+        ox, oy, oz = self.offset_pos.tolist()
         
         return {
-            'position': pos_adjusted.tolist(),
-            'rotation': rot_adjusted.as_quat().tolist()
+            'position': [float(px) + ox, float(py) + oy, float(pz) + oz],
+            'rotation': _quat_multiply(self._offset_quat, pose_world['rotation'])
         }
 
+    def apply_offsets(self, positions, rotations):
+        """Vectorized apply_offset for N poses.
+        
+        Args:
+            positions (np.ndarray): (N, 3) pose positions.
+            rotations (np.ndarray): (N, 4) pose rotations [x, y, z, w].
+            
+        Returns:
+            tuple: ((N, 3) adjusted positions, (N, 3, 3) adjusted rotation matrices).
+                   Rotations stay as matrices since projection only needs the axes.
+        """
+        pos_adjusted = np.asarray(positions, dtype=np.float64) + self.offset_pos
+        rot_adjusted = self._offset_R @ R.from_quat(rotations).as_matrix()
+        return pos_adjusted, rot_adjusted
+
     def project_point(self, point_world, camera_pose, check_bounds=True):
         """
         Projects a 3D world point to 2D image coordinates.
@@ -117,22 +342,14 @@ class Visualizer:
         """
         if point_world is None or camera_pose is None:
             return None
-            
-        P_world = np.array(point_world)
-        if P_world.shape != (3,):
-            P_world = P_world[:3]
-            
-        # Camera Extrinsics (World -> Camera)
-        cam_pos = np.array(camera_pose['position'])
-        cam_rot = R.from_quat(camera_pose['rotation'])
         
-        # Vector from camera to point
-        vec_cam_to_point = P_world - cam_pos
+        # Vector from camera to point, on plain floats (extra components are ignored)
+        px, py, pz = point_world[:3]
+        cx, cy, cz = camera_pose['position']
+        vec_cam_to_point = (float(px) - float(cx), float(py) - float(cy), float(pz) - float(cz))
         
         # Rotate into camera frame
-        P_cam = cam_rot.inv().apply(vec_cam_to_point)
-        
-        x, y, z = P_cam
+        x, y, z = _quat_rotate_point(camera_pose['rotation'], vec_cam_to_point, inverse=True)
         
         # Depth check
         if z <= 0.1: 
@@ -141,11 +358,10 @@ class Visualizer:
         # Flip Y for OpenCV convention (Screen Y is down)
         y = -y 
         
-        # Projection
-        uv = self.K @ np.array([x, y, z])
-        uv = uv / uv[2]
-        
-        u, v = int(uv[0]), int(uv[1])
+        # Projection: (K @ [x, y, z]) / z written out, in the same operation order,
+        # rounded to the nearest pixel (half to even, like np.rint)
+        u = round((self._fx * x + self._cx * z) / z)
+        v = round((self._fy * y + self._cy * z) / z)
         
         # Bounds check
         if check_bounds:
@@ -154,6 +370,120 @@ class Visualizer:
         
         return u, v
 
+    def _project_camera_points(self, P_cam, check_bounds):
+        """Projects (N, 3) camera-frame points; shared by the vectorized projections."""
+        z = P_cam[:, 2]
+        visible = z > 0.1
+        
+        # Flip Y for OpenCV convention (Screen Y is down), folded into the focal lengths
+        focal = np.array([self._fx, -self._fy])
+        center = np.array([self._cx, self._cy])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            uv = (P_cam[:, :2] * focal + center * z[:, None]) / z[:, None]
+        
+        # Round like project_point; culled points are zeroed
+        uv = np.rint(np.where(visible[:, None], uv, 0.0)).astype(np.int64)
+        
+        if check_bounds:
+            visible &= (uv[:, 0] >= 0) & (uv[:, 0] < self.width) & (uv[:, 1] >= 0) & (uv[:, 1] < self.height)
+        
+        return uv, visible
+
+    def project_points(self, points_world, cam_positions, cam_rotations, check_bounds=True):
+        """
+        Vectorized project_point for N points, each seen from its own camera pose.
+        
+        Args:
+            points_world (np.ndarray): (N, 3) points in World Space.
+            cam_positions (np.ndarray): (N, 3) camera positions.
+            cam_rotations (np.ndarray): (N, 4) camera rotations [x, y, z, w].
+            check_bounds: If True, points outside the frame are marked invisible
+            
+        Returns:
+            tuple: ((N, 2) int pixel coordinates, (N,) bool visibility mask).
+        """
+        vec_cam_to_point = np.asarray(points_world, dtype=np.float64) - np.asarray(cam_positions, dtype=np.float64)
+        P_cam = _quat_rotate(cam_rotations, vec_cam_to_point, inverse=True)
+        return self._project_camera_points(P_cam, check_bounds)
+
+    def project_points_from_camera(self, points_world, check_bounds=True):
+        """
+        Vectorized project_point for N points seen from the camera set by set_camera.
+        
+        Args:
+            points_world (np.ndarray): (N, 3) points in World Space.
+            check_bounds: If True, points outside the frame are marked invisible
+            
+        Returns:
+            tuple: ((N, 2) int pixel coordinates, (N,) bool visibility mask).
+        """
+        if HAVE_NUMBA:
+            return project_camera_points_jit(points_world, self._R_cw, self._t, self._fx, self._fy,
+                                             self._cx, self._cy, self.width, self.height, check_bounds)
+        
+        # (p - t) @ R_cw written out, so the sums match the numba kernel
+        d = np.asarray(points_world, dtype=np.float64) - self._t
+        P_cam = d[:, 0:1] * self._R_cw[0] + d[:, 1:2] * self._R_cw[1] + d[:, 2:3] * self._R_cw[2]
+        return self._project_camera_points(P_cam, check_bounds)
+
+    def project_gizmos(self, positions, rotations, cam_positions, cam_rotations, axis_length=0.1, apply_calibration=True):
+        """
+        Projects the gizmo origin and axis end points for N poses at once.
+        
+        Args:
+            positions (np.ndarray): (N, 3) pose positions.
+            rotations (np.ndarray): (N, 4) pose rotations [x, y, z, w].
+            cam_positions (np.ndarray): (N, 3) camera positions.
+            cam_rotations (np.ndarray): (N, 4) camera rotations [x, y, z, w].
+            axis_length: Length of axes in meters
+            apply_calibration: Whether to apply manual calibration offsets
+            
+        Returns:
+            tuple: (origins (N, 2), origin_visible (N,), axis_ends (N, 3, 2), axis_visible (N, 3)),
+                   ready for draw_projected_gizmo.
+        """
+        if apply_calibration:
+            pos, rot_m = self.apply_offsets(positions, rotations)
+        else:
+            pos = np.asarray(positions, dtype=np.float64)
+            rot_m = R.from_quat(rotations).as_matrix()
+        
+        if HAVE_NUMBA:
+            # Rotation, projection and bounds checks for all four points fused in one pass
+            uv, visible = project_gizmos_jit(pos, rot_m, cam_positions, cam_rotations, axis_length,
+                                             self._fx, self._fy, self._cx, self._cy, self.width, self.height)
+            return uv[:, 0], visible[:, 0], uv[:, 1:], visible[:, 1:]
+        
+        origins, origin_visible = self.project_points(pos, cam_positions, cam_rotations)
+        
+        # X, Y, Z axis end points in World Space: the columns of the rotation matrix
+        axis_ends = np.empty((len(pos), 3, 2), dtype=np.int64)
+        axis_visible = np.empty((len(pos), 3), dtype=bool)
+        for k in range(3):
+            axis_ends[:, k], axis_visible[:, k] = self.project_points(pos + rot_m[:, :, k] * axis_length, cam_positions, cam_rotations)
+        
+        return origins, origin_visible, axis_ends, axis_visible
+
+    def draw_projected_gizmo(self, img, origin, axis_ends, axis_visible):
+        """
+        Draws one gizmo from coordinates computed by project_gizmos.
+        
+        Args:
+            img: Image to draw on
+            origin: (u, v) of the gizmo center
+            axis_ends: (3, 2) pixel coordinates of the X, Y, Z axis ends
+            axis_visible: (3,) mask of axis ends inside the frame
+        """
+        center = (int(origin[0]), int(origin[1]))
+        thickness = 2
+        
+        # X (Red), Y (Green), Z (Blue)
+        for end, visible, color in zip(axis_ends, axis_visible, ((0, 0, 255), (0, 255, 0), (255, 0, 0))):
+            if visible:
+                cv2.line(img, center, (int(end[0]), int(end[1])), color, thickness)
+        
+        cv2.circle(img, center, 4, (0, 255, 255), -1)  # Yellow center
+
     def draw_gizmo(self, img, pose_world, camera_pose, axis_length=0.1, apply_calibration=True):
         """
         Draws RGB axes at the pose location on the image.
@@ -165,36 +495,26 @@ class Visualizer:
             axis_length: Length of axes in meters
             apply_calibration: Whether to apply manual calibration offsets
         """
-        # Apply calibration offset if requested
-        if apply_calibration:
-            pose_world = self.apply_offset(pose_world)
-        
-        origin = self.project_point(pose_world['position'], camera_pose)
-        if origin is None:
+        if camera_pose is None:
             return
-            
-        # Calculate axis end points in World Space
-        pos = np.array(pose_world['position'])
-        rot = R.from_quat(pose_world['rotation'])
         
-        # X (Red), Y (Green), Z (Blue)
-        x_end = pos + rot.apply([axis_length, 0, 0])
-        y_end = pos + rot.apply([0, axis_length, 0])
-        z_end = pos + rot.apply([0, 0, axis_length])
-        
-        px_x = self.project_point(x_end, camera_pose)
-        px_y = self.project_point(y_end, camera_pose)
-        px_z = self.project_point(z_end, camera_pose)
+        # Apply calibration offset if requested (same math as apply_offset, without the dict and lists)
+        pos = np.asarray(pose_world['position'], dtype=np.float64)
+        rotation = pose_world['rotation']
+        if apply_calibration:
+            pos = pos + self.offset_pos
+            rotation = _quat_multiply(self._offset_quat, rotation)
         
-        # Draw Lines
-        cx, cy = origin
-        thickness = 2
+        # Origin and X, Y, Z axis end points in World Space, projected together
+        offsets = _axis_offsets(*(float(q) for q in rotation), float(axis_length))
+        pts_world = np.vstack([pos, pos + offsets])
         
-        if px_x: cv2.line(img, (cx, cy), px_x, (0, 0, 255), thickness)  # Red (X)
-        if px_y: cv2.line(img, (cx, cy), px_y, (0, 255, 0), thickness)  # Green (Y)
-        if px_z: cv2.line(img, (cx, cy), px_z, (255, 0, 0), thickness)  # Blue (Z)
+        self.set_camera(camera_pose)
+        uv, visible = self.project_points_from_camera(pts_world)
+        if not visible[0]:
+            return
         
-        cv2.circle(img, (cx, cy), 4, (0, 255, 255), -1)  # Yellow center
+        self.draw_projected_gizmo(img, uv[0], uv[1:], visible[1:])
     
     def draw_hand_point(self, img, pose_world, camera_pose, color, label="", apply_calibration=True, radius=8):
         """
@@ -209,15 +529,52 @@ class Visualizer:
             apply_calibration: Whether to apply offsets
             radius: Circle radius in pixels
         """
-        # Apply calibration if requested
+        if camera_pose is None:
+            return
+        
+        # Only the position offset matters for a point, so the rotation is not composed
+        pos = np.asarray(pose_world['position'], dtype=np.float64)[None, :3]
         if apply_calibration:
-            pose_world = self.apply_offset(pose_world)
+            pos = pos + self.offset_pos
         
-        point = self.project_point(pose_world['position'], camera_pose)
-        if point is None:
+        # Shares the camera transform cached by set_camera with the other landmarks of the frame
+        self.set_camera(camera_pose)
+        uv, visible = self.project_points_from_camera(pos)
+        if not visible[0]:
             return
         
-        x, y = point
+        self.draw_projected_hand_point(img, uv[0], color, label, radius)
+    
+    def project_hand_points(self, positions, cam_positions, cam_rotations, apply_calibration=True):
+        """
+        Projects N hand points at once, for drawing with draw_projected_hand_point.
+        
+        Args:
+            positions (np.ndarray): (N, 3) hand positions.
+            cam_positions (np.ndarray): (N, 3) camera positions.
+            cam_rotations (np.ndarray): (N, 4) camera rotations [x, y, z, w].
+            apply_calibration: Whether to apply the position offset
+            
+        Returns:
+            tuple: ((N, 2) int pixel coordinates, (N,) bool visibility mask).
+        """
+        pos = np.asarray(positions, dtype=np.float64)
+        if apply_calibration:
+            pos = pos + self.offset_pos
+        return self.project_points(pos, cam_positions, cam_rotations)
+    
+    def draw_projected_hand_point(self, img, point, color, label="", radius=8):
+        """
+        Draws one hand point from pixel coordinates computed by project_hand_points.
+        
+        Args:
+            img: Image to draw on
+            point: (u, v) pixel coordinates
+            color: BGR color tuple
+            label: Text label to display
+            radius: Circle radius in pixels
+        """
+        x, y = int(point[0]), int(point[1])
         
         # Draw circle
         cv2.circle(img, (x, y), radius, color, -1)
@@ -228,7 +585,7 @@ class Visualizer:
             font = cv2.FONT_HERSHEY_SIMPLEX
             font_scale = 0.5
             thickness = 2
-            text_size = cv2.getTextSize(label, font, font_scale, thickness)[0]
+            text_size = _text_size(label, font, font_scale, thickness)
             text_x = x - text_size[0] // 2
             text_y = y - radius - 10
             
@@ -239,7 +596,7 @@ class Visualizer:
                          (0, 0, 0), -1)
             cv2.putText(img, label, (text_x, text_y), font, font_scale, color, thickness)
     
-    def draw_info_panel(self, img, frame_idx, total_frames, video_ts, raw_ts, synced_ts, temporal_offset, position_diff=None):
+    def draw_info_panel(self, img, frame_idx, total_frames, video_ts, raw_ts, synced_ts, temporal_offset, position_diff=None, refresh=True):
         """
         Draws information panel on the image.
         
@@ -252,6 +609,8 @@ class Visualizer:
             synced_ts: Synced motion timestamp  
             temporal_offset: Time difference between raw and video
             position_diff: Optional position difference in meters
+            refresh: Re-render the text from these values. If False, the text rendered
+                     by the last refreshing call is reused and only the background is redrawn.
         """
         panel_x = 10
         panel_y = 10
@@ -261,43 +620,50 @@ class Visualizer:
         thickness = 2
         color = (0, 255, 0)  # Green
         
-        # Draw semi-transparent background
+        # Draw semi-transparent background: darken only the panel ROI (rectangle corners inclusive)
         panel_height = line_height * (7 if position_diff else 6)
-        overlay = img.copy()
-        cv2.rectangle(overlay, (panel_x - 5, panel_y - 5), 
-                     (panel_x + 400, panel_y + panel_height), 
-                     (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.6, img, 0.4, 0, img)
-        
-        y = panel_y + 20
-        cv2.putText(img, f"Frame: {frame_idx} / {total_frames}", 
-                   (panel_x, y), font, font_scale, color, thickness)
-        y += line_height
-        
-        cv2.putText(img, f"Video Time: {video_ts:.3f}s", 
-                   (panel_x, y), font, font_scale, color, thickness)
-        y += line_height
-        
-        cv2.putText(img, f"Raw Motion Time: {raw_ts:.3f}s", 
-                   (panel_x, y), font, font_scale, (128, 0, 128), thickness)  # Purple
-        y += line_height
-        
-        cv2.putText(img, f"Synced Motion Time: {synced_ts:.3f}s", 
-                   (panel_x, y), font, font_scale, (0, 255, 255), thickness)  # Yellow
-        y += line_height
-        
-        cv2.putText(img, f"Temporal Offset: {temporal_offset*1000:.1f}ms", 
-                   (panel_x, y), font, font_scale, color, thickness)
-        y += line_height
-        
-        if position_diff is not None:
-            cv2.putText(img, f"Position Diff: {position_diff*100:.2f}cm", 
-                       (panel_x, y), font, font_scale, color, thickness)
-            y += line_height
-        
-        # Legend
-        legend_y = img.shape[0] - 60
-        cv2.putText(img, "Purple = Raw (Nearest)", 
-                   (panel_x, legend_y), font, font_scale, (128, 0, 128), thickness)
-        cv2.putText(img, "Yellow = Synced (Interpolated)", 
-                   (panel_x, legend_y + 30), font, font_scale, (0, 255, 255), thickness)
+        roi = img[panel_y - 5:panel_y + panel_height + 1, panel_x - 5:panel_x + 401]
+        if self._panel_black is None or self._panel_black.shape != roi.shape:
+            self._panel_black = np.zeros_like(roi)
+        cv2.addWeighted(roi, 0.4, self._panel_black, 0.6, 0, roi)
+        
+        if refresh or self._panel_sprites is None or self._panel_height != img.shape[0]:
+            lines = [
+                (f"Frame: {frame_idx} / {total_frames}", color),
+                (f"Video Time: {video_ts:.3f}s", color),
+                (f"Raw Motion Time: {raw_ts:.3f}s", (128, 0, 128)),  # Purple
+                (f"Synced Motion Time: {synced_ts:.3f}s", (0, 255, 255)),  # Yellow
+                (f"Temporal Offset: {temporal_offset*1000:.1f}ms", color),
+            ]
+            if position_diff is not None:
+                lines.append((f"Position Diff: {position_diff*100:.2f}cm", color))
+            
+            # A line's position and color depend only on its slot, so a line whose text is
+            # unchanged since the last refresh (e.g. a held timestamp) keeps its sprite
+            y = panel_y + 20
+            sprites = []
+            for k, (text, line_color) in enumerate(lines):
+                if k < len(self._panel_texts) and self._panel_texts[k] == text:
+                    sprites.append(self._panel_sprites[k])
+                else:
+                    sprites.append(TextSprite(text, (panel_x, y), font, font_scale, line_color, thickness))
+                y += line_height
+            
+            # Legend text never changes, so it is only rasterized again for a new frame height
+            if self._legend_sprites is None or self._panel_height != img.shape[0]:
+                legend_y = img.shape[0] - 60
+                self._legend_sprites = [
+                    TextSprite("Purple = Raw (Nearest)", 
+                               (panel_x, legend_y), font, font_scale, (128, 0, 128), thickness),
+                    TextSprite("Yellow = Synced (Interpolated)", 
+                               (panel_x, legend_y + 30), font, font_scale, (0, 255, 255), thickness),
+                ]
+            
+            self._panel_sprites = sprites
+            self._panel_texts = [text for text, _ in lines]
+            self._panel_height = img.shape[0]
+        
+        for sprite in self._panel_sprites:
+            sprite.draw(img)
+        for sprite in self._legend_sprites:
+            sprite.draw(img)
@@ -0,0 +1,91 @@
+import sys
+import os
+import threading
+import numpy as np
+import pytest
+
+# Add project root and Scripts to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Scripts')))
+
+from compare_raw_synced import QUEUE_SIZE, render_frames
+
+FRAME_SHAPE = (8, 8, 3)
+
+class FakeCapture:
+    """Endless capture whose frames carry their index in every pixel."""
+    def __init__(self):
+        self.index = 0
+
+    def grab(self):
+        return True
+
+    def retrieve(self, buf):
+        buf[:] = self.index % 256
+        self.index += 1
+        return True, buf
+
+class RecordingWriter:
+    def __init__(self, fail_at=None):
+        self.fail_at = fail_at
+        self.frames = []
+        self.released = False
+
+    def write(self, frame):
+        if len(self.frames) == self.fail_at:
+            raise IOError("disk full")
+        self.frames.append(int(frame[0, 0, 0]))
+
+    def release(self):
+        self.released = True
+
+def run_with_timeout(*args, timeout=10):
+    """Runs render_frames in a thread; returns (finished, exception)."""
+    result = {}
+    def target():
+        try:
+            render_frames(*args)
+        except Exception as e:
+            result['error'] = e
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive(), result.get('error')
+
+def test_render_frames_writes_all_frames_in_order():
+    out = RecordingWriter()
+    annotated = []
+    finished, error = run_with_timeout(FakeCapture(), 100, FRAME_SHAPE, out,
+                                       lambda idx, frame: annotated.append(idx))
+
+    assert finished and error is None
+    assert annotated == list(range(100))
+    assert out.frames == [i % 256 for i in range(100)]
+    assert out.released
+
+def test_render_frames_reraises_writer_error_without_hanging():
+    # Many more frames than the queues hold, so the decoder is blocked when the writer fails
+    out = RecordingWriter(fail_at=50)
+    finished, error = run_with_timeout(FakeCapture(), 50 + 10 * QUEUE_SIZE + 100, FRAME_SHAPE, out,
+                                       lambda idx, frame: None)
+
+    assert finished, "render_frames deadlocked after a writer error"
+    assert isinstance(error, IOError)
+    assert out.released
+
+def test_render_frames_reraises_annotate_error_without_hanging():
+    def annotate(idx, frame):
+        if idx == 20:
+            raise ValueError("bad frame")
+
+    out = RecordingWriter()
+    finished, error = run_with_timeout(FakeCapture(), 500, FRAME_SHAPE, out, annotate)
+
+    assert finished, "render_frames deadlocked after an annotate error"
+    assert isinstance(error, ValueError)
+    assert out.released
+
+if __name__ == "__main__":
+    test_render_frames_writes_all_frames_in_order()
+    test_render_frames_reraises_writer_error_without_hanging()
+    test_render_frames_reraises_annotate_error_without_hanging()
@@ -7,7 +7,8 @@ from scipy.spatial.transform import Rotation as R
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.interpolator import Interpolator
+from src.interpolator import Interpolator, slerp_batch, quat_to_matrix
+from src.interp_kernels import HAVE_NUMBA, slerp_batch_jit
 
 class TestInterpolator(unittest.TestCase):
     def setUp(self):
@@ -41,6 +42,19 @@ class TestInterpolator(unittest.TestCase):
         
         self.assertAlmostEqual(angles[2], 45.0)
 
+    def test_interpolate_pose_into_matches_dict_result(self):
+        p1 = {'position': [0, 0, 0], 'rotation': R.from_euler('x', 10, degrees=True).as_quat(), 'gripper': 0.0}
+        p2 = {'position': [1, 2, 3], 'rotation': R.from_euler('y', 80, degrees=True).as_quat(), 'gripper': 1.0}
+        pos, rot, grip = np.zeros((2, 3)), np.zeros((2, 4)), np.zeros(2)
+        
+        self.interpolator.interpolate_pose_into(p1, p2, 0.25, pos, rot, grip, 1)
+        
+        res = self.interpolator.interpolate_pose(p1, p2, 0.25)
+        np.testing.assert_array_equal(pos[1], res['position'])
+        np.testing.assert_array_equal(rot[1], res['rotation'])
+        self.assertEqual(grip[1], res['gripper'])
+        np.testing.assert_array_equal(pos[0], [0, 0, 0])
+
     def test_clamping(self):
         p1 = {'position': [0,0,0], 'rotation': [0,0,0,1]}
         p2 = {'position': [10,0,0], 'rotation': [0,0,0,1]}
@@ -51,5 +65,60 @@ class TestInterpolator(unittest.TestCase):
         res_over = self.interpolator.interpolate_pose(p1, p2, 1.5)
         np.testing.assert_array_equal(res_over['position'], [10,0,0]) # Clamped to 1
 
+    def test_batch_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        n = 50
+        prev_pos = rng.normal(size=(n, 3))
+        next_pos = rng.normal(size=(n, 3))
+        prev_rot = R.random(n, random_state=1).as_quat()
+        # Mix of distant and nearly identical rotations to cover the Lerp fallback
+        next_rot = R.random(n, random_state=2).as_quat()
+        next_rot[::2] = (R.from_quat(prev_rot[::2]) * R.from_euler('z', 0.01, degrees=True)).as_quat()
+        weights = rng.uniform(-0.2, 1.2, size=n)
+        
+        positions, rotations = self.interpolator.interpolate_pose_batch(
+            prev_pos, next_pos, prev_rot, next_rot, weights)
+        
+        for i in range(n):
+            res = self.interpolator.interpolate_pose(
+                {'position': prev_pos[i], 'rotation': prev_rot[i]},
+                {'position': next_pos[i], 'rotation': next_rot[i]},
+                weights[i])
+            np.testing.assert_array_almost_equal(positions[i], res['position'])
+            # q and -q are the same rotation
+            self.assertAlmostEqual(abs(np.dot(rotations[i], res['rotation'])), 1.0, places=6)
+
+    @unittest.skipUnless(HAVE_NUMBA, "numba not installed")
+    def test_jit_slerp_matches_numpy(self):
+        q0 = R.random(100, random_state=3).as_quat() * 2.0 # Unnormalized input
+        q1 = R.random(100, random_state=4).as_quat()
+        q1[::3] = -q0[::3] # Same rotation, opposite sign
+        weights = np.linspace(-0.5, 1.5, 100)
+        
+        np.testing.assert_allclose(slerp_batch_jit(q0, q1, weights), slerp_batch(q0, q1, weights), atol=1e-9)
+
+    def test_interpolate_poses_samples_trajectory(self):
+        timestamps = np.array([0.0, 1.0, 3.0])
+        positions = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 2.0, 0.0]])
+        rotations = R.from_euler('z', [[0], [90], [90]], degrees=True).as_quat()
+        
+        pos, rot = self.interpolator.interpolate_poses([-1.0, 0.5, 2.0, 5.0], timestamps, positions, rotations)
+        
+        # Outside the trajectory clamps to the end samples
+        np.testing.assert_array_almost_equal(pos, [[0, 0, 0], [0.5, 0, 0], [1, 1, 0], [1, 2, 0]])
+        angles = R.from_quat(rot).as_euler('xyz', degrees=True)[:, 2]
+        np.testing.assert_array_almost_equal(angles, [0, 45, 90, 90], decimal=3)
+
+    def test_quat_to_matrix_matches_scipy(self):
+        quats = R.random(20, random_state=3).as_quat()
+        np.testing.assert_allclose(quat_to_matrix(quats), R.from_quat(quats).as_matrix(), atol=1e-12)
+        np.testing.assert_allclose(quat_to_matrix(quats[0]), R.from_quat(quats[0]).as_matrix(), atol=1e-12)
+        
+        p1 = {'position': [0, 0, 0], 'rotation': R.from_euler('z', 0, degrees=True).as_quat()}
+        p2 = {'position': [2, 0, 0], 'rotation': R.from_euler('z', 90, degrees=True).as_quat()}
+        pos, mat = self.interpolator.interpolate_pose_as_matrix(p1, p2, 0.5)
+        np.testing.assert_array_almost_equal(pos, [1, 0, 0])
+        np.testing.assert_array_almost_equal(mat, R.from_euler('z', 45, degrees=True).as_matrix())
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,12 +1,14 @@
 import sys
 import os
 import logging
+import numpy as np
 
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.motion_loader import MotionLoader
 from src.motion_matcher import MotionMatcher
+from src.match_kernels import hunt_searchsorted, match_brackets_jit
 # Mock class for independent testing
 class MockMotionLoader:
     def __init__(self, timestamps):
@@ -32,26 +34,30 @@ def test_matcher():
     
     matches = matcher.match_timestamps(video_ts, offset_ms=0.0)
     
-    for i, m in enumerate(matches):
-        logger.info(f"Case {i}: Input {m['aligned_ts']} -> Prev: {m['prev_motion_ts']}, Next: {m['next_motion_ts']}, W: {m['weight']}")
+    for i in range(len(video_ts)):
+        logger.info(f"Case {i}: Input {matches['aligned_ts'][i]} -> Prev: {matches['prev_motion_ts'][i]}, Next: {matches['next_motion_ts'][i]}, W: {matches['weight'][i]}")
         
     # Validation
     # Case 0: 20.0 -> Prev 10 or 20? bisect_left(20) gives idx=1 (value 20). 
     # Logic: prev=ts[0]=10, next=ts[1]=20. Weight = (20-10)/(20-10) = 1.0. Correct.
-    assert matches[0]['weight'] == 1.0 or matches[0]['prev_motion_ts'] == 20.0
+    assert matches['weight'][0] == 1.0 or matches['prev_motion_ts'][0] == 20.0
     
     # Case 1: 15.0 -> Prev 10, Next 20. Weight 0.5
-    assert matches[1]['prev_motion_ts'] == 10.0
-    assert matches[1]['next_motion_ts'] == 20.0
-    assert abs(matches[1]['weight'] - 0.5) < 1e-6
+    assert matches['prev_motion_ts'][1] == 10.0
+    assert matches['next_motion_ts'][1] == 20.0
+    assert abs(matches['weight'][1] - 0.5) < 1e-6
     
     # Case 2: 5.0 -> Prev 10, Next 10 (clamped). Weight 0.0
-    assert matches[2]['prev_motion_ts'] == 10.0
-    assert matches[2]['weight'] == 0.0
+    assert matches['prev_motion_ts'][2] == 10.0
+    assert matches['weight'][2] == 0.0
     
     # Case 3: 50.0 -> Prev 40, Next 40 (clamped). Weight 1.0
-    assert matches[3]['prev_motion_ts'] == 40.0
-    assert matches[3]['weight'] == 1.0
+    assert matches['prev_motion_ts'][3] == 40.0
+    assert matches['weight'][3] == 1.0
+    
+    # Indices point at the same samples as the timestamps
+    assert list(matches['prev_idx']) == [0, 0, 0, 3]
+    assert list(matches['next_idx']) == [1, 1, 1, 3]
     
     logger.info("Synthetic tests passed.")
     
@@ -69,9 +75,9 @@ def test_matcher():
             dummy_video = [min_t + 1.0, max_t - 1.0] 
             
             real_matches = real_matcher.match_timestamps(dummy_video)
-            for m in real_matches:
-                 logger.info(f"Real Match: {m}")
-                 assert m['prev_motion_ts'] <= m['aligned_ts'] <= m['next_motion_ts']
+            logger.info(f"Real Matches: {real_matches}")
+            assert np.all(real_matches['prev_motion_ts'] <= real_matches['aligned_ts'])
+            assert np.all(real_matches['aligned_ts'] <= real_matches['next_motion_ts'])
             
             logger.info("Real data tests passed.")
     except Exception as e:
@@ -79,5 +85,40 @@ def test_matcher():
 
     logger.info("All matcher tests passed!")
 
+def test_matcher_accepts_ndarray():
+    loader = MockMotionLoader([10.0, 20.0, 30.0, 40.0])
+    matcher = MotionMatcher(loader)
+    video_ts = [20.0, 15.0, 5.0, 50.0]
+    
+    from_list = matcher.match_timestamps(video_ts, offset_ms=1.0)
+    from_array = matcher.match_timestamps(np.asarray(video_ts), offset_ms=1.0)
+    
+    assert from_list.keys() == from_array.keys()
+    for key in from_list:
+        np.testing.assert_array_equal(from_list[key], from_array[key])
+
+def test_hunt_searchsorted_matches_numpy():
+    rng = np.random.default_rng(0)
+    motion_ts = np.sort(rng.integers(0, 50, 200)).astype(np.float64)
+    
+    # Sorted stream, unsorted stream, out-of-range values, duplicates and NaN
+    queries = np.concatenate([np.linspace(-5, 55, 300), rng.uniform(-5, 55, 100), motion_ts[::7], [np.nan, 3.0]])
+    np.testing.assert_array_equal(hunt_searchsorted(motion_ts, queries), np.searchsorted(motion_ts, queries))
+    assert len(hunt_searchsorted(np.empty(0), [1.0, 2.0])) == 2
+
+def test_match_kernel_matches_numpy_path():
+    rng = np.random.default_rng(1)
+    motion_ts = np.sort(rng.integers(0, 50, 200)).astype(np.float64)
+    matcher = MotionMatcher(MockMotionLoader(motion_ts))
+    
+    for ts in (motion_ts, motion_ts[:1]):
+        aligned = np.concatenate([np.linspace(-5, 55, 300), rng.uniform(-5, 55, 100), ts[::7], [np.nan]])
+        expected = matcher._match_brackets(np.asarray(ts), aligned)
+        for got, want in zip(match_brackets_jit(ts, aligned), expected):
+            np.testing.assert_array_equal(got, want)
+
 if __name__ == "__main__":
     test_matcher()
+    test_matcher_accepts_ndarray()
+    test_hunt_searchsorted_matches_numpy()
+    test_match_kernel_matches_numpy_path()
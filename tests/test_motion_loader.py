@@ -2,6 +2,8 @@ import sys
 import os
 import logging
 import json
+import tempfile
+import numpy as np
 
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -52,5 +54,122 @@ def test_motion_loader():
         import traceback
         traceback.print_exc()
 
+def write_motion_json(path, timestamps):
+    poses = [[0.1 * i, 0.0, 0.5, 0.0, 0.0, 0.0, 1.0] for i in range(len(timestamps))]
+    eyes = [[0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0] for _ in timestamps]
+    data = {'trajectories': [{
+        'timestamps': list(timestamps),
+        'poses': poses,
+        'left_eye_poses': eyes,
+        'right_eye_poses': eyes
+    }]}
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+def test_surrounding_indices_match_scalar_lookup():
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "motion.json")
+        write_motion_json(json_path, [1.0, 2.0, 3.0, 4.0])
+        loader = MotionLoader(json_path)
+        
+        queries = [0.5, 1.0, 1.5, 3.0, 3.99, 4.0, 4.5]
+        prev_idx, next_idx = loader.get_surrounding_indices(queries)
+        
+        # Forward then backward, so both the cached-interval path and its fallback are hit
+        order = list(range(len(queries))) + list(range(len(queries)))[::-1]
+        for t, i1, i2 in ((queries[k], prev_idx[k], next_idx[k]) for k in order):
+            prev_data, next_data = loader.get_surrounding_poses(t)
+            assert (i1 >= 0) == (prev_data is not None)
+            assert (i2 >= 0) == (next_data is not None)
+            if prev_data:
+                assert loader.timestamps[i1] == prev_data[0]
+            if next_data:
+                assert loader.timestamps[i2] == next_data[0]
+        
+        nearest = loader.get_nearest_indices(queries)
+        np.testing.assert_array_equal(nearest, [0, 0, 1, 2, 3, 3, 3])
+        np.testing.assert_array_equal(loader.get_nearest_indices(queries, tolerance=0.2), [-1, 0, -1, 2, 3, 3, -1])
+        
+        _, _, prev_ts, next_ts, weight = loader.get_surrounding_batch(queries)
+        np.testing.assert_array_equal(prev_ts, [np.nan, 1.0, 1.0, 3.0, 3.0, 4.0, 4.0])
+        np.testing.assert_array_equal(next_ts, [1.0, 1.0, 2.0, 3.0, 4.0, 4.0, np.nan])
+        np.testing.assert_array_almost_equal(weight, [0.0, 0.0, 0.5, 0.0, 0.99, 0.0, 0.0])
+        
+        arrays = loader.as_arrays()
+        positions, rotations = arrays['pose']
+        assert positions.shape == (4, 3)
+        assert rotations.shape == (4, 4)
+        np.testing.assert_array_equal(arrays['timestamps'], loader.timestamps)
+
+def test_directory_merge_keeps_arrays_aligned():
+    with tempfile.TemporaryDirectory() as tmp:
+        # Files sort by name in the opposite order of their timestamps
+        write_motion_json(os.path.join(tmp, "a.json"), [3.0, 4.0])
+        write_motion_json(os.path.join(tmp, "b.json"), [1.0, 2.0])
+        loader = MotionLoader(tmp)
+        
+        np.testing.assert_array_equal(loader.timestamps, [1.0, 2.0, 3.0, 4.0])
+        # Each file's first pose has x = 0.0, second x = 0.1
+        np.testing.assert_array_almost_equal(loader.positions[:, 0], [0.0, 0.1, 0.0, 0.1])
+        for name in MotionLoader.ARRAY_FIELDS:
+            assert len(getattr(loader, name)) == 4
+        
+        prev_data, next_data = loader.get_surrounding_poses(2.5)
+        assert prev_data[0] == 2.0 and next_data[0] == 3.0
+        assert prev_data[1]['pose']['position'] == [0.1, 0.0, 0.5]
+
+def test_rotations_are_stored_normalized():
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "motion.json")
+        rows = [[0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 2.0], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]]
+        with open(json_path, 'w') as f:
+            json.dump({'trajectories': [{'timestamps': [1.0, 2.0], 'poses': rows,
+                                         'left_eye_poses': rows, 'right_eye_poses': rows}]}, f)
+        loader = MotionLoader(json_path)
+        
+        # All-zero rows are kept rather than turned into NaN
+        np.testing.assert_array_equal(loader.rotations, [[0, 0, 0, 1], [0, 0, 0, 0]])
+        np.testing.assert_array_equal(loader.left_eye_rotations, loader.rotations)
+        
+        compact = MotionLoader(tmp, pose_dtype=np.float32)
+        assert compact.timestamps.dtype == np.float64
+        for name in MotionLoader.ARRAY_FIELDS[1:]:
+            assert getattr(compact, name).dtype == np.float32
+
+def test_cache_reuses_arrays_until_inputs_change():
+    with tempfile.TemporaryDirectory() as tmp:
+        motion_dir = os.path.join(tmp, "motion")
+        cache_dir = os.path.join(tmp, "cache")
+        os.makedirs(motion_dir)
+        json_path = os.path.join(motion_dir, "a.json")
+        write_motion_json(json_path, [1.0, 2.0, 3.0])
+        write_motion_json(os.path.join(motion_dir, "b.json"), [5.0, 6.0])
+        
+        first = MotionLoader(motion_dir, cache_dir=cache_dir)
+        assert len(os.listdir(cache_dir)) == 2
+        
+        cached = MotionLoader(motion_dir, cache_dir=cache_dir)
+        for name in MotionLoader.ARRAY_FIELDS:
+            np.testing.assert_array_equal(getattr(cached, name), getattr(first, name))
+        
+        # Rewriting an input replaces only its own cache entry
+        stale = set(os.listdir(cache_dir))
+        write_motion_json(json_path, [1.0, 2.0, 3.0, 4.0])
+        os.utime(json_path, ns=(0, os.stat(json_path).st_mtime_ns + 10**9))
+        updated = MotionLoader(motion_dir, cache_dir=cache_dir)
+        np.testing.assert_array_equal(updated.timestamps, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        entries = set(os.listdir(cache_dir))
+        assert len(entries) == 2
+        assert len(entries & stale) == 1
+        
+        # A single file uses the same entries
+        single = MotionLoader(json_path, cache_dir=cache_dir)
+        np.testing.assert_array_equal(single.timestamps, [1.0, 2.0, 3.0, 4.0])
+        assert set(os.listdir(cache_dir)) == entries
+
 if __name__ == "__main__":
     test_motion_loader()
+    test_surrounding_indices_match_scalar_lookup()
+    test_directory_merge_keeps_arrays_aligned()
+    test_rotations_are_stored_normalized()
+    test_cache_reuses_arrays_until_inputs_change()
@@ -0,0 +1,145 @@
+import sys
+import os
+import json
+import shutil
+import cv2
+import pytest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import src.video_cropper as video_cropper
+from src.video_cropper import VideoCropper
+
+SAMPLE_VIDEO = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Resources', 'RecordComparison', 'PhoneApp_Wireless.mp4'))
+
+requires_sample = pytest.mark.skipif(not os.path.exists(SAMPLE_VIDEO), reason="sample video not available")
+
+class TrackingWriter:
+    """Stand-in for open_video_writer that records how many writers are open at once."""
+    open_count = 0
+    max_open = 0
+    instances = []
+
+    def __init__(self, output_path, fps, width, height, fail_at=None):
+        self.output_path = output_path
+        self.frames = 0
+        self.released = False
+        self.fail_at = fail_at
+        TrackingWriter.open_count += 1
+        TrackingWriter.max_open = max(TrackingWriter.max_open, TrackingWriter.open_count)
+        TrackingWriter.instances.append(self)
+
+    def write(self, frame):
+        if self.frames == self.fail_at:
+            raise IOError("encoder failed")
+        self.frames += 1
+
+    def release(self):
+        assert not self.released
+        self.released = True
+        TrackingWriter.open_count -= 1
+
+def write_motion_file(motion_dir, name, start_s, end_s, video_start=1000.0):
+    """Motion JSON whose first trajectory spans [start_s, end_s] relative to the video start."""
+    timestamps = [video_start + start_s, video_start + (start_s + end_s) / 2, video_start + end_s]
+    with open(os.path.join(motion_dir, f"{name}.json"), 'w') as f:
+        json.dump({'trajectories': [{'timestamps': timestamps}]}, f)
+
+def count_frames(path):
+    """Returns (frame count, (width, height)) of a video file, counted by decoding."""
+    cap = cv2.VideoCapture(path)
+    count = 0
+    while cap.read()[0]:
+        count += 1
+    size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+    cap.release()
+    return count, size
+
+@pytest.fixture
+def tracking_writer(monkeypatch):
+    TrackingWriter.open_count = 0
+    TrackingWriter.max_open = 0
+    TrackingWriter.instances = []
+    monkeypatch.setattr(video_cropper, 'open_video_writer', TrackingWriter)
+    return TrackingWriter
+
+@requires_sample
+def test_reencode_opens_writers_only_while_clips_are_active(tmp_path, tracking_writer):
+    cropper = VideoCropper(SAMPLE_VIDEO, str(tmp_path))
+    clips = [(i * 1000.0, i * 1000.0 + 800.0, str(tmp_path / f"clip_{i}.mp4")) for i in range(6)]
+    cropper._reencode_clips(clips)
+    cropper.close()
+
+    # Non-overlapping clips never hold more than one encoder
+    assert tracking_writer.max_open == 1
+    assert tracking_writer.open_count == 0
+    assert len(tracking_writer.instances) == len(clips)
+    assert all(w.frames > 0 for w in tracking_writer.instances)
+
+@requires_sample
+def test_reencode_releases_writers_on_error(tmp_path, monkeypatch, tracking_writer):
+    def failing_writer(output_path, fps, width, height):
+        return TrackingWriter(output_path, fps, width, height,
+                              fail_at=5 if output_path.endswith("clip_1.mp4") else None)
+    monkeypatch.setattr(video_cropper, 'open_video_writer', failing_writer)
+
+    cropper = VideoCropper(SAMPLE_VIDEO, str(tmp_path))
+    # clip_0 overlaps clip_1, so it is open when clip_1 fails
+    clips = [(0.0, 2000.0, str(tmp_path / "clip_0.mp4")), (500.0, 1500.0, str(tmp_path / "clip_1.mp4"))]
+    with pytest.raises(IOError):
+        cropper._reencode_clips(clips)
+    cropper.close()
+
+    assert len(tracking_writer.instances) == 2
+    assert tracking_writer.open_count == 0
+
+@requires_sample
+def test_crop_to_motion_files_reencode_frame_counts(tmp_path, monkeypatch, tracking_writer):
+    # Without ffmpeg every clip goes through the single re-encode sweep; the tracking
+    # writer records the frames each clip receives (file round trips are covered in
+    # test_video_writer.py)
+    monkeypatch.setattr(video_cropper.shutil, 'which', lambda name: None)
+    motion_dir = tmp_path / "motion"
+    output_dir = tmp_path / "clips"
+    motion_dir.mkdir()
+    write_motion_file(motion_dir, "a", 2.0, 4.0)
+    write_motion_file(motion_dir, "b", 3.0, 8.6)     # overlaps a
+    write_motion_file(motion_dir, "c", -1.5, 2.0)    # start clamped to the video start
+    write_motion_file(motion_dir, "d", 30.0, 40.0)   # end clamped to the video end
+    write_motion_file(motion_dir, "e", 10.0, 11.0)
+    write_motion_file(motion_dir, "f", 50.0, 60.0)   # starts after the video: skipped
+    write_motion_file(motion_dir, "g", -10.0, -5.0)  # ends before the video: skipped
+    with open(motion_dir / "h.json", 'w') as f:
+        json.dump({'trajectories': []}, f)            # no trajectories: skipped
+
+    cropper = VideoCropper(SAMPLE_VIDEO, str(output_dir))
+    cropper.crop_to_motion_files(str(motion_dir), start_timestamp_unix=1000.0)
+    cropper.close()
+
+    # Counts match the original per-clip seek-and-read cropper on this (VFR) sample
+    written = {os.path.basename(w.output_path): w.frames for w in tracking_writer.instances}
+    assert written == {'a.mp4': 33, 'b.mp4': 141, 'c.mp4': 63, 'd.mp4': 61, 'e.mp4': 30}
+    assert tracking_writer.open_count == 0
+
+@requires_sample
+@pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="ffmpeg not on PATH")
+def test_copy_clip_by_time_writes_clip(tmp_path):
+    cropper = VideoCropper(SAMPLE_VIDEO, str(tmp_path))
+    output_path = str(tmp_path / "copy.mp4")
+    assert cropper._copy_clip_by_time(2000.0, 4000.0, output_path)
+    cropper.close()
+
+    frames, size = count_frames(output_path)
+    assert frames > 0
+    assert size == (1280, 720)
+
+def test_copy_clip_by_time_reports_missing_ffmpeg(tmp_path, monkeypatch):
+    monkeypatch.setattr(video_cropper.shutil, 'which', lambda name: None)
+    cropper = VideoCropper.__new__(VideoCropper)
+    cropper.video_path = SAMPLE_VIDEO
+    assert not cropper._copy_clip_by_time(0.0, 1000.0, str(tmp_path / "copy.mp4"))
+    assert not os.path.exists(tmp_path / "copy.mp4")
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,6 +1,8 @@
 import sys
 import os
 import logging
+import numpy as np
+import pytest
 
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -39,7 +41,7 @@ def test_video_loader():
                 logger.error(f"Timestamp gap/error at frame {i}: {timestamps[i-1]} -> {timestamps[i]}")
         
         logger.info("Timestamp monotonicity check passed.")
-
+        
         # Test Frame Generator
         logger.info("Testing frame generator (first 10 frames)...")
         gen = loader.frame_generator()
@@ -59,5 +61,21 @@ def test_video_loader():
         import traceback
         traceback.print_exc()
 
+def test_fast_timestamps_match_decoded_timestamps():
+    # Container-level packet scan must agree with the decoding scan, frame for frame
+    video_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Resources', 'RecordComparison', 'PhoneApp_Wireless.mp4'))
+    if not os.path.exists(video_path):
+        pytest.skip("sample video not available")
+    
+    loader = VideoLoader(video_path)
+    timestamps = loader.extract_frame_timestamps()
+    fast_timestamps = loader.extract_frame_timestamps_fast()
+    loader.close()
+    
+    assert len(timestamps) > 0
+    assert len(fast_timestamps) == len(timestamps)
+    np.testing.assert_allclose(fast_timestamps, timestamps, rtol=0, atol=1e-6)
+
 if __name__ == "__main__":
     test_video_loader()
+    test_fast_timestamps_match_decoded_timestamps()
@@ -0,0 +1,71 @@
+import sys
+import os
+import shutil
+import cv2
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import src.video_writer as video_writer
+from src.video_writer import FFmpegPipeWriter, PyAVWriter, open_video_writer
+
+WIDTH, HEIGHT, FPS, N_FRAMES = 320, 240, 30.0, 20
+
+def write_frames(writer):
+    # A moving bright square, so encoders cannot collapse the clip to one frame
+    for i in range(N_FRAMES):
+        frame = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        frame[40:80, 10 * i:10 * i + 40] = (0, 200, 255)
+        writer.write(frame)
+    writer.release()
+
+def read_back(path):
+    """Returns (frame count, (width, height)) of a video file, counted by decoding."""
+    cap = cv2.VideoCapture(path)
+    assert cap.isOpened()
+    count = 0
+    size = None
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        size = (frame.shape[1], frame.shape[0])
+        count += 1
+    cap.release()
+    return count, size
+
+def test_open_video_writer_round_trip(tmp_path):
+    path = str(tmp_path / "out.mp4")
+    write_frames(open_video_writer(path, FPS, WIDTH, HEIGHT))
+
+    assert read_back(path) == (N_FRAMES, (WIDTH, HEIGHT))
+
+@pytest.mark.skipif(video_writer.av is None, reason="PyAV not installed")
+def test_pyav_writer_raises_without_usable_encoder(tmp_path, monkeypatch):
+    monkeypatch.setattr(video_writer, '_probe_encoder', lambda *args: False)
+    with pytest.raises(RuntimeError):
+        PyAVWriter(str(tmp_path / "out.mp4"), FPS, WIDTH, HEIGHT)
+
+def test_open_video_writer_falls_back_when_probe_fails(tmp_path, monkeypatch):
+    # No PyAV encoder and no ffmpeg on PATH: the cv2 mp4v writer is the last resort
+    monkeypatch.setattr(video_writer, '_probe_encoder', lambda *args: False)
+    monkeypatch.setattr(video_writer.shutil, 'which', lambda name: None)
+    path = str(tmp_path / "out.mp4")
+
+    writer = open_video_writer(path, FPS, WIDTH, HEIGHT)
+    assert isinstance(writer, cv2.VideoWriter)
+    write_frames(writer)
+
+    assert read_back(path) == (N_FRAMES, (WIDTH, HEIGHT))
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="ffmpeg not on PATH")
+def test_ffmpeg_pipe_writer_round_trip(tmp_path):
+    path = str(tmp_path / "out.mp4")
+    write_frames(FFmpegPipeWriter(path, FPS, WIDTH, HEIGHT, ffmpeg_path=shutil.which('ffmpeg')))
+
+    assert read_back(path) == (N_FRAMES, (WIDTH, HEIGHT))
+
+if __name__ == "__main__":
+    pytest.main([__file__])
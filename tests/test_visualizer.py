@@ -0,0 +1,154 @@
+import sys
+import os
+import unittest
+import numpy as np
+from scipy.spatial.transform import Rotation as R
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.visualizer import Visualizer, _euler_xyz_deg_to_quat, _quat_rotate, _quat_rotate_point, _quat_to_matrix
+
+class TestVisualizer(unittest.TestCase):
+    def setUp(self):
+        self.visualizer = Visualizer(width=640, height=480, fov_deg=90)
+        self.camera_pose = {'position': [0.0, 0.0, 0.0], 'rotation': [0.0, 0.0, 0.0, 1.0]}
+
+    def test_apply_offset_uses_current_calibration(self):
+        pose = {'position': [0.1, 0.2, 0.3], 'rotation': R.from_euler('y', 30, degrees=True).as_quat()}
+        self.visualizer.set_calibration(offset_pos=[0.01, 0.0, -0.02], offset_rot_euler=[5, 10, 15])
+
+        res = self.visualizer.apply_offset(pose)
+
+        expected_rot = R.from_euler('xyz', [5, 10, 15], degrees=True) * R.from_quat(pose['rotation'])
+        np.testing.assert_array_almost_equal(res['position'], [0.11, 0.2, 0.28])
+        self.assertAlmostEqual(abs(np.dot(res['rotation'], expected_rot.as_quat())), 1.0)
+
+        # Batched form returns matrices
+        pos_batch, rot_batch = self.visualizer.apply_offsets([pose['position']], [pose['rotation']])
+        np.testing.assert_array_almost_equal(pos_batch[0], res['position'])
+        np.testing.assert_array_almost_equal(rot_batch[0], expected_rot.as_matrix())
+
+        # A later update must not reuse the stale rotation
+        self.visualizer.set_calibration(offset_rot_euler=[0, 0, 0])
+        res = self.visualizer.apply_offset(pose)
+        self.assertAlmostEqual(abs(np.dot(res['rotation'], pose['rotation'])), 1.0)
+
+    def test_project_point_center_and_culling(self):
+        # Straight ahead projects to the principal point
+        uv = self.visualizer.project_point([0.0, 0.0, 1.0], self.camera_pose)
+        self.assertEqual(uv, (320, 240))
+
+        # +Y is up in world space, so it lands above the center in the image
+        u, v = self.visualizer.project_point([0.0, 0.1, 1.0], self.camera_pose)
+        self.assertEqual(u, 320)
+        self.assertLess(v, 240)
+
+        # Behind the camera and out of bounds are rejected
+        self.assertIsNone(self.visualizer.project_point([0.0, 0.0, -1.0], self.camera_pose))
+        self.assertIsNone(self.visualizer.project_point([5.0, 0.0, 1.0], self.camera_pose))
+        self.assertIsNotNone(self.visualizer.project_point([5.0, 0.0, 1.0], self.camera_pose, check_bounds=False))
+
+    def test_fov_change_updates_intrinsics(self):
+        f_before = self.visualizer.K[0, 0]
+        self.visualizer.set_calibration(fov_deg=60)
+        self.assertGreater(self.visualizer.K[0, 0], f_before)
+        self.assertAlmostEqual(self.visualizer.K[0, 0], 320 / np.tan(np.radians(30)))
+
+    def test_project_gizmos_matches_scalar_projection(self):
+        self.visualizer.set_calibration(offset_pos=[0.01, 0.0, -0.02], offset_rot_euler=[5, 10, 15])
+        positions = np.array([[0.0, 0.0, 1.0], [0.2, -0.1, 0.8], [0.0, 0.0, -1.0]])
+        rotations = R.from_euler('xyz', [[0, 0, 0], [20, -30, 45], [0, 90, 0]], degrees=True).as_quat()
+        cam_pos = np.zeros((3, 3))
+        cam_rot = np.tile([0.0, 0.0, 0.0, 1.0], (3, 1))
+        
+        origins, origin_visible, axis_ends, axis_visible = self.visualizer.project_gizmos(
+            positions, rotations, cam_pos, cam_rot)
+        
+        for i in range(3):
+            pose = self.visualizer.apply_offset({'position': positions[i], 'rotation': rotations[i]})
+            expected = self.visualizer.project_point(pose['position'], self.camera_pose)
+            self.assertEqual(origin_visible[i], expected is not None)
+            if expected is not None:
+                self.assertEqual(tuple(origins[i]), expected)
+            
+            rot = R.from_quat(pose['rotation'])
+            for k in range(3):
+                axis = np.zeros(3)
+                axis[k] = 0.1
+                expected = self.visualizer.project_point(np.array(pose['position']) + rot.apply(axis), self.camera_pose)
+                self.assertEqual(axis_visible[i, k], expected is not None)
+                if expected is not None:
+                    self.assertEqual(tuple(axis_ends[i, k]), expected)
+
+    def test_project_points_from_camera_matches_project_point(self):
+        camera_pose = {'position': [0.05, -0.02, 0.1], 'rotation': R.from_euler('xyz', [10, -15, 5], degrees=True).as_quat()}
+        points = np.array([[0.0, 0.0, 1.0], [0.2, -0.1, 0.8], [0.0, 0.0, -1.0], [5.0, 0.0, 1.0]])
+        
+        self.visualizer.set_camera(camera_pose)
+        uv, visible = self.visualizer.project_points_from_camera(points)
+        
+        for i, point in enumerate(points):
+            expected = self.visualizer.project_point(point, camera_pose)
+            self.assertEqual(visible[i], expected is not None)
+            if expected is not None:
+                self.assertEqual(tuple(uv[i]), expected)
+        
+        # A new camera pose replaces the cached transform
+        self.visualizer.set_camera(self.camera_pose)
+        uv, visible = self.visualizer.project_points_from_camera(points[:1])
+        self.assertEqual(tuple(uv[0]), (320, 240))
+
+    def test_projected_hand_point_matches_draw_hand_point(self):
+        self.visualizer.set_calibration(offset_pos=[0.01, 0.0, -0.02])
+        positions = np.array([[0.0, 0.0, 1.0], [0.2, -0.1, 0.8], [0.0, 0.0, -1.0]])
+        cam_pos = np.zeros((3, 3))
+        cam_rot = np.tile([0.0, 0.0, 0.0, 1.0], (3, 1))
+        
+        uv, visible = self.visualizer.project_hand_points(positions, cam_pos, cam_rot)
+        np.testing.assert_array_equal(visible, [True, True, False])
+        
+        for i in range(2):
+            expected = np.zeros((480, 640, 3), dtype=np.uint8)
+            self.visualizer.draw_hand_point(expected, {'position': positions[i], 'rotation': [0, 0, 0, 1]},
+                                            self.camera_pose, (0, 255, 255), label="SYNCED")
+            img = np.zeros_like(expected)
+            self.visualizer.draw_projected_hand_point(img, uv[i], (0, 255, 255), label="SYNCED")
+            np.testing.assert_array_equal(img, expected)
+
+    def test_quat_rotate_matches_scipy(self):
+        # Includes non-unit quaternions, which from_quat normalizes
+        quats = R.random(20, random_state=4).as_quat() * np.linspace(0.5, 2.0, 20)[:, None]
+        vectors = np.random.default_rng(4).normal(size=(20, 3))
+        np.testing.assert_allclose(_quat_rotate(quats, vectors), R.from_quat(quats).apply(vectors), atol=1e-12)
+        np.testing.assert_allclose(_quat_rotate(quats, vectors, inverse=True), R.from_quat(quats).inv().apply(vectors), atol=1e-12)
+        np.testing.assert_allclose(_quat_rotate_point(quats[0], vectors[0], inverse=True),
+                                   R.from_quat(quats[0]).inv().apply(vectors[0]), atol=1e-12)
+
+    def test_euler_quat_matches_scipy(self):
+        angles = np.vstack([[0, 0, 0], [5, 10, 15], [180, 0, 0], [0, -90, 0],
+                            np.random.default_rng(5).uniform(-180, 180, (20, 3))])
+        for euler in angles:
+            expected = R.from_euler('xyz', euler, degrees=True)
+            q = _euler_xyz_deg_to_quat(*euler)
+            np.testing.assert_array_equal(q, expected.as_quat())
+            np.testing.assert_array_equal(_quat_to_matrix(q), expected.as_matrix())
+    
+    def test_info_panel_reuses_text_until_refresh(self):
+        background = np.full((480, 640, 3), 90, dtype=np.uint8)
+        values = (1000.0, 1000.01, 1000.0, 0.01, 0.02)
+        
+        first = background.copy()
+        self.visualizer.draw_info_panel(first, 1, 100, *values)
+        
+        # Stale text is kept when not refreshing, whatever the new values are
+        cached = background.copy()
+        self.visualizer.draw_info_panel(cached, 2, 100, 2000.0, 2000.5, 2000.0, 0.5, 0.3, refresh=False)
+        np.testing.assert_array_equal(cached, first)
+        
+        refreshed = background.copy()
+        self.visualizer.draw_info_panel(refreshed, 2, 100, 2000.0, 2000.5, 2000.0, 0.5, 0.3)
+        self.assertTrue(np.any(refreshed != first))
+
+if __name__ == '__main__':
+    unittest.main()